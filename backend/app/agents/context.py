@@ -0,0 +1,78 @@
+"""
+AI 케어브릿지 - 에이전트 프롬프트 컨텍스트 구성
+대화 요약 + 최근 대화를 토큰 예산 안에서 잘라 LLM 입력을 만듭니다.
+"""
+from typing import List, Optional
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from app.config import settings
+from app.agents.state import AgentState
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (한국어는 대략 2글자당 1토큰, 토크나이저 없이 빠르게 계산)"""
+    return len(text) // 2 + 1
+
+
+def message_tokens(messages: List[BaseMessage]) -> int:
+    """메시지 목록의 추정 토큰 수"""
+    return sum(estimate_tokens(m.content) for m in messages if isinstance(m.content, str))
+
+
+def recent_history(
+    messages: List[BaseMessage],
+    max_turns: Optional[int] = None,
+    max_tokens: Optional[int] = None
+) -> List[BaseMessage]:
+    """
+    이번 턴 사용자 메시지 이전의 최근 대화를 예산 안에서 선택
+
+    Args:
+        messages: 상태의 전체 메시지 (마지막 사용자 메시지 포함)
+        max_turns: 최대 턴 수 (사용자+AI 한 쌍이 1턴)
+        max_tokens: 최대 추정 토큰 수
+
+    Returns:
+        시간순 최근 메시지 목록
+    """
+    max_turns = settings.CONTEXT_MAX_TURNS if max_turns is None else max_turns
+    max_tokens = settings.CONTEXT_MAX_TOKENS if max_tokens is None else max_tokens
+
+    # 이번 턴 사용자 메시지와 그 뒤(슈퍼바이저 인사 등)는 제외
+    end = len(messages)
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            end = i
+            break
+
+    selected: List[BaseMessage] = []
+    budget = max_tokens
+    for message in reversed(messages[:end]):
+        if not isinstance(message, (HumanMessage, AIMessage)) or not message.content:
+            continue
+        if len(selected) >= max_turns * 2:
+            break
+        cost = estimate_tokens(message.content)
+        if cost > budget:
+            break
+        budget -= cost
+        selected.append(message)
+
+    selected.reverse()
+    return selected
+
+
+def build_messages(state: AgentState, system_prompt: str, user_content: str) -> List[BaseMessage]:
+    """
+    시스템 프롬프트 + 요약 + 최근 대화 + 이번 질문으로 LLM 입력 구성
+
+    대화가 길어져도 요약과 최근 N턴만 들어가므로 프롬프트 크기가 일정하게 유지됩니다.
+    """
+    summary = state.get("summary")
+    if summary:
+        system_prompt = f"{system_prompt}\n\n## 이전 대화 요약\n{summary}"
+
+    return [
+        SystemMessage(content=system_prompt),
+        *recent_history(state.get("messages", [])),
+        HumanMessage(content=user_content)
+    ]
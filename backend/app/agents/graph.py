@@ -6,11 +6,13 @@ from typing import Literal
 import logging
 
 from app.agents.state import AgentState
-from app.agents.nodes.supervisor import supervisor_node
+from app.agents.instrumentation import instrument_node
+from app.agents.prefetch import supervisor_prefetch_node
 from app.agents.nodes.welfare import welfare_node
 from app.agents.nodes.companion import companion_node
 from app.agents.nodes.daily import daily_node
 from app.agents.nodes.memory import memory_load_node, memory_save_node
+from app.memory.checkpointer import checkpoint_manager
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +46,7 @@ def create_agent_graph() -> StateGraph:
        ↓
     [memory_load] - 사용자 프로필 로드
        ↓
-    [supervisor] - 의도 분류, 감정 분석
+    [supervisor] - 의도 분류, 감정 분석 (+ 복지 RAG 추측 검색 병렬 실행)
        ↓ (조건부 라우팅)
     ┌──────┼──────┐
     ↓      ↓      ↓
@@ -60,13 +62,13 @@ def create_agent_graph() -> StateGraph:
     # 그래프 초기화
     workflow = StateGraph(AgentState)
 
-    # === 노드 추가 ===
-    workflow.add_node("memory_load", memory_load_node)
-    workflow.add_node("supervisor", supervisor_node)
-    workflow.add_node("welfare", welfare_node)
-    workflow.add_node("companion", companion_node)
-    workflow.add_node("daily", daily_node)
-    workflow.add_node("memory_save", memory_save_node)
+    # === 노드 추가 (노드별 시간/토큰/오류 계측, /metrics로 노출) ===
+    workflow.add_node("memory_load", instrument_node("memory_load", memory_load_node, routed=False))
+    workflow.add_node("supervisor", instrument_node("supervisor", supervisor_prefetch_node, routed=False))
+    workflow.add_node("welfare", instrument_node("welfare", welfare_node))
+    workflow.add_node("companion", instrument_node("companion", companion_node))
+    workflow.add_node("daily", instrument_node("daily", daily_node))
+    workflow.add_node("memory_save", instrument_node("memory_save", memory_save_node))
 
     # === 엣지 정의 ===
 
@@ -104,7 +106,7 @@ def compile_graph(checkpointer=None):
     그래프 컴파일
 
     Args:
-        checkpointer: Redis 체크포인터 (선택적)
+        checkpointer: 체크포인터 (SQLite/Redis/메모리, 선택적)
 
     Returns:
         컴파일된 그래프
@@ -112,12 +114,32 @@ def compile_graph(checkpointer=None):
     workflow = create_agent_graph()
 
     if checkpointer:
-        # Redis 체크포인터로 상태 영속화
+        # 체크포인터로 세션(thread_id)별 상태 영속화
         return workflow.compile(checkpointer=checkpointer)
     else:
         # 체크포인터 없이 컴파일 (개발용)
         return workflow.compile()
 
 
-# 기본 그래프 인스턴스
-agent_graph = compile_graph()
+_agent_graph = None
+_agent_graph_saver = None
+
+
+def get_agent_graph():
+    """
+    컴파일된 그래프 반환
+
+    lifespan에서 체크포인터가 준비되면 해당 체크포인터로 한 번만 다시 컴파일합니다.
+    """
+    global _agent_graph, _agent_graph_saver
+
+    saver = checkpoint_manager.saver
+    if _agent_graph is None or saver is not _agent_graph_saver:
+        _agent_graph = compile_graph(saver)
+        _agent_graph_saver = saver
+    return _agent_graph
+
+
+def thread_config(session_id: str) -> dict:
+    """세션 ID를 체크포인트 thread_id로 사용하는 실행 설정"""
+    return {"configurable": {"thread_id": session_id}}
@@ -0,0 +1,172 @@
+"""
+AI 케어브릿지 - LangGraph 노드 계측
+노드별 실행 시간, LLM 토큰/오류, 라우팅 결과를 Prometheus 지표로 기록합니다.
+"""
+import asyncio
+import functools
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.tracers.context import register_configure_hook
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+
+from app.agents.state import AgentState
+from app.config import settings
+
+# 라우팅 전에 실행되는 노드의 intent 레이블 (체크포인트에 남은 이전 턴 의도를 쓰지 않음)
+UNROUTED = "unrouted"
+
+NODE_DURATION = Histogram(
+    "carebridge_node_duration_seconds",
+    "LangGraph 노드 실행 시간",
+    ["node", "intent", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+NODE_TOKENS = Histogram(
+    "carebridge_node_llm_tokens",
+    "노드 1회 실행당 LLM 토큰 수 (kind: prompt, completion)",
+    ["node", "intent", "kind"],
+    buckets=(32, 64, 128, 256, 512, 1024, 2048, 4096, 8192)
+)
+NODE_LLM_CALLS = Counter(
+    "carebridge_node_llm_calls_total",
+    "노드에서 호출한 LLM 요청 수",
+    ["node", "intent"]
+)
+NODE_ERRORS = Counter(
+    "carebridge_node_errors_total",
+    "노드 오류 수 (source: node - 노드 예외, llm - 노드가 처리한 LLM 오류 포함)",
+    ["node", "intent", "source", "error"]
+)
+ROUTES = Counter(
+    "carebridge_route_total",
+    "슈퍼바이저 라우팅 결과",
+    ["intent"]
+)
+
+
+class NodeUsage(BaseCallbackHandler):
+    """노드 한 번 실행 동안의 LLM 사용량 집계
+
+    instrument_node가 컨텍스트 변수에 넣어 두면 노드 안의 모든 LLM 호출 콜백에
+    자동으로 붙으므로 노드 코드를 바꾸지 않아도 됩니다.
+    """
+
+    # 이벤트 루프에서 바로 실행 (스레드 풀로 넘기지 않음)
+    run_inline = True
+
+    def __init__(self):
+        self.calls = 0
+        self.usage_reported = 0         # 사용량이 함께 온 호출 수
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.errors: list = []          # 노드 안에서 처리된 LLM 오류 포함
+        self.node_error: Optional[str] = None
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        self.calls += 1
+        usage = _token_usage(response)
+        if usage is None:
+            return
+        self.usage_reported += 1
+        self.prompt_tokens += usage[0]
+        self.completion_tokens += usage[1]
+
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        self.calls += 1
+        self.errors.append(type(error).__name__)
+
+
+def _token_usage(response: LLMResult) -> Optional[tuple]:
+    """(prompt, completion) 토큰 수 - 메시지 usage_metadata 우선, 없으면 llm_output (둘 다 없으면 None)"""
+    prompt = completion = 0
+    found = False
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                found = True
+                prompt += usage.get("input_tokens", 0)
+                completion += usage.get("output_tokens", 0)
+    if found:
+        return prompt, completion
+    usage = (response.llm_output or {}).get("token_usage")
+    if not usage:
+        return None
+    return usage.get("prompt_tokens", 0) or 0, usage.get("completion_tokens", 0) or 0
+
+
+_node_usage: ContextVar[Optional[NodeUsage]] = ContextVar("carebridge_node_usage", default=None)
+register_configure_hook(_node_usage, inheritable=True)
+
+
+def _intent_of(state: AgentState, result: Any, routed: bool) -> str:
+    if isinstance(result, dict) and result.get("current_agent"):
+        return result["current_agent"]
+    if routed:
+        return state.get("current_agent") or UNROUTED
+    return UNROUTED
+
+
+def instrument_node(
+    name: str,
+    node: Callable[[AgentState], Awaitable[AgentState]],
+    routed: bool = True
+) -> Callable[[AgentState], Awaitable[AgentState]]:
+    """
+    노드 계측 래퍼
+
+    Args:
+        name: 그래프에 등록하는 노드 이름 (node 레이블)
+        node: 비동기 노드 함수
+        routed: False면 라우팅 전 노드 - 상태의 current_agent 대신 노드 결과로만 intent 결정
+    """
+    if not settings.METRICS_ENABLED:
+        return node
+
+    @functools.wraps(node)
+    async def wrapper(state: AgentState) -> AgentState:
+        usage = NodeUsage()
+        token = _node_usage.set(usage)
+        started = time.perf_counter()
+        result = None
+        status = "ok"
+        try:
+            result = await node(state)
+            return result
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        except Exception as e:
+            status = "error"
+            usage.node_error = type(e).__name__
+            raise
+        finally:
+            _node_usage.reset(token)
+            _record(name, _intent_of(state, result, routed), status, time.perf_counter() - started, usage, result)
+
+    return wrapper
+
+
+def _record(name: str, intent: str, status: str, elapsed: float, usage: NodeUsage, result: Any) -> None:
+    NODE_DURATION.labels(name, intent, status).observe(elapsed)
+    if usage.calls:
+        NODE_LLM_CALLS.labels(name, intent).inc(usage.calls)
+    # 사용량이 오지 않은 호출을 0토큰으로 세면 분포가 0쪽으로 치우침
+    if usage.usage_reported:
+        NODE_TOKENS.labels(name, intent, "prompt").observe(usage.prompt_tokens)
+        NODE_TOKENS.labels(name, intent, "completion").observe(usage.completion_tokens)
+    for error in usage.errors:
+        NODE_ERRORS.labels(name, intent, "llm", error).inc()
+    if usage.node_error:
+        NODE_ERRORS.labels(name, intent, "node", usage.node_error).inc()
+    if isinstance(result, dict) and result.get("current_agent"):
+        ROUTES.labels(result["current_agent"]).inc()
+
+
+def render_metrics() -> tuple:
+    """Prometheus 텍스트 형식 (본문, Content-Type)"""
+    return generate_latest(), CONTENT_TYPE_LATEST
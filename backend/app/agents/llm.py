@@ -0,0 +1,57 @@
+"""
+AI 케어브릿지 - 공유 LLM 클라이언트 팩토리
+노드마다 ChatUpstage를 새로 만들지 않고 (모델, temperature, 역할)별로 재사용합니다.
+"""
+from typing import Dict, Optional, Tuple
+from langchain_upstage import ChatUpstage
+from app.config import settings
+from app.services.http_clients import http_clients
+import logging
+
+logger = logging.getLogger(__name__)
+
+_llm_cache: Dict[Tuple[str, Optional[float], str], ChatUpstage] = {}
+
+
+def _model_for(role: str) -> str:
+    """역할별 모델명 (설정이 비어 있으면 기본 모델)"""
+    overrides = {
+        "supervisor": settings.SUPERVISOR_MODEL,
+        "welfare": settings.WELFARE_MODEL,
+        "companion": settings.COMPANION_MODEL,
+        "daily": settings.DAILY_MODEL,
+        "summary": settings.SUMMARY_MODEL,
+    }
+    return overrides.get(role) or settings.UPSTAGE_MODEL
+
+
+def get_llm(role: str = "default", temperature: Optional[float] = None) -> ChatUpstage:
+    """역할별 공유 LLM 인스턴스 반환
+
+    모든 인스턴스는 Upstage용 공유 httpx 커넥션 풀을 사용하므로
+    한 턴에 여러 노드가 호출해도 연결을 새로 열지 않습니다.
+
+    Args:
+        role: 호출 노드 (supervisor, welfare, companion, daily 등)
+        temperature: 지정 시 해당 값으로 생성 (None이면 모델 기본값)
+    """
+    model = _model_for(role)
+    key = (model, temperature, role)
+
+    llm = _llm_cache.get(key)
+    if llm is None or llm.http_async_client is None or llm.http_async_client.is_closed:
+        kwargs = {}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        llm = ChatUpstage(
+            api_key=settings.UPSTAGE_API_KEY,
+            model=model,
+            http_async_client=http_clients.get("upstage"),
+            # 스트리밍(astream_events) 중에도 토큰 사용량을 받아 /metrics에 기록
+            stream_usage=True,
+            **kwargs
+        )
+        _llm_cache[key] = llm
+        logger.info(f"LLM 클라이언트 생성 - Role: {role}, Model: {model}")
+
+    return llm
@@ -2,11 +2,12 @@
 AI 케어브릿지 - 정서 케어 에이전트 노드
 따뜻한 대화와 정서적 지지를 담당합니다.
 """
-from langchain_upstage import ChatUpstage
-from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
-from app.agents.state import AgentState
+from langchain_core.messages import AIMessage
+from app.agents.state import AgentState, get_last_user_message
 from app.agents.prompts.companion import COMPANION_SYSTEM_PROMPT
-from app.config import settings
+from app.agents.llm import get_llm
+from app.agents.context import build_messages
+from app.memory.long_term import long_term_memory
 import logging
 import re
 
@@ -38,14 +39,6 @@ def _clean_response(text: str) -> str:
     return text.strip()
 
 
-def _get_llm():
-    """LLM 인스턴스 생성"""
-    return ChatUpstage(
-        api_key=settings.UPSTAGE_API_KEY,
-        model=settings.UPSTAGE_MODEL
-    )
-
-
 async def companion_node(state: AgentState) -> AgentState:
     """
     정서 케어 에이전트 노드
@@ -67,9 +60,9 @@ async def companion_node(state: AgentState) -> AgentState:
     emotion_analysis = state.get("emotion_analysis", {})
 
     if not messages:
-        return state
+        return {}
 
-    last_message = messages[-1].content if messages else ""
+    last_message = get_last_user_message(messages)
 
     # 사용자 정보 추출
     user_name = user_profile.get("name", "어르신") if user_profile else "어르신"
@@ -83,12 +76,16 @@ async def companion_node(state: AgentState) -> AgentState:
     if emotion_analysis:
         emotion_str = f"{emotion_analysis.get('primary', '중립')} (위험도: {emotion_analysis.get('risk_level', 0)})"
 
+    # 장기 기억에서 이번 발화와 관련된 내용 (시간 제한 초과 시 생략)
+    memories = await long_term_memory.recall(state.get("user_id", ""), last_message)
+    interests = " / ".join(memories) if memories else "정보 없음"
+
     # 시스템 프롬프트 구성
     system_prompt = COMPANION_SYSTEM_PROMPT.format(
         user_name=user_name,
         family_info=family_info or "정보 없음",
         recent_emotion=emotion_str,
-        interests="정보 없음"  # TODO: 장기 기억에서 가져오기
+        interests=interests
     )
 
     # 메타 정보 금지 지시 추가
@@ -102,7 +99,7 @@ async def companion_node(state: AgentState) -> AgentState:
 오직 어르신께 드리는 대화 내용만 작성하세요."""
 
     try:
-        llm = _get_llm()
+        llm = get_llm("companion")
 
         # 위기 상황 체크
         risk_level = emotion_analysis.get("risk_level", 0) if emotion_analysis else 0
@@ -122,34 +119,26 @@ async def companion_node(state: AgentState) -> AgentState:
 
 응답은 2-3문장으로 짧고 따뜻하게.{no_meta_instruction}
 """
-            response = await llm.ainvoke([
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=crisis_prompt)
-            ])
+            response = await llm.ainvoke(build_messages(state, system_prompt, crisis_prompt))
 
             # TODO: 보호자 알림 전송
             logger.warning(f"위기 상황 감지! User: {state.get('user_id')}, Risk Level: {risk_level}")
 
         else:
             # 일반 대화
-            response = await llm.ainvoke([
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=f"""사용자 발화: "{last_message}"
+            response = await llm.ainvoke(build_messages(state, system_prompt, f"""사용자 발화: "{last_message}"
 
 위 정보를 바탕으로 따뜻하고 공감적인 응답을 해주세요.
 응답은 2-3문장 이내로 짧게, 자연스러운 대화체로 작성하세요.
-마지막에 질문을 넣어 대화를 이어가세요.{no_meta_instruction}""")
-            ])
+마지막에 질문을 넣어 대화를 이어가세요.{no_meta_instruction}"""))
 
         # 응답 메시지 추가 (메타 정보 제거)
         cleaned_response = _clean_response(response.content)
-        new_messages = list(messages)
-        new_messages.append(AIMessage(content=cleaned_response))
+        new_messages = [AIMessage(content=cleaned_response)]
 
         logger.info(f"정서 케어 에이전트 응답 생성 완료 - Emotion: {emotion_str}")
 
         return {
-            **state,
             "messages": new_messages
         }
 
@@ -158,11 +147,9 @@ async def companion_node(state: AgentState) -> AgentState:
 
         # 오류 시 기본 응답
         error_response = f"{user_name}, 잠시 생각이 깊어졌어요. 다시 한번 말씀해 주시겠어요?"
-        new_messages = list(messages)
-        new_messages.append(AIMessage(content=error_response))
+        new_messages = [AIMessage(content=error_response)]
 
         return {
-            **state,
             "messages": new_messages,
             "error": str(e)
         }
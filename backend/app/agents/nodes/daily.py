@@ -2,23 +2,15 @@
 AI 케어브릿지 - 생활 정보 에이전트 노드
 날씨, 뉴스, 일정, 병원 예약 등 생활 정보를 담당합니다.
 """
-from langchain_upstage import ChatUpstage
-from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
-from app.agents.state import AgentState
-from app.config import settings
+from langchain_core.messages import AIMessage
+from app.agents.state import AgentState, get_last_user_message
+from app.agents.llm import get_llm
+from app.agents.context import build_messages
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def _get_llm():
-    """LLM 인스턴스 생성"""
-    return ChatUpstage(
-        api_key=settings.UPSTAGE_API_KEY,
-        model=settings.UPSTAGE_MODEL
-    )
-
-
 DAILY_SYSTEM_PROMPT = """당신은 AI 케어브릿지의 생활 도우미입니다.
 시니어 사용자에게 날씨, 뉴스, 일정, 병원 예약 등 생활 정보를 안내합니다.
 
@@ -64,9 +56,9 @@ async def daily_node(state: AgentState) -> AgentState:
     user_profile = state.get("user_profile", {})
 
     if not messages:
-        return state
+        return {}
 
-    last_message = messages[-1].content if messages else ""
+    last_message = get_last_user_message(messages)
 
     # 사용자 정보 추출
     user_name = user_profile.get("name", "어르신") if user_profile else "어르신"
@@ -96,26 +88,21 @@ async def daily_node(state: AgentState) -> AgentState:
     )
 
     try:
-        llm = _get_llm()
+        llm = get_llm("daily")
 
         # LLM 호출
-        response = await llm.ainvoke([
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=f"""사용자 질문: "{last_message}"
+        response = await llm.ainvoke(build_messages(state, system_prompt, f"""사용자 질문: "{last_message}"
 
 위 정보를 바탕으로 친절하게 답변해주세요.
 필요한 정보가 없으면 "확인 후 알려드릴게요"라고 답변하세요.
-응답은 간단명료하게 2-3문장으로.""")
-        ])
+응답은 간단명료하게 2-3문장으로."""))
 
         # 응답 메시지 추가
-        new_messages = list(messages)
-        new_messages.append(AIMessage(content=response.content))
+        new_messages = [AIMessage(content=response.content)]
 
         logger.info(f"생활 정보 에이전트 응답 생성 완료 - Query: {last_message[:30]}...")
 
         return {
-            **state,
             "messages": new_messages
         }
 
@@ -124,11 +111,9 @@ async def daily_node(state: AgentState) -> AgentState:
 
         # 오류 시 기본 응답
         error_response = f"{user_name}, 지금 정보를 가져오는 데 문제가 생겼어요. 잠시 후 다시 물어봐 주시겠어요?"
-        new_messages = list(messages)
-        new_messages.append(AIMessage(content=error_response))
+        new_messages = [AIMessage(content=error_response)]
 
         return {
-            **state,
             "messages": new_messages,
             "error": str(e)
         }
@@ -2,34 +2,26 @@
 AI 케어브릿지 - 기억 관리 노드
 사용자 프로필 로드 및 대화 기록 저장을 담당합니다.
 """
-from app.agents.state import AgentState, UserProfileData
+from typing import List
+from langchain_core.messages import BaseMessage, HumanMessage, RemoveMessage
+from app.config import settings
+from app.agents.state import AgentState, UserProfileData, EmotionData, get_last_user_message
+from app.memory.conversation_log import conversation_log
+from app.memory.summarizer import conversation_summarizer
+from app.memory.long_term import long_term_memory
+from app.memory.profile_store import USER_PROFILES, profile_repository
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
-# 임시 사용자 저장소 (추후 Redis로 교체)
-USER_PROFILES = {
-    "user_001": UserProfileData(
-        user_id="user_001",
-        name="김순자",
-        age=75,
-        address="서울 강북구",
-        health_conditions=["고혈압", "당뇨", "무릎 관절염"],
-        is_basic_pension=True,
-        family_members=[
-            {"relation": "아들", "name": "민수"},
-            {"relation": "손녀", "name": "지은"}
-        ]
-    )
-}
-
 
 async def memory_load_node(state: AgentState) -> AgentState:
     """
     기억 로드 노드
 
     역할:
-    1. 사용자 프로필 로드 (Redis/DB)
+    1. 사용자 프로필 로드 (프로필 저장소)
     2. 이전 대화 컨텍스트 복원
     3. 장기 기억 정보 가져오기
 
@@ -41,43 +33,77 @@ async def memory_load_node(state: AgentState) -> AgentState:
     """
     user_id = state.get("user_id", "")
 
+    # 체크포인터에 바로 반영하지 못한 지난 턴의 요약 반영 (요약된 메시지는 상태에서 삭제)
+    updates = {}
+    folded = conversation_summarizer.take(state.get("session_id", ""))
+    if folded:
+        summary, folded_ids = folded
+        existing = {m.id for m in state.get("messages", [])}
+        updates["summary"] = summary
+        updates["messages"] = [RemoveMessage(id=mid) for mid in folded_ids if mid in existing]
+
     if not user_id:
         logger.warning("기억 로드: user_id가 비어있습니다")
-        return state
+        return updates
 
     try:
-        # TODO: Redis에서 사용자 프로필 로드
-        # from app.memory.redis_store import get_user_profile
-        # user_profile = await get_user_profile(user_id)
-
-        # 임시: 메모리에서 로드
-        user_profile = USER_PROFILES.get(user_id)
+        # 프로필 저장소에서 로드 (프로세스 캐시 → Redis)
+        user_profile = await profile_repository.get(user_id)
 
         if user_profile:
             logger.info(f"기억 로드 완료 - User: {user_id}, Name: {user_profile.get('name')}")
             return {
-                **state,
+                **updates,
                 "user_profile": user_profile
             }
         else:
             # 새 사용자
             logger.info(f"새 사용자 - User: {user_id}")
-            return state
+            return updates
 
     except Exception as e:
         logger.error(f"기억 로드 오류: {str(e)}")
         return {
-            **state,
+            **updates,
             "error": f"기억 로드 오류: {str(e)}"
         }
 
 
+def _turn_records(messages: List[BaseMessage], agent_type: str, emotion: EmotionData) -> List[dict]:
+    """마지막 사용자 메시지부터 이번 턴의 대화 로그 레코드 생성"""
+    start = None
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            start = i
+            break
+    if start is None:
+        return []
+
+    now = time.time()
+    records = [{
+        "id": messages[start].id,
+        "role": "user",
+        "content": messages[start].content,
+        "emotion": emotion,
+        "timestamp": now
+    }]
+    for message in messages[start + 1:]:
+        records.append({
+            "id": message.id,
+            "role": "assistant",
+            "content": message.content,
+            "agent_type": agent_type,
+            "timestamp": now
+        })
+    return records
+
+
 async def memory_save_node(state: AgentState) -> AgentState:
     """
     기억 저장 노드
 
     역할:
-    1. 대화 내용 저장 (Redis/DB)
+    1. 대화 내용 저장 (세션별 대화 로그)
     2. 감정 분석 결과 기록
     3. 중요 정보 장기 기억에 저장
 
@@ -85,7 +111,7 @@ async def memory_save_node(state: AgentState) -> AgentState:
         state: 현재 에이전트 상태
 
     Returns:
-        상태 (변경 없음)
+        오래된 메시지 삭제 (체크포인트 크기를 일정하게 유지)
     """
     user_id = state.get("user_id", "")
     session_id = state.get("session_id", "")
@@ -93,27 +119,35 @@ async def memory_save_node(state: AgentState) -> AgentState:
     emotion_analysis = state.get("emotion_analysis", {})
 
     try:
-        # TODO: Redis에 대화 기록 저장
-        # from app.memory.redis_store import save_conversation
-        # await save_conversation(user_id, session_id, messages)
+        # 이번 턴 대화를 로그에 기록 (백그라운드 배치 기록, 대기 없음)
+        if session_id:
+            conversation_log.append(
+                session_id,
+                _turn_records(messages, state.get("current_agent"), emotion_analysis)
+            )
 
         # 위험 상황 로그
         if emotion_analysis and emotion_analysis.get("risk_level", 0) >= 1:
             logger.warning(f"감정 위험 감지 기록 - User: {user_id}, Risk: {emotion_analysis.get('risk_level')}")
 
-        # 대화 요약 (긴 대화의 경우)
-        if len(messages) > 10:
-            # TODO: 대화 요약 생성 및 저장
-            pass
+        # 사용자 발화에서 가족/취미/건강/일정 정보를 장기 기억에 저장 (백그라운드)
+        long_term_memory.remember(user_id, get_last_user_message(messages))
+
+        # 대화 요약 (토큰 예산 초과 시 백그라운드에서 생성, 다음 턴에 반영)
+        if conversation_summarizer.maybe_schedule(session_id, messages, state.get("summary")):
+            logger.info(f"대화 요약 예약 - Session: {session_id}")
+
+        # 체크포인트에 누적되는 메시지 수 제한 (오래된 것부터 삭제)
+        overflow = len(messages) - settings.CHECKPOINT_MAX_MESSAGES
+        removals = [RemoveMessage(id=m.id) for m in messages[:overflow] if m.id] if overflow > 0 else []
 
-        logger.info(f"기억 저장 완료 - User: {user_id}, Session: {session_id}, Messages: {len(messages)}")
+        logger.info(f"기억 저장 완료 - User: {user_id}, Session: {session_id}, Messages: {len(messages) - len(removals)}")
 
-        return state
+        return {"messages": removals} if removals else {}
 
     except Exception as e:
         logger.error(f"기억 저장 오류: {str(e)}")
         return {
-            **state,
             "error": f"기억 저장 오류: {str(e)}"
         }
 
@@ -122,4 +156,5 @@ async def memory_save_node(state: AgentState) -> AgentState:
 def add_test_user(user_id: str, profile: UserProfileData):
     """테스트용 사용자 추가"""
     USER_PROFILES[user_id] = profile
+    profile_repository.cache.invalidate(user_id)
     logger.info(f"테스트 사용자 추가: {user_id}")
@@ -2,11 +2,11 @@
 AI 케어브릿지 - 슈퍼바이저 노드
 의도 분류 및 감정 분석을 담당합니다.
 """
-from langchain_upstage import ChatUpstage
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from app.agents.state import AgentState, EmotionData
+from app.agents.state import AgentState, EmotionData, get_last_user_message
 from app.agents.prompts.supervisor import SUPERVISOR_SYSTEM_PROMPT
-from app.config import settings
+from app.agents.llm import get_llm
+from app.agents.router import intent_router, analyze_emotion_local
 import json
 import re
 import logging
@@ -14,14 +14,6 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def _get_llm():
-    """LLM 인스턴스 생성"""
-    return ChatUpstage(
-        api_key=settings.UPSTAGE_API_KEY,
-        model=settings.UPSTAGE_MODEL
-    )
-
-
 def _extract_json(text: str) -> dict:
     """LLM 응답에서 JSON 추출"""
     # 마크다운 코드 블록에서 JSON 추출
@@ -52,13 +44,18 @@ def _keyword_fallback(message: str) -> str:
         return "daily"
 
     # 종료 키워드
-    end_keywords = ["잘가", "끝", "종료", "나중에"]
-    if any(kw in lower_msg for kw in end_keywords):
+    end_keywords = ["끝", "종료", "나중에"]
+    if any(kw in lower_msg for kw in end_keywords) or re.search(r"잘\s*가(요|세요|라|게)?[\s.!~]*$", lower_msg):
         return "end"
 
     return "companion"
 
 
+def _farewell(user_name: str) -> str:
+    """대화 종료 인사"""
+    return f"{user_name}, 오늘 이야기 나눠 주셔서 고마워요. 편히 쉬시고 또 이야기해요."
+
+
 def _build_user_context(profile: dict) -> str:
     """사용자 컨텍스트 문자열 생성"""
     if not profile:
@@ -88,14 +85,27 @@ async def supervisor_node(state: AgentState) -> AgentState:
     if not messages:
         logger.warning("슈퍼바이저: 메시지가 비어있습니다")
         return {
-            **state,
             "current_agent": "companion",
             "error": "메시지가 비어있습니다"
         }
 
-    last_message = messages[-1].content if messages else ""
+    last_message = get_last_user_message(messages)
     user_name = user_profile.get("name", "어르신") if user_profile else "어르신"
 
+    # 로컬 라우팅 (위기 감지 → 키워드 → 임베딩) - 확정되면 LLM 호출 생략
+    decision = await intent_router.route(last_message)
+    if decision:
+        logger.info(f"슈퍼바이저 로컬 분류 ({decision.tier}) - Intent: {decision.intent}, Conf: {decision.confidence}, Emotion: {decision.emotion['primary']}, Risk: {decision.emotion['risk_level']}")
+        result = {
+            "current_agent": decision.intent,
+            "emotion_analysis": decision.emotion
+        }
+        if decision.intent == "end":
+            # end는 응답 노드를 거치지 않으므로 여기서 작별 인사를 남김
+            result["messages"] = [AIMessage(content=_farewell(user_name))]
+        return result
+    local_risk = analyze_emotion_local(last_message)
+
     # 시스템 프롬프트 구성
     system_prompt = SUPERVISOR_SYSTEM_PROMPT.format(
         user_name=user_name,
@@ -103,7 +113,7 @@ async def supervisor_node(state: AgentState) -> AgentState:
     )
 
     try:
-        llm = _get_llm()
+        llm = get_llm("supervisor")
 
         # LLM 호출 (의도 분류 + 감정 분석)
         response = await llm.ainvoke([
@@ -128,18 +138,20 @@ intent: welfare(복지정보), companion(정서케어), daily(일상정보), end
         emotion_analysis: EmotionData = {
             "primary": emotion_data.get("primary", "neutral"),
             "confidence": emotion_data.get("confidence", 0.5),
-            "risk_level": emotion_data.get("risk_level", 0),
+            # 로컬 위험 감지 결과보다 낮게 판단하지 않음
+            "risk_level": max(emotion_data.get("risk_level", 0), local_risk["risk_level"]),
             "keywords": emotion_data.get("keywords", [])
         }
 
-        new_messages = list(messages)
+        new_messages = []
         if greeting:
             new_messages.append(AIMessage(content=greeting))
+        elif intent == "end":
+            new_messages.append(AIMessage(content=_farewell(user_name)))
 
         logger.info(f"슈퍼바이저 분류 결과 - Intent: {intent}, Emotion: {emotion_analysis['primary']}, Risk: {emotion_analysis['risk_level']}")
 
         return {
-            **state,
             "messages": new_messages,
             "current_agent": intent,
             "emotion_analysis": emotion_analysis
@@ -150,14 +162,14 @@ intent: welfare(복지정보), companion(정서케어), daily(일상정보), end
         fallback_intent = _keyword_fallback(last_message)
         logger.info(f"키워드 폴백 라우팅: {fallback_intent}")
         return {
-            **state,
             "current_agent": fallback_intent,
+            "emotion_analysis": local_risk,
             "error": f"JSON 파싱 오류, 키워드 폴백: {fallback_intent}"
         }
     except Exception as e:
         logger.error(f"슈퍼바이저 오류: {str(e)}")
         return {
-            **state,
             "current_agent": "companion",
+            "emotion_analysis": local_risk,
             "error": str(e)
         }
@@ -2,12 +2,12 @@
 AI 케어브릿지 - 복지 전문 에이전트 노드
 RAG 기반 복지 정보 검색 및 안내를 담당합니다.
 """
-from langchain_upstage import ChatUpstage
-from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
-from app.agents.state import AgentState
+from langchain_core.messages import AIMessage
+from app.agents.state import AgentState, get_last_user_message
 from app.agents.prompts.welfare import WELFARE_SYSTEM_PROMPT
 from app.services.rag import rag_service
-from app.config import settings
+from app.agents.llm import get_llm
+from app.agents.context import build_messages
 import logging
 import re
 
@@ -36,14 +36,6 @@ def _clean_response(text: str) -> str:
     return text.strip()
 
 
-def _get_llm():
-    """LLM 인스턴스 생성"""
-    return ChatUpstage(
-        api_key=settings.UPSTAGE_API_KEY,
-        model=settings.UPSTAGE_MODEL
-    )
-
-
 async def welfare_node(state: AgentState) -> AgentState:
     """
     복지 전문 에이전트 노드
@@ -65,9 +57,9 @@ async def welfare_node(state: AgentState) -> AgentState:
     retrieved_docs = state.get("retrieved_docs", [])
 
     if not messages:
-        return state
+        return {}
 
-    last_message = messages[-1].content if messages else ""
+    last_message = get_last_user_message(messages)
 
     # 사용자 정보 추출
     user_name = user_profile.get("name", "어르신") if user_profile else "어르신"
@@ -77,10 +69,14 @@ async def welfare_node(state: AgentState) -> AgentState:
     is_basic_pension = user_profile.get("is_basic_pension", False) if user_profile else False
     health_conditions = user_profile.get("health_conditions", []) if user_profile else []
 
-    # RAG 검색으로 관련 복지 정보 조회
+    # RAG 검색으로 관련 복지 정보 조회 (슈퍼바이저 단계에서 미리 검색했으면 재사용)
     try:
-        rag_context = await rag_service.get_context_for_llm(last_message, n_results=3)
-        logger.info(f"RAG 검색 완료: {last_message[:30]}...")
+        if retrieved_docs:
+            rag_context = retrieved_docs[0]
+            logger.info(f"RAG 추측 검색 결과 사용: {last_message[:30]}...")
+        else:
+            rag_context = await rag_service.get_context_for_llm(last_message, n_results=3)
+            logger.info(f"RAG 검색 완료: {last_message[:30]}...")
     except Exception as e:
         logger.warning(f"RAG 검색 실패, 기본 정보 사용: {e}")
         rag_context = """
@@ -112,23 +108,22 @@ async def welfare_node(state: AgentState) -> AgentState:
 오직 어르신께 안내드리는 복지 정보만 작성하세요."""
 
     try:
-        llm = _get_llm()
+        llm = get_llm("welfare")
 
         # LLM 호출
-        response = await llm.ainvoke([
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=f"사용자 질문: {last_message}{no_meta_instruction}")
-        ])
+        response = await llm.ainvoke(build_messages(
+            state,
+            system_prompt,
+            f"사용자 질문: {last_message}{no_meta_instruction}"
+        ))
 
         # 응답 메시지 추가 (메타 정보 제거)
         cleaned_response = _clean_response(response.content)
-        new_messages = list(messages)
-        new_messages.append(AIMessage(content=cleaned_response))
+        new_messages = [AIMessage(content=cleaned_response)]
 
         logger.info(f"복지 에이전트 응답 생성 완료 - Query: {last_message[:50]}...")
 
         return {
-            **state,
             "messages": new_messages,
             "retrieved_docs": [rag_context]
         }
@@ -138,11 +133,9 @@ async def welfare_node(state: AgentState) -> AgentState:
 
         # 오류 시 기본 응답
         error_response = f"{user_name}, 죄송해요. 지금 복지 정보를 찾는 데 문제가 생겼어요. 잠시 후 다시 물어봐 주시겠어요?"
-        new_messages = list(messages)
-        new_messages.append(AIMessage(content=error_response))
+        new_messages = [AIMessage(content=error_response)]
 
         return {
-            **state,
             "messages": new_messages,
             "error": str(e)
         }
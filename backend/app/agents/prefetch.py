@@ -0,0 +1,116 @@
+"""
+AI 케어브릿지 - 복지 RAG 추측 실행
+슈퍼바이저가 의도를 분류하는 동안 복지 검색을 미리 시작합니다.
+"""
+import asyncio
+import time
+from typing import Optional
+from app.config import settings
+from app.agents.state import AgentState
+from app.agents.nodes.supervisor import supervisor_node
+from app.services.rag import rag_service
+from app.utils.stats import RollingWindow
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RagPrefetcher:
+    """RAG 검색 추측 실행기
+
+    슈퍼바이저와 동시에 마지막 메시지로 RAG 검색을 시작하고,
+    welfare로 분류되면 결과를 retrieved_docs에 담아 넘기며 아니면 취소합니다.
+    """
+
+    def __init__(self):
+        self.started = 0
+        self.hits = 0            # welfare로 분류되어 결과 사용
+        self.cancelled = 0       # 다른 의도로 분류되어 진행 중에 취소
+        self.discarded = 0       # 다른 의도로 분류됐지만 이미 완료되어 버려짐
+        self.errors = 0
+        self.wasted_time = RollingWindow()   # 버려진 추측 작업의 실행 시간 (초)
+        self.wait_time = RollingWindow()     # 분류 후 검색 완료까지 추가로 기다린 시간 (초)
+        self.search_time = RollingWindow()   # 사용된 검색의 전체 실행 시간 (초)
+
+    async def _search(self, query: str) -> str:
+        return await rag_service.get_context_for_llm(query, n_results=3)
+
+    async def run(self, state: AgentState) -> AgentState:
+        """슈퍼바이저 실행과 RAG 추측 검색을 병렬로 수행"""
+        messages = state.get("messages", [])
+        query = messages[-1].content if messages else ""
+
+        if not settings.RAG_PREFETCH_ENABLED or not query:
+            result = await supervisor_node(state)
+            return {**result, "retrieved_docs": []}
+
+        self.started += 1
+        started_at = time.perf_counter()
+        task = asyncio.create_task(self._search(query))
+
+        try:
+            result = await supervisor_node(state)
+        except BaseException:
+            task.cancel()
+            raise
+
+        classified_at = time.perf_counter()
+
+        if result.get("current_agent") == "welfare":
+            context = await self._consume(task, classified_at, started_at)
+            return {**result, "retrieved_docs": [context] if context else []}
+
+        self._discard(task, started_at)
+        return {**result, "retrieved_docs": []}
+
+    async def _consume(self, task: asyncio.Task, classified_at: float, started_at: float) -> Optional[str]:
+        """추측 검색 결과 대기 (실패 시 None → welfare 노드가 직접 검색)"""
+        try:
+            context = await task
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"RAG 추측 검색 실패, 복지 노드에서 재검색: {e}")
+            return None
+
+        finished_at = time.perf_counter()
+        self.hits += 1
+        self.wait_time.add(finished_at - classified_at)
+        self.search_time.add(finished_at - started_at)
+        return context
+
+    def _discard(self, task: asyncio.Task, started_at: float) -> None:
+        """사용하지 않는 추측 검색 정리"""
+        self.wasted_time.add(time.perf_counter() - started_at)
+        if task.done():
+            self.discarded += 1
+            if not task.cancelled() and task.exception() is not None:
+                self.errors += 1
+        else:
+            self.cancelled += 1
+            task.cancel()
+
+    def stats(self) -> dict:
+        """추측 실행 적중률과 낭비된 작업량"""
+        wasted = self.cancelled + self.discarded
+        return {
+            "enabled": settings.RAG_PREFETCH_ENABLED,
+            "started": self.started,
+            "hits": self.hits,
+            "cancelled": self.cancelled,
+            "discarded": self.discarded,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / self.started, 4) if self.started else 0.0,
+            "waste_rate": round(wasted / self.started, 4) if self.started else 0.0,
+            "wasted_ms": self.wasted_time.summary(scale=1000.0),
+            "wait_after_route_ms": self.wait_time.summary(scale=1000.0),
+            "search_ms": self.search_time.summary(scale=1000.0)
+        }
+
+
+# 싱글톤 인스턴스
+rag_prefetcher = RagPrefetcher()
+
+
+async def supervisor_prefetch_node(state: AgentState) -> AgentState:
+    """슈퍼바이저 + RAG 추측 검색 노드"""
+    return await rag_prefetcher.run(state)
@@ -0,0 +1,341 @@
+"""
+AI 케어브릿지 - 계층형 의도 라우터
+위기 감지 → 키워드 → 임베딩 유사도 순으로 판단하고, 모두 애매할 때만 LLM을 호출합니다.
+"""
+import asyncio
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
+import numpy as np
+from app.config import settings
+from app.agents.state import EmotionData
+from app.services.embedding import embedding_service
+from app.services.inference import InferenceQueueFull
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# === 위기 감지 (항상 로컬에서 실행) ===
+# 위험(2): 자해/자살 암시 - LLM 판단을 기다리지 않고 바로 정서 케어로 연결
+CRISIS_PATTERNS = [
+    r"죽고\s*싶", r"살기\s*싫", r"살고\s*싶지\s*않", r"없어지고\s*싶", r"사라지고\s*싶",
+    r"자살", r"목숨을?\s*끊", r"삶을?\s*끝내", r"다\s*끝내고\s*싶", r"세상을?\s*떠나고\s*싶",
+    r"뛰어내리", r"유서", r"약을?\s*모아",
+]
+# 주의(1): 지속적인 부정적 감정 - 모니터링 대상
+CAUTION_PATTERNS = [
+    r"우울", r"잠을?\s*못\s*자", r"밥맛이?\s*없", r"희망이?\s*없", r"사는\s*게\s*의미",
+    r"아무도\s*없", r"나\s*같은\s*건", r"짐이\s*되",
+]
+
+# === 키워드 라우팅 (패턴, 가중치) ===
+# 가중치 1.0은 단독으로 의도를 확정할 수 있는 표현, 0.5는 보조 단서
+INTENT_PATTERNS: Dict[str, List[Tuple[str, float]]] = {
+    "welfare": [
+        (r"복지", 1.0), (r"기초\s*연금", 1.0), (r"연금", 1.0), (r"수당", 1.0), (r"보조금", 1.0),
+        (r"바우처", 1.0), (r"장기\s*요양", 1.0), (r"기초\s*생활", 1.0), (r"노인\s*일자리", 1.0),
+        (r"혜택", 1.0), (r"지원금", 1.0), (r"수급", 1.0), (r"주민\s*센터", 0.5),
+        (r"지원", 0.5), (r"신청", 0.5), (r"자격", 0.5),
+    ],
+    "daily": [
+        (r"날씨", 1.0), (r"기온", 1.0), (r"비\s*(와|오|온다|올까)", 1.0), (r"미세\s*먼지", 1.0),
+        (r"병원", 1.0), (r"약국", 1.0), (r"예약", 1.0), (r"뉴스", 1.0), (r"몇\s*시", 1.0),
+        (r"일정", 0.5), (r"시간", 0.5), (r"오늘\s*(무슨|며칠)", 0.5),
+    ],
+    "companion": [
+        (r"외로", 1.0), (r"쓸쓸", 1.0), (r"심심", 1.0), (r"보고\s*싶", 1.0), (r"적적", 1.0),
+        (r"속상", 1.0), (r"서운", 1.0), (r"걱정", 0.5), (r"슬퍼", 1.0), (r"기분", 0.5),
+        (r"옛날", 0.5), (r"손주", 0.5), (r"자식", 0.5),
+    ],
+    "end": [
+        # "잘 가르쳐 줘", "잘 가져와" 같은 요청과 구분되도록 발화 끝의 인사만 인정
+        (r"잘\s*가(요|세요|라|게)?[\s.!~]*$", 1.0), (r"안녕히\s*(계세요|가세요|계셔)", 1.0), (r"그만\s*(할게|하자|얘기)", 1.0), (r"종료", 1.0),
+        (r"다음에\s*(또|봐|얘기)", 1.0), (r"나중에\s*(봐|얘기)", 1.0), (r"^\s*끝\s*$", 1.0),
+    ],
+}
+
+# 정서 단서와 함께 나오면 로컬에서 확정하지 않는 업무 의도
+# ("어제 병원 다녀와서 좀 외로웠어"는 병원 얘기보다 외로움이 요점이므로 LLM이 판단)
+DOMAIN_INTENTS = ("welfare", "daily")
+EMOTIONAL_CUES = ("lonely", "sad", "angry")
+
+# === 감정 사전 (로컬 판단 시 감정 분석 대체) ===
+EMOTION_PATTERNS: Dict[str, List[str]] = {
+    "lonely": [r"외로", r"쓸쓸", r"혼자", r"적적", r"보고\s*싶", r"심심"],
+    "sad": [r"슬프", r"슬퍼", r"우울", r"눈물", r"속상", r"서운", r"힘들"],
+    "anxious": [r"걱정", r"불안", r"무서", r"두려", r"어떡하", r"아프"],
+    "angry": [r"화가", r"화나", r"짜증", r"억울", r"답답"],
+    "happy": [r"고마", r"감사", r"좋아", r"기뻐", r"행복", r"즐거"],
+}
+
+# === 임베딩 분류용 예시 발화 ===
+INTENT_EXEMPLARS: Dict[str, List[str]] = {
+    "welfare": [
+        "기초연금 신청하려면 어떻게 해야 하나요?",
+        "나 같은 노인이 받을 수 있는 지원이 뭐가 있어요?",
+        "혼자 사는 노인한테 나라에서 도와주는 거 있나?",
+        "병원비가 너무 많이 나오는데 도움받을 방법이 있을까요",
+        "틀니 할 때 돈 나오는 거 있어요?",
+        "동사무소 가면 뭘 받을 수 있어?",
+        "요양보호사 집으로 부르려면 어떻게 해요",
+        "일자리 같은 거 노인도 할 수 있는 게 있나요",
+    ],
+    "companion": [
+        "요즘 너무 외로워요",
+        "아들이 전화를 안 해서 서운하네",
+        "오늘 기분이 좀 울적해",
+        "옛날 생각이 자꾸 나네요",
+        "말동무가 있으면 좋겠어",
+        "손주가 보고 싶어요",
+        "그냥 얘기 좀 하고 싶어서",
+        "잘 지냈어? 오늘 뭐 했어",
+    ],
+    "daily": [
+        "오늘 날씨 어때요?",
+        "내일 비 온대?",
+        "근처에 문 연 약국 있나요",
+        "정형외과 예약 좀 해줘",
+        "오늘 무슨 요일이야?",
+        "요즘 뉴스 뭐 있어?",
+        "병원 가는 날이 언제였지",
+        "밖에 나가도 될 만큼 따뜻해?",
+    ],
+    "end": [
+        "이제 그만 얘기할게",
+        "다음에 또 얘기하자",
+        "잘 있어 나 이제 잘게",
+        "고마워 오늘은 여기까지",
+        "안녕히 계세요",
+    ],
+}
+
+
+def _compile(patterns: List[str]) -> Pattern:
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
+_CRISIS_RE = _compile(CRISIS_PATTERNS)
+_CAUTION_RE = _compile(CAUTION_PATTERNS)
+_INTENT_RES: Dict[str, List[Tuple[Pattern, float]]] = {
+    intent: [(re.compile(p), w) for p, w in patterns]
+    for intent, patterns in INTENT_PATTERNS.items()
+}
+_EMOTION_RES: Dict[str, Pattern] = {
+    emotion: _compile(patterns) for emotion, patterns in EMOTION_PATTERNS.items()
+}
+
+
+@dataclass
+class RouteDecision:
+    """라우팅 결과"""
+    intent: str
+    confidence: float
+    tier: str                       # risk, keyword, embedding
+    emotion: EmotionData = field(default_factory=dict)
+
+
+def detect_risk(message: str) -> Tuple[int, List[str]]:
+    """위험 수준과 감지된 표현 반환 (0: 정상, 1: 주의, 2: 위험)"""
+    crisis = [m.group(0) for m in _CRISIS_RE.finditer(message)]
+    if crisis:
+        return 2, crisis
+    caution = [m.group(0) for m in _CAUTION_RE.finditer(message)]
+    if caution:
+        return 1, caution
+    return 0, []
+
+
+def analyze_emotion_local(message: str) -> EmotionData:
+    """감정 사전 기반 감정 분석 (위험 수준 포함)"""
+    risk_level, risk_keywords = detect_risk(message)
+
+    best, best_hits = "neutral", []
+    for emotion, pattern in _EMOTION_RES.items():
+        hits = [m.group(0) for m in pattern.finditer(message)]
+        if len(hits) > len(best_hits):
+            best, best_hits = emotion, hits
+
+    if risk_level >= 2 and best in ("neutral", "happy"):
+        best = "sad"
+
+    return {
+        "primary": best,
+        "confidence": 0.7 if best_hits or risk_level else 0.5,
+        "risk_level": risk_level,
+        "keywords": list(dict.fromkeys(risk_keywords + best_hits))
+    }
+
+
+def _mixed_cues(scores: Dict[str, float], emotion: EmotionData) -> bool:
+    """업무 키워드와 정서 단서(정서 키워드 또는 부정 감정)가 함께 있는지"""
+    if not any(intent in scores for intent in DOMAIN_INTENTS):
+        return False
+    return "companion" in scores or emotion.get("primary") in EMOTIONAL_CUES
+
+
+def _keyword_scores(message: str) -> Dict[str, float]:
+    """의도별 키워드 점수"""
+    scores = {}
+    for intent, patterns in _INTENT_RES.items():
+        score = sum(weight for pattern, weight in patterns if pattern.search(message))
+        if score:
+            scores[intent] = score
+    return scores
+
+
+class IntentRouter:
+    """계층형 의도 라우터
+
+    1. 위기 표현 (정규식) - 항상 실행, 감지 시 즉시 companion
+    2. 키워드 정규식 - 한 의도만 충분한 점수를 얻으면 확정
+    3. 예시 발화와의 임베딩 유사도 - 임계값과 2순위와의 차이가 충분하면 확정
+    4. 둘 다 애매하면 None을 반환 → 슈퍼바이저가 LLM 호출
+
+    복지/일상 키워드와 정서 단서가 한 발화에 섞여 있으면 2~3단계를 건너뛰고 LLM에 맡깁니다.
+    """
+
+    def __init__(self):
+        self._exemplar_matrix: Optional[np.ndarray] = None
+        self._exemplar_labels: List[str] = []
+        self._exemplar_task: Optional[asyncio.Task] = None
+        self._embedding_disabled = False
+        self._counts: Dict[str, int] = {"risk": 0, "keyword": 0, "embedding": 0, "llm": 0}
+
+    def _route_keyword(self, scores: Dict[str, float]) -> Optional[Tuple[str, float]]:
+        """키워드 점수로 의도 확정 (애매하면 None)"""
+        if not scores:
+            return None
+
+        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        intent, top = ranked[0]
+        second = ranked[1][1] if len(ranked) > 1 else 0.0
+
+        if top >= settings.ROUTER_KEYWORD_MIN_SCORE and top - second >= settings.ROUTER_KEYWORD_MARGIN:
+            return intent, min(1.0, 0.6 + 0.1 * (top - second))
+        return None
+
+    async def _load_exemplars(self) -> None:
+        """예시 발화 임베딩 (최초 1회, 임베딩 캐시에도 저장됨)"""
+        labels, texts = [], []
+        for intent, examples in INTENT_EXEMPLARS.items():
+            labels.extend([intent] * len(examples))
+            texts.extend(examples)
+
+        try:
+            vectors = await embedding_service.embed_texts(texts)
+        except Exception as e:
+            logger.warning(f"라우터 예시 발화 임베딩 실패: {e}")
+            return
+
+        if embedding_service.degraded:
+            # 더미 임베딩은 유사도가 의미 없으므로 임베딩 단계를 끔
+            logger.warning("임베딩 서비스가 더미 모드여서 임베딩 라우팅을 비활성화합니다")
+            self._embedding_disabled = True
+            return
+
+        matrix = np.asarray(vectors, dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+        self._exemplar_matrix = matrix
+        self._exemplar_labels = labels
+        logger.info(f"라우터 예시 발화 임베딩 완료: {len(texts)}개")
+
+    def _exemplars_ready(self) -> bool:
+        """예시 임베딩 준비 여부 (없으면 백그라운드 로드 시작)
+
+        로드는 라우팅 시간 제한과 무관하게 끝까지 진행되고,
+        준비되기 전의 요청은 LLM 단계로 넘어갑니다.
+        """
+        if self._exemplar_matrix is not None:
+            return True
+        if self._exemplar_task is None or self._exemplar_task.done():
+            self._exemplar_task = asyncio.create_task(self._load_exemplars())
+        return False
+
+    async def _route_embedding(self, message: str) -> Optional[Tuple[str, float]]:
+        """예시 발화와의 코사인 유사도로 의도 확정 (애매하면 None)"""
+        if not self._exemplars_ready():
+            return None
+
+        vector = np.asarray(await embedding_service.embed_text(message), dtype=np.float32)
+        if embedding_service.degraded or not vector.size:
+            return None
+        vector /= np.linalg.norm(vector) + 1e-12
+
+        similarities = self._exemplar_matrix @ vector
+
+        # 의도별 최고 유사도
+        best: Dict[str, float] = {}
+        for label, sim in zip(self._exemplar_labels, similarities.tolist()):
+            if sim > best.get(label, -1.0):
+                best[label] = sim
+
+        ranked = sorted(best.items(), key=lambda x: x[1], reverse=True)
+        intent, top = ranked[0]
+        second = ranked[1][1] if len(ranked) > 1 else -1.0
+
+        if top >= settings.ROUTER_EMBEDDING_THRESHOLD and top - second >= settings.ROUTER_EMBEDDING_MARGIN:
+            return intent, round(top, 4)
+        return None
+
+    async def route(self, message: str) -> Optional[RouteDecision]:
+        """로컬에서 의도를 판단 (LLM이 필요하면 None)"""
+        emotion = analyze_emotion_local(message)
+
+        # 1. 위기 상황은 어떤 설정에서도 바로 정서 케어로
+        if emotion["risk_level"] >= 2:
+            self._counts["risk"] += 1
+            logger.warning(f"로컬 위기 표현 감지: {emotion['keywords']}")
+            return RouteDecision("companion", 1.0, "risk", emotion)
+
+        if not settings.ROUTER_FAST_PATH_ENABLED:
+            self._counts["llm"] += 1
+            return None
+
+        scores = _keyword_scores(message)
+        if _mixed_cues(scores, emotion):
+            self._counts["llm"] += 1
+            logger.info(f"업무 키워드와 정서 단서가 함께 있어 LLM으로 넘김: {sorted(scores)}")
+            return None
+
+        # 2. 키워드
+        decided = self._route_keyword(scores)
+        if decided:
+            self._counts["keyword"] += 1
+            return RouteDecision(decided[0], decided[1], "keyword", emotion)
+
+        # 3. 임베딩 유사도 (시간 제한 초과나 과부하 시 건너뜀)
+        if settings.ROUTER_EMBEDDING_ENABLED and not self._embedding_disabled:
+            try:
+                decided = await asyncio.wait_for(
+                    self._route_embedding(message),
+                    timeout=settings.ROUTER_EMBEDDING_TIMEOUT
+                )
+            except (asyncio.TimeoutError, InferenceQueueFull):
+                logger.info("임베딩 라우팅 시간 초과/과부하, LLM으로 넘김")
+                decided = None
+            except Exception as e:
+                logger.warning(f"임베딩 라우팅 실패: {e}")
+                decided = None
+
+            if decided:
+                self._counts["embedding"] += 1
+                return RouteDecision(decided[0], decided[1], "embedding", emotion)
+
+        # 4. LLM 필요
+        self._counts["llm"] += 1
+        return None
+
+    def stats(self) -> dict:
+        """단계별 라우팅 횟수와 LLM 호출 비율"""
+        total = sum(self._counts.values())
+        return {
+            **self._counts,
+            "total": total,
+            "llm_ratio": round(self._counts["llm"] / total, 4) if total else 0.0,
+            "embedding_enabled": settings.ROUTER_EMBEDDING_ENABLED and not self._embedding_disabled
+        }
+
+
+# 싱글톤 인스턴스
+intent_router = IntentRouter()
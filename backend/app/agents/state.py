@@ -2,7 +2,7 @@
 AI 케어브릿지 - LangGraph AgentState 정의
 """
 from typing import TypedDict, Annotated, List, Optional, Literal
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import BaseMessage, HumanMessage
 from langgraph.graph.message import add_messages
 
 
@@ -63,6 +63,10 @@ class AgentState(TypedDict):
     # 최종 응답 생성에 사용될 컨텍스트
     response_context: Optional[str]
 
+    # === 대화 요약 ===
+    # 오래된 대화를 접어 넣은 누적 요약 (최근 대화와 함께 프롬프트에 사용)
+    summary: Optional[str]
+
     # === 에러 핸들링 ===
     error: Optional[str]
     retry_count: int
@@ -84,6 +88,15 @@ def create_initial_state(
         retrieved_docs=[],
         tool_results=[],
         response_context=None,
+        summary=None,
         error=None,
         retry_count=0
     )
+
+
+def get_last_user_message(messages: List[BaseMessage]) -> str:
+    """마지막 사용자 발화 (체크포인트로 누적된 기록에서도 이번 턴 입력을 찾음)"""
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            return message.content
+    return messages[-1].content if messages else ""
@@ -0,0 +1,136 @@
+"""
+AI 케어브릿지 - 에이전트 응답 스트리밍
+LangGraph astream_events를 라우팅/토큰/최종 상태 이벤트로 변환합니다.
+"""
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from app.agents.nodes.welfare import _clean_response as clean_welfare_response
+from app.agents.nodes.companion import _clean_response as clean_companion_response
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 응답을 생성하는 노드와 각 노드의 메타 정보 정리 함수 (None이면 정리 없이 바로 전달)
+RESPONSE_NODES: Dict[str, Optional[Callable[[str], str]]] = {
+    "welfare": clean_welfare_response,
+    "companion": clean_companion_response,
+    "daily": None,
+}
+
+_TERMINATORS = ".?!\n。"
+
+
+class SentenceBuffer:
+    """토큰을 문장 단위로 모아 정리 함수를 적용
+
+    괄호나 *별표*가 열려 있는 동안은 문장을 끊지 않아서
+    여러 문장에 걸친 메타 설명도 _clean_response가 한 번에 지울 수 있습니다.
+    """
+
+    def __init__(self, clean_fn: Callable[[str], str]):
+        self.clean_fn = clean_fn
+        self._buffer = ""
+        self._emitted = False
+
+    def _boundary(self) -> int:
+        """내보낼 수 있는 마지막 문장 끝 위치 (없으면 -1)"""
+        depth = 0
+        stars = 0
+        last = -1
+        text = self._buffer
+        for i, ch in enumerate(text):
+            if ch == "(":
+                depth += 1
+            elif ch == ")":
+                depth = max(0, depth - 1)
+            elif ch == "*":
+                stars += 1
+            elif ch in _TERMINATORS and depth == 0 and stars % 2 == 0:
+                if ch == ".":
+                    # "32.4만원" 같은 소수점은 문장 끝이 아님 (다음 글자를 봐야 판단 가능)
+                    if i + 1 >= len(text) or text[i + 1].isdigit():
+                        continue
+                last = i
+        return last
+
+    def _clean(self, sentence: str) -> Optional[str]:
+        """정리 후 앞 문장과 이어 붙일 델타 반환"""
+        cleaned = self.clean_fn(sentence)
+        if not cleaned:
+            return None
+        delta = cleaned if not self._emitted else f" {cleaned}"
+        self._emitted = True
+        return delta
+
+    def feed(self, token: str) -> List[str]:
+        """토큰 추가 후 완성된 문장 델타 목록 반환"""
+        self._buffer += token
+        end = self._boundary()
+        if end < 0:
+            return []
+        sentence, self._buffer = self._buffer[:end + 1], self._buffer[end + 1:]
+        delta = self._clean(sentence)
+        return [delta] if delta else []
+
+    def flush(self) -> List[str]:
+        """남은 버퍼 정리"""
+        sentence, self._buffer = self._buffer, ""
+        delta = self._clean(sentence) if sentence.strip() else None
+        return [delta] if delta else []
+
+
+async def stream_agent_reply(
+    graph: Any,
+    inputs: Dict[str, Any],
+    config: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """에이전트 그래프 실행을 이벤트로 스트리밍
+
+    Yields:
+        ("route", {"agent", "emotion"}) - 슈퍼바이저 분류 직후
+        ("token", {"text"}) - 응답 노드의 정리된 텍스트 델타
+        ("final", {"state", "streamed", "failed"}) - 그래프 최종 상태
+            (failed: 토큰을 보낸 응답 노드가 오류로 끝나 폴백 응답을 돌려줌)
+    """
+    buffer: Optional[SentenceBuffer] = None
+    active_node: Optional[str] = None
+    streamed = False
+    failed = False
+
+    async for event in graph.astream_events(inputs, config=config, version="v2"):
+        kind = event["event"]
+        node = event.get("metadata", {}).get("langgraph_node")
+
+        if kind == "on_chain_end" and event["name"] == "supervisor" and node == "supervisor":
+            output = event["data"].get("output") or {}
+            yield "route", {
+                "agent": output.get("current_agent", "companion"),
+                "emotion": output.get("emotion_analysis")
+            }
+
+        elif kind == "on_chat_model_stream" and node in RESPONSE_NODES:
+            if node != active_node:
+                active_node = node
+                clean_fn = RESPONSE_NODES[node]
+                buffer = SentenceBuffer(clean_fn) if clean_fn else None
+
+            text = event["data"]["chunk"].content
+            if not text:
+                continue
+            deltas = buffer.feed(text) if buffer else [text]
+            for delta in deltas:
+                streamed = True
+                yield "token", {"text": delta}
+
+        elif kind == "on_chain_end" and node == active_node and event["name"] == active_node:
+            # 응답 노드 종료 - 남은 문장 내보내기
+            for delta in (buffer.flush() if buffer else []):
+                streamed = True
+                yield "token", {"text": delta}
+            buffer = None
+            output = event["data"].get("output")
+            if isinstance(output, dict) and output.get("error"):
+                failed = True
+
+        elif kind == "on_chain_end" and not event.get("parent_ids"):
+            # 그래프 전체 종료
+            yield "final", {"state": event["data"].get("output") or {}, "streamed": streamed, "failed": failed}
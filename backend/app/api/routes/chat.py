@@ -3,7 +3,11 @@ AI 케어브릿지 - 대화 API
 LangGraph 멀티 에이전트 시스템 연동
 """
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import Optional
+import asyncio
+import json
+import time
 import uuid
 import logging
 from langchain_core.messages import HumanMessage
@@ -17,13 +21,23 @@ from app.models.message import (
     EmotionAnalysis,
     EmotionType
 )
-from app.agents.graph import agent_graph
+from app.agents.graph import get_agent_graph, thread_config
+from app.agents.streaming import stream_agent_reply
+from app.memory.session_store import session_store
+from app.memory.conversation_log import conversation_log
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# 임시 세션 저장소 (추후 Redis로 교체)
-sessions = {}
+# 응답을 만들지 못했을 때 쓰는 고정 문구 (TTS 사전 합성 대상)
+RETRY_RESPONSE = "죄송해요, 다시 한번 말씀해 주시겠어요?"
+FALLBACK_RESPONSES = {
+    "welfare": "복지 정보를 찾아드릴게요. 어떤 복지 혜택이 궁금하신가요? 기초연금, 장기요양, 노인일자리 등 다양한 프로그램이 있어요.",
+    "weather": "오늘 날씨를 확인해 드릴게요. 외출하실 때 따뜻하게 입으세요!",
+    "greeting": "안녕하세요! 오늘 하루 어떠셨어요? 궁금한 게 있으시면 편하게 말씀해 주세요.",
+    "comfort": "그런 마음이 드셨군요. 제가 곁에 있어요. 이야기 나누고 싶으시면 편하게 말씀해 주세요.",
+    "default": "네, 말씀 잘 들었어요. 더 자세히 말씀해 주시면 도움을 드릴 수 있어요."
+}
 
 
 def _build_emotion_analysis(emotion_data: dict) -> Optional[EmotionAnalysis]:
@@ -43,38 +57,57 @@ def _build_emotion_analysis(emotion_data: dict) -> Optional[EmotionAnalysis]:
         return None
 
 
+def _build_agent_input(request: ChatRequest, session_id: str) -> dict:
+    """에이전트 그래프 입력 (이번 턴 메시지만 전달, 이전 기록은 체크포인터가 복원)"""
+    return {
+        "messages": [HumanMessage(content=request.message)],
+        "user_id": request.user_id,
+        "session_id": session_id,
+        "error": None
+    }
+
+
+def _extract_reply(agent_response: dict) -> Optional[str]:
+    """이번 턴의 마지막 AI 메시지 추출 (마지막 사용자 메시지 이후만 확인)"""
+    for msg in reversed(agent_response.get("messages", [])):
+        if isinstance(msg, HumanMessage):
+            break
+        if hasattr(msg, 'content'):
+            return msg.content
+    return None
+
+
+async def _ensure_session(request: ChatRequest) -> str:
+    """세션 ID 확정 및 세션 등록 (기존 세션은 조회로 만료 시간 연장)"""
+    session_id = request.session_id or str(uuid.uuid4())
+    if await session_store.get(session_id) is None:
+        session = ChatSession(
+            session_id=session_id,
+            user_id=request.user_id
+        )
+        await session_store.put(session_id, session.model_dump(mode="json"))
+    return session_id
+
+
 @router.post("/send", response_model=ChatResponse)
 async def send_message(request: ChatRequest):
     """
     메시지 전송 및 AI 응답 생성
     """
     try:
-        session_id = request.session_id or str(uuid.uuid4())
-
-        if session_id not in sessions:
-            sessions[session_id] = ChatSession(
-                session_id=session_id,
-                user_id=request.user_id
-            )
+        session_id = await _ensure_session(request)
 
         logger.info(f"Chat - User: {request.user_id}, Session: {session_id}")
 
         # LangGraph 에이전트 호출
         try:
-            agent_response = await agent_graph.ainvoke({
-                "messages": [HumanMessage(content=request.message)],
-                "user_id": request.user_id,
-                "session_id": session_id,
-                "user_profile": {"name": "어르신"}
-            })
+            agent_response = await get_agent_graph().ainvoke(
+                _build_agent_input(request, session_id),
+                config=thread_config(session_id)
+            )
 
             # 응답에서 마지막 AI 메시지 추출
-            response_messages = agent_response.get("messages", [])
-            last_ai_message = None
-            for msg in reversed(response_messages):
-                if hasattr(msg, 'content') and not isinstance(msg, HumanMessage):
-                    last_ai_message = msg.content
-                    break
+            last_ai_message = _extract_reply(agent_response)
 
             # 감정 분석 결과
             emotion_data = agent_response.get("emotion_analysis")
@@ -86,7 +119,7 @@ async def send_message(request: ChatRequest):
                 session_id=session_id,
                 user_id=request.user_id,
                 role=MessageRole.ASSISTANT,
-                content=last_ai_message or "죄송해요, 다시 한번 말씀해 주시겠어요?",
+                content=last_ai_message or RETRY_RESPONSE,
                 agent_type=current_agent,
                 emotion=emotion_obj
             )
@@ -119,30 +152,138 @@ async def send_message(request: ChatRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _sse(event: str, data: dict) -> str:
+    """Server-Sent Events 형식으로 직렬화"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/stream")
+async def stream_message(request: ChatRequest):
+    """
+    메시지 전송 및 AI 응답 스트리밍 (Server-Sent Events)
+
+    이벤트 순서:
+    - route: 슈퍼바이저가 고른 에이전트와 감정 분석
+    - token: 응답 텍스트 조각 (문장 단위로 메타 정보 정리 후 전송)
+    - done: 최종 메시지, 첫 토큰까지 걸린 시간(ttft_ms)
+    - error: 에이전트 오류 (done 대신 전송)
+      - 토큰을 보내기 전이면 message에 폴백 응답
+      - 이미 토큰을 보냈으면 partial=true, message=null (보낸 조각 뒤에 엉뚱한 답을 잇지 않음)
+    """
+    session_id = await _ensure_session(request)
+    logger.info(f"Chat stream - User: {request.user_id}, Session: {session_id}")
+
+    async def event_source():
+        started = time.perf_counter()
+        ttft_ms = None
+
+        try:
+            async for event, data in stream_agent_reply(
+                get_agent_graph(),
+                _build_agent_input(request, session_id),
+                config=thread_config(session_id)
+            ):
+                if event == "route":
+                    emotion_obj = _build_emotion_analysis(data.get("emotion"))
+                    yield _sse("route", {
+                        "session_id": session_id,
+                        "agent_type": data["agent"],
+                        "emotion": emotion_obj.model_dump(mode="json") if emotion_obj else None
+                    })
+
+                elif event == "token":
+                    if ttft_ms is None:
+                        ttft_ms = round((time.perf_counter() - started) * 1000, 1)
+                        logger.info(f"Chat stream TTFT: {ttft_ms}ms - Session: {session_id}")
+                    yield _sse("token", data)
+
+                elif event == "final":
+                    state = data["state"]
+                    if data["streamed"] and data["failed"]:
+                        # 답변 도중 LLM 오류 - 노드의 폴백 문구는 보낸 조각과 이어지지 않으므로 빼고 알림
+                        logger.warning(f"Chat stream interrupted: {state.get('error')} - Session: {session_id}")
+                        yield _sse("error", {"session_id": session_id, "partial": True, "message": None})
+                        return
+                    reply = _extract_reply(state) or RETRY_RESPONSE
+                    if not data["streamed"]:
+                        # 오류 폴백 등 토큰 없이 끝난 응답은 한 번에 전송
+                        if ttft_ms is None:
+                            ttft_ms = round((time.perf_counter() - started) * 1000, 1)
+                        yield _sse("token", {"text": reply})
+
+                    emotion_obj = _build_emotion_analysis(state.get("emotion_analysis"))
+                    yield _sse("done", {
+                        "session_id": session_id,
+                        "message": {
+                            "id": str(uuid.uuid4()),
+                            "content": reply,
+                            "agent_type": state.get("current_agent", "companion"),
+                        },
+                        "emotion": emotion_obj.model_dump(mode="json") if emotion_obj else None,
+                        "ttft_ms": ttft_ms,
+                        "total_ms": round((time.perf_counter() - started) * 1000, 1)
+                    })
+
+        except Exception as e:
+            logger.error(f"Chat stream error: {str(e)}")
+            if ttft_ms is not None:
+                yield _sse("error", {"session_id": session_id, "partial": True, "message": None})
+                return
+            yield _sse("error", {
+                "session_id": session_id,
+                "partial": False,
+                "message": {
+                    "id": str(uuid.uuid4()),
+                    "content": _get_fallback_response(request.message),
+                    "agent_type": "fallback"
+                }
+            })
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 def _get_fallback_response(message: str) -> str:
     """에이전트 오류 시 폴백 응답"""
     lower_msg = message.lower()
 
     if "복지" in lower_msg or "지원" in lower_msg:
-        return "복지 정보를 찾아드릴게요. 어떤 복지 혜택이 궁금하신가요? 기초연금, 장기요양, 노인일자리 등 다양한 프로그램이 있어요."
+        return FALLBACK_RESPONSES["welfare"]
     if "날씨" in lower_msg:
-        return "오늘 날씨를 확인해 드릴게요. 외출하실 때 따뜻하게 입으세요!"
+        return FALLBACK_RESPONSES["weather"]
     if "안녕" in lower_msg or "반가" in lower_msg:
-        return "안녕하세요! 오늘 하루 어떠셨어요? 궁금한 게 있으시면 편하게 말씀해 주세요."
+        return FALLBACK_RESPONSES["greeting"]
     if "힘들" in lower_msg or "외로" in lower_msg or "걱정" in lower_msg:
-        return "그런 마음이 드셨군요. 제가 곁에 있어요. 이야기 나누고 싶으시면 편하게 말씀해 주세요."
-    return "네, 말씀 잘 들었어요. 더 자세히 말씀해 주시면 도움을 드릴 수 있어요."
+        return FALLBACK_RESPONSES["comfort"]
+    return FALLBACK_RESPONSES["default"]
 
 
 @router.get("/history/{session_id}")
-async def get_chat_history(session_id: str, limit: int = 50):
-    """대화 기록 조회"""
-    return {"session_id": session_id, "messages": [], "total_count": 0}
+async def get_chat_history(session_id: str, limit: int = 50, before: Optional[int] = None):
+    """
+    대화 기록 조회 (커서 페이지네이션)
+
+    - limit: 한 페이지 메시지 수
+    - before: 이전 응답의 next_cursor (이 순번 이전 메시지 조회)
+    """
+    session = await session_store.get(session_id)
+    messages, next_cursor, total = await asyncio.to_thread(
+        conversation_log.read_page, session_id, min(max(limit, 1), 200), before
+    )
+    return {
+        "session_id": session_id,
+        "session": session,
+        "messages": messages,
+        "total_count": total,
+        "next_cursor": next_cursor
+    }
 
 
 @router.delete("/session/{session_id}")
 async def end_session(session_id: str):
     """대화 세션 종료"""
-    if session_id in sessions:
-        del sessions[session_id]
+    await session_store.delete(session_id)
     return {"status": "session_ended", "session_id": session_id}
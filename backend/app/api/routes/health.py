@@ -2,8 +2,23 @@
 AI 케어브릿지 - 헬스체크 API
 """
 from fastapi import APIRouter
+from fastapi.responses import Response
 from datetime import datetime
 
+from app.services.embedding import embedding_service
+from app.services.inference import inference_executor
+from app.services.stt import stt_service
+from app.services.tts import tts_service
+from app.agents.router import intent_router
+from app.agents.prefetch import rag_prefetcher
+from app.agents.instrumentation import render_metrics
+from app.memory.checkpointer import checkpoint_manager
+from app.memory.session_store import session_store
+from app.memory.conversation_log import conversation_log
+from app.memory.summarizer import conversation_summarizer
+from app.memory.profile_store import profile_repository
+from app.memory.long_term import long_term_memory
+
 router = APIRouter()
 
 
@@ -29,3 +44,38 @@ async def readiness_check():
             "llm": "ok"
         }
     }
+
+
+@router.get("/health/stats")
+async def runtime_stats():
+    """캐시/성능 관련 런타임 통계"""
+    return {
+        "embedding_cache": embedding_service.cache_stats(),
+        "embedding_batching": embedding_service.batch_stats(),
+        "inference": inference_executor.stats(),
+        "router": intent_router.stats(),
+        "rag_prefetch": rag_prefetcher.stats(),
+        "checkpointer": checkpoint_manager.stats(),
+        "sessions": await session_store.stats(),
+        "conversation_log": conversation_log.stats(),
+        "summarizer": conversation_summarizer.stats(),
+        "profiles": profile_repository.stats(),
+        "long_term_memory": long_term_memory.stats(),
+        "stt": stt_service.stats(),
+        "tts": tts_service.stats()
+    }
+
+
+@router.get("/metrics")
+async def prometheus_metrics():
+    """
+    Prometheus 지표
+
+    - carebridge_node_duration_seconds: 노드별 실행 시간 (node, intent, status)
+    - carebridge_node_llm_tokens: 노드 1회당 LLM 토큰 수 (kind: prompt, completion)
+    - carebridge_node_llm_calls_total: 노드별 LLM 호출 수
+    - carebridge_node_errors_total: 노드 예외와 노드가 처리한 LLM 오류
+    - carebridge_route_total: 슈퍼바이저 라우팅 결과
+    """
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -2,16 +2,36 @@
 AI 케어브릿지 - 음성 처리 API
 STT/TTS 통합 음성 인터페이스
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException, Form
+from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Request, WebSocket
 from fastapi.responses import StreamingResponse, Response
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Tuple
+import asyncio
+import base64
+import json
 import logging
 import io
+import re
+import time
 import uuid
 
+import numpy as np
+
+from app.config import settings
+from app.models.message import ChatRequest
+from app.agents.graph import get_agent_graph, thread_config
+from app.agents.streaming import SentenceBuffer, stream_agent_reply
+from app.api.routes.chat import (
+    RETRY_RESPONSE,
+    _build_agent_input,
+    _ensure_session,
+    _extract_reply,
+    _get_fallback_response
+)
 from app.services.stt import stt_service
-from app.services.tts import tts_service
+from app.services.tts import AudioClip, AudioStream, tts_service
+from app.speech.audio import TARGET_SAMPLE_RATE, resample
+from app.speech.vad import SpeechSegment, StreamingVad
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -23,6 +43,7 @@ class TTSRequest(BaseModel):
     voice: str = "nova"
     speed: float = 0.9
     format: str = "mp3"
+    stream: bool = False  # True면 합성되는 대로 전송 (첫 소리가 빨리 나옴, Range/ETag 없음)
 
 
 class STTResponse(BaseModel):
@@ -41,6 +62,104 @@ class VoiceConversationResponse(BaseModel):
     confidence: float
 
 
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """단일 Range 헤더 → (start, end) 포함 구간 (해석 불가/범위 밖이면 None)"""
+    match = _RANGE_RE.match(header.strip())
+    if not match or size == 0:
+        return None
+    start_text, end_text = match.groups()
+    if not start_text:
+        # bytes=-N: 마지막 N바이트
+        if not end_text or int(end_text) == 0:
+            return None
+        start, end = max(0, size - int(end_text)), size - 1
+    else:
+        start = int(start_text)
+        end = min(int(end_text), size - 1) if end_text else size - 1
+    if start > end or start >= size:
+        return None
+    return start, end
+
+
+def _audio_response(http_request: Request, clip: AudioClip, filename: str) -> Response:
+    """
+    오디오 응답 (ETag/조건부 요청/Range 지원)
+
+    캐시 키가 내용 주소이므로 같은 ETag면 같은 오디오입니다.
+    브라우저 <audio>의 구간 재생 요청(Range)에는 206으로 응답합니다.
+    """
+    etag = f'"{clip.key}"'
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": f"public, max-age={settings.AUDIO_CACHE_MAX_AGE}, immutable",
+        "X-Audio-Key": clip.key,
+        "X-Audio-Provider": clip.provider,
+        "Content-Disposition": f"attachment; filename={filename}.{clip.format}"
+    }
+
+    if_none_match = http_request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+
+    size = len(clip.data)
+    range_header = http_request.headers.get("range")
+    if_range = http_request.headers.get("if-range")
+    if range_header and (not if_range or if_range.strip() == etag):
+        byte_range = _parse_range(range_header, size)
+        if byte_range is None:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+        start, end = byte_range
+        return Response(
+            content=clip.data[start:end + 1],
+            status_code=206,
+            media_type=clip.media_type,
+            headers={**headers, "Content-Range": f"bytes {start}-{end}/{size}"}
+        )
+
+    return Response(content=clip.data, media_type=clip.media_type, headers=headers)
+
+
+class _AudioStreamingResponse(StreamingResponse):
+    """전송이 어떻게 끝나든 제공자 응답을 닫는 스트리밍 응답
+
+    본문을 읽기 전에 연결이 끊기면 StreamingResponse는 본문 제너레이터를 시작하지 않고
+    background도 실행하지 않으므로, 응답 처리가 끝날 때 직접 정리합니다.
+    """
+
+    def __init__(self, stream: AudioStream, **kwargs):
+        super().__init__(stream.chunks, **kwargs)
+        self.audio_stream = stream
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.audio_stream.aclose()
+
+
+def _audio_stream_response(stream: AudioStream) -> StreamingResponse:
+    """
+    오디오 스트리밍 응답
+
+    끝까지 전송된 오디오는 캐시에 저장되므로 X-Audio-Key로 나중에 다시 받을 수 있습니다.
+    """
+    return _AudioStreamingResponse(
+        stream,
+        media_type=stream.media_type,
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            "X-Audio-Key": stream.key,
+            "X-Audio-Provider": stream.provider,
+            "X-Audio-Cache": "hit" if stream.cached else "miss"
+        }
+    )
+
+
 @router.post("/stt", response_model=STTResponse)
 async def speech_to_text(
     audio: UploadFile = File(..., description="오디오 파일 (wav, mp3, webm 등)"),
@@ -80,52 +199,167 @@ async def speech_to_text(
         raise HTTPException(status_code=500, detail=f"음성 인식 실패: {str(e)}")
 
 
+@router.websocket("/stt/stream")
+async def speech_to_text_stream(
+    websocket: WebSocket,
+    language: str = "ko",
+    sample_rate: int = TARGET_SAMPLE_RATE
+):
+    """
+    실시간 음성 인식 (WebSocket)
+
+    녹음 전체를 올릴 때까지 기다리지 않고, 말하는 동안 오디오를 받아 VAD로 발화를 나눠 인식합니다.
+    발화가 끝나는 즉시 final이 오므로 클라이언트는 바로 /api/chat 스트리밍을 시작할 수 있습니다.
+
+    클라이언트 → 서버:
+    - binary: PCM16 little-endian mono 오디오 조각 (쿼리 sample_rate, 기본 16000)
+    - text {"type": "end"}: 녹음 종료 (남은 발화까지 인식한 뒤 done을 보내고 닫음)
+
+    서버 → 클라이언트 (JSON):
+    - ready: 수신 준비 완료
+    - partial: 말하는 중의 중간 인식 결과 (segment별로 최신 결과만)
+    - final: 발화 하나의 최종 결과 (confidence, start_ms, end_ms, stt_ms)
+    - done: 종료 (segments: 최종 발화 수)
+    """
+    await websocket.accept()
+    if not 8000 <= sample_rate <= 48000:
+        await websocket.send_json({"type": "error", "detail": f"지원하지 않는 샘플레이트: {sample_rate}"})
+        await websocket.close(code=1003)
+        return
+
+    vad = StreamingVad(
+        TARGET_SAMPLE_RATE,
+        stt_service.vad_config,
+        end_silence_ms=settings.STT_STREAM_END_SILENCE_MS,
+        partial_interval_ms=settings.STT_STREAM_PARTIAL_INTERVAL_MS,
+        max_utterance_ms=settings.STT_STREAM_MAX_UTTERANCE_MS
+    )
+    segments: asyncio.Queue = asyncio.Queue()
+
+    async def recognize() -> None:
+        """발화 구간을 순서대로 인식해 전송 (밀린 중간 결과는 건너뜀)"""
+        index = 0
+        while True:
+            segment: Optional[SpeechSegment] = await segments.get()
+            if segment is None:
+                break
+            if segment.kind == "partial":
+                if not segments.empty():
+                    continue
+                text, _ = await stt_service.transcribe_segment(segment.samples, language, partial=True)
+                if text:
+                    await websocket.send_json({"type": "partial", "segment": index, "text": text})
+                continue
+
+            started = time.perf_counter()
+            text, confidence = await stt_service.transcribe_segment(segment.samples, language)
+            await websocket.send_json({
+                "type": "final",
+                "segment": index,
+                "text": text,
+                "confidence": confidence,
+                "start_ms": round(segment.start * 1000 / TARGET_SAMPLE_RATE),
+                "end_ms": round(segment.end * 1000 / TARGET_SAMPLE_RATE),
+                "stt_ms": _elapsed_ms(started)
+            })
+            index += 1
+        await websocket.send_json({"type": "done", "segments": index})
+
+    worker = asyncio.create_task(recognize())
+    await websocket.send_json({"type": "ready", "sample_rate": sample_rate})
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                # 클라이언트가 먼저 끊으면 결과를 보낼 곳이 없으므로 인식 중단
+                worker.cancel()
+                return
+            if worker.done():
+                # 인식 작업이 오류로 끝나면 받은 오디오가 대기열에 쌓이기만 하므로
+                # 작업의 예외를 올려 오류를 알리고 연결을 닫음
+                worker.result()
+
+            data = message.get("bytes")
+            if data:
+                pcm = np.frombuffer(data[:len(data) - len(data) % 2], dtype="<i2")
+                samples = resample(pcm.astype(np.float32) / 32768.0, sample_rate, TARGET_SAMPLE_RATE)
+                for segment in vad.feed(samples):
+                    segments.put_nowait(segment)
+                continue
+
+            try:
+                control = json.loads(message.get("text") or "{}")
+            except ValueError:
+                continue
+            if isinstance(control, dict) and control.get("type") == "end":
+                segment = vad.flush()
+                if segment:
+                    segments.put_nowait(segment)
+                break
+
+        segments.put_nowait(None)
+        await worker
+        await websocket.close()
+
+    except Exception as e:
+        logger.error(f"실시간 STT 오류: {str(e)}")
+        try:
+            await websocket.send_json({"type": "error", "detail": f"음성 인식 실패: {str(e)}"})
+            await websocket.close(code=1011)
+        except Exception:
+            pass
+
+    finally:
+        if not worker.done():
+            worker.cancel()
+
+
 @router.post("/tts")
-async def text_to_speech(request: TTSRequest):
+async def text_to_speech(request: TTSRequest, http_request: Request):
     """
     텍스트를 음성으로 변환 (TTS)
 
     - OpenAI TTS API 사용 (우선)
     - Edge TTS 폴백 (무료)
+    - 같은 (텍스트, 음성, 속도, 형식, 제공자)는 캐시에서 바로 응답
 
     음성 옵션:
     - alloy, echo, fable, onyx, nova, shimmer
     - 추천: nova (따뜻한 여성), onyx (차분한 남성)
 
     속도: 0.25 ~ 4.0 (노인 친화적 기본값: 0.9)
+
+    응답 헤더 X-Audio-Key로 GET /tts/audio/{key}를 호출하면
+    같은 오디오를 Range/ETag 캐시와 함께 다시 받을 수 있습니다.
+
+    stream=true면 제공자에서 받는 대로 chunked로 전송합니다.
     """
     try:
-        logger.info(f"TTS 요청 - Text: {request.text[:50]}..., Voice: {request.voice}, Speed: {request.speed}")
-
-        # TTS 처리
-        audio_bytes = await tts_service.synthesize(
+        logger.info(f"TTS 요청 - Text: {request.text[:50]}..., Voice: {request.voice}, Speed: {request.speed}, Stream: {request.stream}")
+
+        if request.stream:
+            stream = await tts_service.stream_clip(
+                text=request.text,
+                voice=request.voice,
+                speed=request.speed,
+                response_format=request.format
+            )
+            if not stream:
+                raise HTTPException(status_code=500, detail="음성 합성 실패")
+            return _audio_stream_response(stream)
+
+        # TTS 처리 (캐시 우선)
+        clip = await tts_service.synthesize_clip(
             text=request.text,
             voice=request.voice,
             speed=request.speed,
             response_format=request.format
         )
 
-        if not audio_bytes:
+        if not clip:
             raise HTTPException(status_code=500, detail="음성 합성 실패")
 
-        # 적절한 MIME 타입 설정
-        media_types = {
-            "mp3": "audio/mpeg",
-            "opus": "audio/opus",
-            "aac": "audio/aac",
-            "flac": "audio/flac",
-            "wav": "audio/wav"
-        }
-        media_type = media_types.get(request.format, "audio/mpeg")
-
-        return Response(
-            content=audio_bytes,
-            media_type=media_type,
-            headers={
-                "Content-Disposition": f"attachment; filename=speech.{request.format}",
-                "Content-Length": str(len(audio_bytes))
-            }
-        )
+        return _audio_response(http_request, clip, "speech")
 
     except HTTPException:
         raise
@@ -134,10 +368,30 @@ async def text_to_speech(request: TTSRequest):
         raise HTTPException(status_code=500, detail=f"음성 합성 실패: {str(e)}")
 
 
+@router.get("/tts/audio/{key}")
+async def get_cached_audio(key: str, http_request: Request):
+    """
+    캐시된 TTS 오디오 조회
+
+    - key: TTS 응답의 X-Audio-Key (오디오 내용 주소)
+    - Range 요청(구간 재생)과 If-None-Match(304) 지원
+    """
+    if not re.fullmatch(r"[0-9a-f]{64}", key):
+        raise HTTPException(status_code=400, detail="잘못된 오디오 키")
+
+    clip = await tts_service.get_cached_clip(key)
+    if not clip:
+        raise HTTPException(status_code=404, detail="캐시에 없는 오디오")
+
+    return _audio_response(http_request, clip, "speech")
+
+
 @router.post("/tts/senior")
 async def text_to_speech_senior(
+    http_request: Request,
     text: str = Form(..., description="변환할 텍스트"),
-    emotion: Optional[str] = Form(default=None, description="감정 (comfort, urgent, neutral)")
+    emotion: Optional[str] = Form(default=None, description="감정 (comfort, urgent, neutral)"),
+    stream: bool = Form(default=False, description="합성되는 대로 전송")
 ):
     """
     노인 친화적 TTS
@@ -147,24 +401,23 @@ async def text_to_speech_senior(
     - 감정에 따른 자동 조절
     """
     try:
-        logger.info(f"노인용 TTS 요청 - Text: {text[:50]}..., Emotion: {emotion}")
+        logger.info(f"노인용 TTS 요청 - Text: {text[:50]}..., Emotion: {emotion}, Stream: {stream}")
+
+        if stream:
+            audio_stream = await tts_service.stream_clip_for_senior(text=text, emotion=emotion)
+            if not audio_stream:
+                raise HTTPException(status_code=500, detail="음성 합성 실패")
+            return _audio_stream_response(audio_stream)
 
-        audio_bytes = await tts_service.synthesize_for_senior(
+        clip = await tts_service.synthesize_clip_for_senior(
             text=text,
             emotion=emotion
         )
 
-        if not audio_bytes:
+        if not clip:
             raise HTTPException(status_code=500, detail="음성 합성 실패")
 
-        return Response(
-            content=audio_bytes,
-            media_type="audio/mpeg",
-            headers={
-                "Content-Disposition": "attachment; filename=response.mp3",
-                "Content-Length": str(len(audio_bytes))
-            }
-        )
+        return _audio_response(http_request, clip, "response")
 
     except HTTPException:
         raise
@@ -173,6 +426,16 @@ async def text_to_speech_senior(
         raise HTTPException(status_code=500, detail=f"음성 합성 실패: {str(e)}")
 
 
+async def _transcribe_upload(audio: UploadFile) -> Tuple[str, float]:
+    """업로드된 음성을 텍스트로 변환"""
+    audio_bytes = await audio.read()
+    return await stt_service.transcribe(
+        audio_bytes=audio_bytes,
+        language="ko",
+        filename=audio.filename or "audio.wav"
+    )
+
+
 @router.post("/conversation", response_model=VoiceConversationResponse)
 async def voice_conversation(
     audio: UploadFile = File(..., description="사용자 음성"),
@@ -183,32 +446,31 @@ async def voice_conversation(
     음성 대화 통합 API
 
     1. STT로 음성을 텍스트로 변환
-    2. LangGraph 에이전트로 응답 생성 (TODO)
-    3. TTS로 응답을 음성으로 변환
+    2. LangGraph 에이전트로 응답 생성
+    3. TTS는 별도 엔드포인트로 처리 (클라이언트에서 호출)
 
-    응답에는 텍스트와 오디오 URL이 포함됩니다.
+    음성까지 한 번에 받으려면 /conversation/stream을 사용하세요.
     """
     try:
-        # 세션 ID 생성/유지
-        current_session = session_id or str(uuid.uuid4())
-
         # 1. STT 처리
-        audio_bytes = await audio.read()
-        user_text, confidence = await stt_service.transcribe(
-            audio_bytes=audio_bytes,
-            language="ko",
-            filename=audio.filename or "audio.wav"
-        )
-
+        user_text, confidence = await _transcribe_upload(audio)
         logger.info(f"음성 대화 - User: {user_text[:50]}..., Conf: {confidence:.2f}")
 
-        # 2. AI 응답 생성 (TODO: LangGraph 에이전트 연동)
-        # from app.agents.graph import carebridge_graph
-        # response = await carebridge_graph.ainvoke(...)
-        assistant_text = f"안녕하세요! '{user_text}'에 대해 도움을 드릴게요. 어떤 것이 궁금하신가요?"
-
-        # 3. TTS는 별도 엔드포인트로 처리 (클라이언트에서 호출)
-        # 이유: 응답 텍스트를 먼저 보여주고, 음성은 비동기로 로드
+        # 2. AI 응답 생성
+        request = ChatRequest(message=user_text, user_id=user_id, session_id=session_id)
+        current_session = await _ensure_session(request)
+        if not user_text.strip():
+            assistant_text = RETRY_RESPONSE
+        else:
+            try:
+                state = await get_agent_graph().ainvoke(
+                    _build_agent_input(request, current_session),
+                    config=thread_config(current_session)
+                )
+                assistant_text = _extract_reply(state) or RETRY_RESPONSE
+            except Exception as e:
+                logger.error(f"음성 대화 에이전트 오류: {e}")
+                assistant_text = _get_fallback_response(user_text)
 
         return VoiceConversationResponse(
             session_id=current_session,
@@ -222,6 +484,172 @@ async def voice_conversation(
         raise HTTPException(status_code=500, detail=f"음성 대화 처리 실패: {str(e)}")
 
 
+def _ndjson(data: dict) -> str:
+    """NDJSON 한 줄로 직렬화"""
+    return json.dumps(data, ensure_ascii=False) + "\n"
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+@router.post("/conversation/stream")
+async def voice_conversation_stream(
+    audio: UploadFile = File(..., description="사용자 음성"),
+    user_id: str = Form(default="", description="사용자 ID"),
+    session_id: Optional[str] = Form(default=None, description="세션 ID"),
+    emotion: Optional[str] = Form(default=None, description="TTS 감정 (comfort, urgent, neutral)")
+):
+    """
+    음성 대화 파이프라인 (NDJSON 스트리밍)
+
+    STT → 에이전트 토큰 스트리밍 → 문장이 완성될 때마다 TTS를 바로 시작하므로
+    첫 문장을 재생하는 동안 뒷문장이 생성/합성됩니다.
+
+    한 줄에 JSON 하나씩, 순서대로:
+    - transcript: 인식된 사용자 발화
+    - route: 슈퍼바이저가 고른 에이전트
+    - sentence: 응답 문장 (index 순)
+    - audio: 해당 문장 음성 (base64, 문장 순서대로)
+    - done: 전체 응답과 단계별 시간(timings, ms)
+    """
+    # 요청 본문은 응답 스트림이 시작되기 전에 읽어 둠
+    audio_bytes = await audio.read()
+    filename = audio.filename or "audio.wav"
+
+    async def event_source():
+        started = time.perf_counter()
+        timings = {}
+        producer: Optional[asyncio.Task] = None
+        pending: asyncio.Queue = asyncio.Queue()
+
+        try:
+            # 1. STT
+            user_text, confidence = await stt_service.transcribe(
+                audio_bytes=audio_bytes, language="ko", filename=filename
+            )
+            timings["stt_ms"] = _elapsed_ms(started)
+
+            request = ChatRequest(message=user_text, user_id=user_id, session_id=session_id)
+            current_session = await _ensure_session(request)
+            yield _ndjson({
+                "type": "transcript",
+                "session_id": current_session,
+                "text": user_text,
+                "confidence": confidence
+            })
+
+            async def synthesize(text: str):
+                tts_started = time.perf_counter()
+                clip = await tts_service.synthesize_clip_for_senior(text, emotion)
+                return clip, _elapsed_ms(tts_started)
+
+            def enqueue(text: str) -> None:
+                """문장 완성 즉시 TTS 시작 (결과는 순서대로 전송)"""
+                if "first_sentence_ms" not in timings:
+                    timings["first_sentence_ms"] = _elapsed_ms(started)
+                pending.put_nowait(("sentence", text, asyncio.create_task(synthesize(text))))
+
+            async def produce() -> None:
+                """에이전트 토큰을 문장으로 끊어 TTS 대기열에 넣음"""
+                agent_started = time.perf_counter()
+                buffer = SentenceBuffer(str.strip)
+                reply_parts = []
+                try:
+                    if not user_text.strip():
+                        enqueue(RETRY_RESPONSE)
+                        reply_parts.append(RETRY_RESPONSE)
+                        return
+
+                    async for event, data in stream_agent_reply(
+                        get_agent_graph(),
+                        _build_agent_input(request, current_session),
+                        config=thread_config(current_session)
+                    ):
+                        if event == "route":
+                            timings["route_ms"] = _elapsed_ms(started)
+                            pending.put_nowait(("route", data["agent"], None))
+                        elif event == "token":
+                            timings.setdefault("first_token_ms", _elapsed_ms(started))
+                            reply_parts.append(data["text"])
+                            for sentence in buffer.feed(data["text"]):
+                                enqueue(sentence.strip())
+                        elif event == "final":
+                            for sentence in buffer.flush():
+                                enqueue(sentence.strip())
+                            if not data["streamed"]:
+                                # 오류 폴백 등 토큰 없이 끝난 응답
+                                reply = _extract_reply(data["state"]) or RETRY_RESPONSE
+                                reply_parts.append(reply)
+                                enqueue(reply)
+                except Exception as e:
+                    logger.error(f"음성 대화 에이전트 오류: {e}")
+                    if not reply_parts:
+                        reply = _get_fallback_response(user_text)
+                        reply_parts.append(reply)
+                        enqueue(reply)
+                finally:
+                    timings["agent_ms"] = round((time.perf_counter() - agent_started) * 1000, 1)
+                    pending.put_nowait(("end", "".join(reply_parts).strip(), None))
+
+            producer = asyncio.create_task(produce())
+
+            # 2~3. 문장/음성을 순서대로 전송
+            index = 0
+            tts_total = 0.0
+            while True:
+                kind, payload, task = await pending.get()
+                if kind == "route":
+                    yield _ndjson({"type": "route", "agent_type": payload})
+                elif kind == "sentence":
+                    yield _ndjson({"type": "sentence", "index": index, "text": payload})
+                    clip, tts_ms = await task
+                    tts_total += tts_ms
+                    if clip:
+                        timings.setdefault("first_audio_ms", _elapsed_ms(started))
+                        yield _ndjson({
+                            "type": "audio",
+                            "index": index,
+                            "format": clip.format,
+                            "key": clip.key,
+                            "tts_ms": tts_ms,
+                            "data": base64.b64encode(clip.data).decode("ascii")
+                        })
+                    index += 1
+                else:
+                    timings["tts_ms"] = round(tts_total, 1)
+                    timings["total_ms"] = _elapsed_ms(started)
+                    logger.info(f"음성 대화 파이프라인 - Session: {current_session}, Timings: {timings}")
+                    yield _ndjson({
+                        "type": "done",
+                        "session_id": current_session,
+                        "user_text": user_text,
+                        "assistant_text": payload,
+                        "sentences": index,
+                        "timings": timings
+                    })
+                    break
+
+        except Exception as e:
+            logger.error(f"음성 대화 파이프라인 오류: {str(e)}")
+            yield _ndjson({"type": "error", "detail": f"음성 대화 처리 실패: {str(e)}"})
+
+        finally:
+            # 클라이언트가 끊으면 남은 생성/합성 중단
+            if producer and not producer.done():
+                producer.cancel()
+            while not pending.empty():
+                _, _, task = pending.get_nowait()
+                if task:
+                    task.cancel()
+
+    return StreamingResponse(
+        event_source(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/voices")
 async def get_available_voices():
     """사용 가능한 음성 목록"""
@@ -230,15 +658,17 @@ async def get_available_voices():
 
 @router.get("/health")
 async def voice_health():
-    """음성 서비스 상태 확인"""
+    """
+    음성 서비스 상태 확인
+
+    제공자별 서킷 브레이커 상태(closed/half_open/open), 최근 오류율과 지연,
+    현재 시도 순서를 반환합니다. 모든 제공자가 차단되면 status가 degraded입니다.
+    """
+    stt = stt_service.router.stats()
+    tts = tts_service.router.stats()
+    healthy = stt_service.router.healthy() and tts_service.router.healthy()
     return {
-        "stt": {
-            "upstage": bool(stt_service.upstage_api_key),
-            "openai": bool(stt_service.openai_api_key),
-            "local": True  # Whisper 설치 여부와 무관하게 폴백 가능
-        },
-        "tts": {
-            "openai": bool(tts_service.openai_api_key),
-            "edge_tts": True  # 항상 사용 가능
-        }
+        "status": "healthy" if healthy else "degraded",
+        "stt": stt,
+        "tts": tts
     }
@@ -21,17 +21,155 @@ class Settings(BaseSettings):
     UPSTAGE_MODEL: str = "solar-pro2"
     UPSTAGE_BASE_URL: str = "https://api.upstage.ai/v1/solar"
 
+    # 노드별 모델 지정 (비어 있으면 UPSTAGE_MODEL 사용)
+    SUPERVISOR_MODEL: str = ""  # 의도 분류용 - 더 작고 빠른 모델 권장
+    WELFARE_MODEL: str = ""
+    COMPANION_MODEL: str = ""
+    DAILY_MODEL: str = ""
+    SUMMARY_MODEL: str = ""     # 대화 요약용
+
     # OpenAI (TTS/Whisper fallback)
     OPENAI_API_KEY: str = ""
 
+    # Provider HTTP Clients (공유 커넥션 풀)
+    UPSTAGE_HTTP_TIMEOUT: float = 60.0
+    OPENAI_HTTP_TIMEOUT: float = 60.0
+    HTTP_DEFAULT_TIMEOUT: float = 30.0
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_PASSWORD: str = ""
 
+    # Chat Sessions
+    SESSION_STORE_BACKEND: str = "memory"    # memory (단일 프로세스), redis (워커 간 공유)
+    SESSION_MAX_SESSIONS: int = 10000
+    SESSION_TTL_SECONDS: float = 3600.0      # 마지막 접근 후 만료까지 (초)
+
+    # Conversation Summary & Context Window
+    SUMMARY_ENABLED: bool = True
+    SUMMARY_TRIGGER_TOKENS: int = 1500    # 대화 토큰이 이 값을 넘으면 앞부분을 요약
+    SUMMARY_KEEP_TURNS: int = 4           # 요약하지 않고 남길 최근 턴 수
+    SUMMARY_MAX_TOKENS: int = 400         # 요약 길이 상한
+    SUMMARY_PENDING_MAX: int = 1000       # 체크포인터 반영에 실패한 요약 보관 상한
+    CONTEXT_MAX_TURNS: int = 6            # 노드 프롬프트에 넣을 최근 턴 수
+    CONTEXT_MAX_TOKENS: int = 1200        # 최근 대화에 쓸 토큰 예산
+
+    # Conversation Log (세션별 추가 전용 대화 기록)
+    CONVERSATION_LOG_DIR: str = "./data/conversations"
+    CONVERSATION_LOG_BATCH_SIZE: int = 256
+    CONVERSATION_LOG_FLUSH_MS: float = 50.0
+    CONVERSATION_LOG_MAX_QUEUE: int = 10000
+
+    # Agent Checkpointer (세션별 대화 상태)
+    CHECKPOINT_BACKEND: str = "sqlite"                 # sqlite, redis, memory, none
+    CHECKPOINT_SQLITE_PATH: str = "./data/checkpoints.sqlite"
+    CHECKPOINT_MAX_MESSAGES: int = 40                  # 스레드당 보관할 최대 메시지 수
+    CHECKPOINT_KEEP_PER_THREAD: int = 3                # 스레드당 남길 체크포인트 수 (sqlite/memory)
+    CHECKPOINT_PRUNE_INTERVAL: float = 300.0           # 정리 주기 (초)
+    CHECKPOINT_TTL_MINUTES: int = 1440                 # Redis 체크포인트 만료 (분)
+
+    # User Profiles
+    PROFILE_STORE_BACKEND: str = "memory"         # memory (개발용 기본 사용자), redis
+    PROFILE_CACHE_MAX_ITEMS: int = 50000
+    PROFILE_CACHE_TTL_SECONDS: float = 300.0
+    PROFILE_NEGATIVE_TTL_SECONDS: float = 30.0    # 없는 사용자 캐시 시간
+    PROFILE_INVALIDATION_CHANNEL: str = "carebridge:profile:invalidate"
+
+    # Long-term Memory (사용자별 기억 벡터 저장)
+    LONG_TERM_MEMORY_ENABLED: bool = True
+    LONG_TERM_MEMORY_SHARDS: int = 64          # 사용자 해시 기준 컬렉션 수
+    LONG_TERM_RECALL_K: int = 3
+    LONG_TERM_RECALL_TIMEOUT: float = 0.15     # 벡터 DB 검색 시간 제한 (초, 쿼리 임베딩 제외), 초과 시 기억 없이 응답
+    LONG_TERM_MAX_DISTANCE: float = 0.6        # 이보다 먼 기억은 버림 (코사인 거리)
+    LONG_TERM_MAX_PENDING: int = 256           # 동시에 대기할 저장 작업 수
+
     # Vector DB
     CHROMA_PERSIST_DIR: str = "./data/chroma_db"
     EMBEDDING_MODEL: str = "intfloat/multilingual-e5-large"
 
+    # Embedding Cache
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str = "./data/embedding_cache.sqlite"
+    EMBEDDING_CACHE_MAX_MB: int = 256
+    EMBEDDING_CACHE_MEMORY_ITEMS: int = 4096
+
+    # Embedding Micro-batching
+    EMBEDDING_BATCH_ENABLED: bool = True
+    EMBEDDING_BATCH_WINDOW_MS: float = 5.0
+    EMBEDDING_BATCH_MAX_SIZE: int = 32
+
+    # Hybrid Search (BM25 + Vector)
+    HYBRID_CANDIDATES: int = 10           # 각 검색기에서 가져올 후보 수
+    HYBRID_RRF_K: int = 60                # Reciprocal Rank Fusion 상수
+    LEXICAL_FAST_PATH_COVERAGE: float = 0.5  # 프로그램명/키워드가 질의의 이 비율 이상이면 임베딩 생략
+
+    # Intent Router (위기 감지 → 키워드 → 임베딩 → LLM)
+    ROUTER_FAST_PATH_ENABLED: bool = True     # False면 위기 감지 외에는 항상 LLM 분류
+    ROUTER_KEYWORD_MIN_SCORE: float = 1.0     # 키워드 가중치 합이 이 이상이어야 확정
+    ROUTER_KEYWORD_MARGIN: float = 1.0        # 2순위 의도와의 최소 점수 차
+    ROUTER_EMBEDDING_ENABLED: bool = True
+    ROUTER_EMBEDDING_THRESHOLD: float = 0.82  # 예시 발화와의 최소 코사인 유사도
+    ROUTER_EMBEDDING_MARGIN: float = 0.03     # 2순위 의도와의 최소 유사도 차
+    ROUTER_EMBEDDING_TIMEOUT: float = 0.3     # 임베딩 단계 시간 제한 (초)
+
+    # RAG Prefetch (슈퍼바이저와 복지 검색 병렬 실행)
+    RAG_PREFETCH_ENABLED: bool = True
+
+    # Local Inference Worker Pool (sentence-transformers, Whisper)
+    INFERENCE_WORKERS: int = 2
+    INFERENCE_MAX_QUEUE: int = 16
+
+    # TTS Audio Cache
+    AUDIO_CACHE_ENABLED: bool = True
+    AUDIO_CACHE_DIR: str = "./data/tts_cache"
+    AUDIO_CACHE_MAX_MB: int = 512
+    AUDIO_CACHE_MEMORY_MB: int = 32
+    AUDIO_CACHE_MAX_AGE: int = 86400          # 브라우저 캐시 시간 (초), 키가 내용 주소라 길게 잡아도 안전
+    TTS_PREWARM_ENABLED: bool = True          # 시작 시 폴백/안내 문구 사전 합성
+    TTS_PREWARM_PHRASES: str = ""             # 추가로 미리 합성할 문구 ("|"로 구분)
+
+    # Provider Circuit Breakers (STT/TTS 제공자 장애 시 바로 다음 제공자로)
+    BREAKER_WINDOW_SECONDS: float = 60.0
+    BREAKER_MIN_REQUESTS: int = 5            # 오류율로 판단할 최소 요청 수
+    BREAKER_FAILURE_RATE: float = 0.5        # 이 비율 이상 실패하면 차단
+    BREAKER_CONSECUTIVE_FAILURES: int = 3    # 요청이 적어도 연속 실패 시 차단
+    BREAKER_OPEN_SECONDS: float = 30.0       # 차단 후 시험 호출까지 대기 (실패 시 두 배)
+    BREAKER_MAX_OPEN_SECONDS: float = 300.0
+    PROVIDER_DEGRADED_ERROR_RATE: float = 0.2  # 이 이상이면 다음 순위로 밀림
+    PROVIDER_SLOW_MS: float = 10000.0          # 최근 p95가 이 이상이면 다음 순위로 밀림
+
+    # Local Whisper (STT fallback)
+    WHISPER_LOCAL_ENABLED: bool = True
+    WHISPER_MODEL_SIZE: str = "base"     # tiny, base, small, medium, large
+    STT_LOCAL_FIRST: bool = False        # True면 API보다 로컬 Whisper를 먼저 사용
+
+    # STT Preprocessing (무음 제거 + 16kHz mono 재인코딩)
+    STT_PREPROCESS_ENABLED: bool = True
+    STT_PREPROCESS_CODEC: str = "wav"    # wav (PCM16), flac, opus (flac/opus는 ffmpeg 필요)
+    STT_VAD_MARGIN_DB: float = 10.0      # 배경 소음보다 이만큼 커야 발화로 판정
+    STT_VAD_MIN_DB: float = -50.0        # 이보다 작은 소리는 항상 무음
+    STT_VAD_PAD_MS: float = 200.0        # 발화 앞뒤 여유
+    STT_VAD_MAX_PAUSE_MS: float = 600.0  # 발화 사이 긴 쉼을 이 길이로 줄임
+
+    # STT Hedging (1순위 제공자가 최근 p95 안에 응답하지 않으면 다음 제공자에도 요청)
+    STT_HEDGE_ENABLED: bool = False
+    STT_HEDGE_DAILY_BUDGET: int = 500          # 하루 추가 요청 한도 (비용 상한)
+    STT_HEDGE_MIN_SAMPLES: int = 20            # 이보다 기록이 적으면 기본 대기 시간 사용
+    STT_HEDGE_DEFAULT_DELAY_MS: float = 3000.0
+    STT_HEDGE_MIN_DELAY_MS: float = 500.0      # p95가 아무리 짧아도 이만큼은 기다림
+
+    # Streaming STT (WebSocket, 발화 단위 인식)
+    STT_STREAM_END_SILENCE_MS: float = 700.0        # 이만큼 조용하면 발화 끝으로 판단
+    STT_STREAM_PARTIAL_INTERVAL_MS: float = 1500.0  # 중간 결과 주기 (0이면 보내지 않음)
+    STT_STREAM_MAX_UTTERANCE_MS: float = 30000.0    # 이보다 긴 발화는 잘라서 인식
+
+    # Metrics (Prometheus /metrics)
+    METRICS_ENABLED: bool = True
+
     # External APIs
     WELFARE_API_KEY: str = ""
     WEATHER_API_KEY: str = ""
@@ -45,6 +183,10 @@ class Settings(BaseSettings):
     def cors_origins_list(self) -> List[str]:
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
+    @property
+    def tts_prewarm_phrases_list(self) -> List[str]:
+        return [phrase.strip() for phrase in self.TTS_PREWARM_PHRASES.split("|") if phrase.strip()]
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
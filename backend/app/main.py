@@ -4,10 +4,21 @@ AI 케어브릿지 - FastAPI 메인 애플리케이션
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 
 from app.config import settings
 from app.api.routes import chat, voice, welfare, health
+from app.services.http_clients import http_clients
+from app.services.inference import inference_executor
+from app.services.stt import stt_service
+from app.services.tts import tts_service
+from app.memory.checkpointer import checkpoint_manager
+from app.memory.redis_client import close_redis
+from app.memory.conversation_log import conversation_log
+from app.memory.summarizer import conversation_summarizer
+from app.memory.profile_store import profile_repository
+from app.memory.long_term import long_term_memory
 
 # 로깅 설정
 logging.basicConfig(
@@ -24,12 +35,38 @@ async def lifespan(app: FastAPI):
     logger.info(f"🚀 {settings.APP_NAME} 서버 시작")
     logger.info(f"📍 환경: {settings.APP_ENV}")
 
-    # TODO: Redis 연결 초기화
     # TODO: Vector Store 초기화
 
+    # 대화 상태 체크포인터 연결 (에이전트 그래프는 첫 요청 시 이 체크포인터로 컴파일)
+    await checkpoint_manager.start()
+
+    # 프로필 캐시 무효화 구독 (Redis 백엔드일 때 워커 간 캐시 일관성 유지)
+    await profile_repository.start()
+
+    # 로컬 Whisper 모델 사전 로드 (시작을 막지 않도록 백그라운드)
+    warmup_task = asyncio.create_task(stt_service.warmup())
+
+    # 폴백/안내 문구 TTS 사전 합성 (첫 요청부터 캐시에서 바로 재생)
+    prewarm_task = None
+    if settings.TTS_PREWARM_ENABLED:
+        prewarm_task = asyncio.create_task(tts_service.prewarm(
+            settings.tts_prewarm_phrases_list + list(chat.FALLBACK_RESPONSES.values()) + [chat.RETRY_RESPONSE]
+        ))
+
     yield
 
     # 종료 시 정리
+    warmup_task.cancel()
+    if prewarm_task:
+        prewarm_task.cancel()
+    await conversation_summarizer.close()
+    await long_term_memory.close()
+    await profile_repository.close()
+    await conversation_log.close()
+    await checkpoint_manager.close()
+    await close_redis()
+    await http_clients.aclose()
+    inference_executor.shutdown()
     logger.info(f"👋 {settings.APP_NAME} 서버 종료")
 
 
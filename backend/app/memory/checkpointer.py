@@ -0,0 +1,182 @@
+"""
+AI 케어브릿지 - LangGraph 체크포인터
+세션(thread_id)별 대화 상태를 SQLite/Redis/메모리에 저장합니다.
+"""
+import asyncio
+import os
+from contextlib import AsyncExitStack
+from typing import Optional
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from app.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 스레드별 최신 N개만 남기는 정리 쿼리 (checkpoint_id는 시간순 정렬되는 uuid6)
+_PRUNE_CHECKPOINTS_SQL = """
+DELETE FROM checkpoints WHERE rowid IN (
+    SELECT rowid FROM (
+        SELECT rowid, ROW_NUMBER() OVER (
+            PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+        ) AS rn
+        FROM checkpoints
+    ) WHERE rn > ?
+)
+"""
+_PRUNE_WRITES_SQL = """
+DELETE FROM writes WHERE NOT EXISTS (
+    SELECT 1 FROM checkpoints c
+    WHERE c.thread_id = writes.thread_id
+      AND c.checkpoint_ns = writes.checkpoint_ns
+      AND c.checkpoint_id = writes.checkpoint_id
+)
+"""
+
+
+class CheckpointManager:
+    """체크포인터 생명주기 관리
+
+    CHECKPOINT_BACKEND 설정에 따라 같은 BaseCheckpointSaver 인터페이스로
+    sqlite(디스크), redis, memory(개발용) 저장소를 제공합니다.
+    앱 lifespan에서 start()/close()를 호출합니다.
+    """
+
+    def __init__(self):
+        self.backend = settings.CHECKPOINT_BACKEND.lower()
+        self.saver: Optional[BaseCheckpointSaver] = None
+        self._stack: Optional[AsyncExitStack] = None
+        self._prune_task: Optional[asyncio.Task] = None
+        self.pruned = 0
+
+    async def start(self) -> Optional[BaseCheckpointSaver]:
+        """백엔드 연결 및 저장소 준비 (실패 시 메모리 저장소로 폴백)"""
+        if self.saver is not None:
+            return self.saver
+
+        self._stack = AsyncExitStack()
+        try:
+            if self.backend == "sqlite":
+                self.saver = await self._open_sqlite()
+            elif self.backend == "redis":
+                self.saver = await self._open_redis()
+            elif self.backend != "none":
+                self.saver = self._open_memory()
+        except Exception as e:
+            logger.error(f"체크포인터 초기화 실패 ({self.backend}), 메모리 저장소 사용: {e}")
+            await self._stack.aclose()
+            self._stack = AsyncExitStack()
+            self.backend = "memory"
+            self.saver = self._open_memory()
+
+        if self.saver is not None and self.backend in ("sqlite", "memory"):
+            self._prune_task = asyncio.create_task(self._prune_loop())
+
+        logger.info(f"체크포인터 준비 완료: {self.backend}")
+        return self.saver
+
+    async def _open_sqlite(self) -> BaseCheckpointSaver:
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+        directory = os.path.dirname(settings.CHECKPOINT_SQLITE_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        saver = await self._stack.enter_async_context(
+            AsyncSqliteSaver.from_conn_string(settings.CHECKPOINT_SQLITE_PATH)
+        )
+        await saver.setup()
+        return saver
+
+    async def _open_redis(self) -> BaseCheckpointSaver:
+        from langgraph.checkpoint.redis.aio import AsyncRedisSaver
+
+        # Redis는 키 TTL로 오래된 세션을 정리 (읽을 때마다 갱신)
+        saver = await self._stack.enter_async_context(
+            AsyncRedisSaver.from_conn_string(
+                settings.REDIS_URL,
+                ttl={
+                    "default_ttl": settings.CHECKPOINT_TTL_MINUTES,
+                    "refresh_on_read": True
+                }
+            )
+        )
+        await saver.asetup()
+        return saver
+
+    def _open_memory(self) -> BaseCheckpointSaver:
+        from langgraph.checkpoint.memory import InMemorySaver
+        return InMemorySaver()
+
+    async def prune(self) -> int:
+        """스레드별로 최근 CHECKPOINT_KEEP_PER_THREAD개 체크포인트만 남김"""
+        keep = max(1, settings.CHECKPOINT_KEEP_PER_THREAD)
+
+        if self.backend == "sqlite":
+            conn = self.saver.conn
+            async with self.saver.lock:
+                cursor = await conn.execute(_PRUNE_CHECKPOINTS_SQL, (keep,))
+                removed = cursor.rowcount
+                await conn.execute(_PRUNE_WRITES_SQL)
+                await conn.commit()
+        elif self.backend == "memory":
+            removed = 0
+            for thread_id, namespaces in list(self.saver.storage.items()):
+                for ns, checkpoints in list(namespaces.items()):
+                    stale = sorted(checkpoints, reverse=True)[keep:]
+                    if not stale:
+                        continue
+                    for checkpoint_id in stale:
+                        checkpoints.pop(checkpoint_id, None)
+                        self.saver.writes.pop((thread_id, ns, checkpoint_id), None)
+                    self._prune_memory_blobs(thread_id, ns, checkpoints)
+                    removed += len(stale)
+        else:
+            return 0
+
+        self.pruned += removed
+        if removed:
+            logger.info(f"오래된 체크포인트 정리: {removed}개")
+        return removed
+
+    def _prune_memory_blobs(self, thread_id: str, ns: str, checkpoints: dict) -> None:
+        """남은 체크포인트가 참조하지 않는 채널 값(blobs) 삭제"""
+        serde = self.saver.serde
+        referenced = set()
+        for checkpoint, _, _ in checkpoints.values():
+            referenced.update(serde.loads_typed(checkpoint)["channel_versions"].items())
+        blobs = self.saver.blobs
+        for key in [k for k in blobs if k[0] == thread_id and k[1] == ns and (k[2], k[3]) not in referenced]:
+            del blobs[key]
+
+    async def _prune_loop(self) -> None:
+        """주기적 체크포인트 정리"""
+        while True:
+            await asyncio.sleep(settings.CHECKPOINT_PRUNE_INTERVAL)
+            try:
+                await self.prune()
+            except Exception as e:
+                logger.warning(f"체크포인트 정리 실패: {e}")
+
+    async def close(self) -> None:
+        """정리 작업 중지 및 연결 종료"""
+        if self._prune_task:
+            self._prune_task.cancel()
+            self._prune_task = None
+        if self._stack:
+            await self._stack.aclose()
+            self._stack = None
+        self.saver = None
+        logger.info("체크포인터 종료")
+
+    def stats(self) -> dict:
+        """체크포인터 상태"""
+        return {
+            "backend": self.backend,
+            "active": self.saver is not None,
+            "keep_per_thread": settings.CHECKPOINT_KEEP_PER_THREAD,
+            "max_messages": settings.CHECKPOINT_MAX_MESSAGES,
+            "pruned": self.pruned
+        }
+
+
+# 싱글톤 인스턴스
+checkpoint_manager = CheckpointManager()
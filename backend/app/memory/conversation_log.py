@@ -0,0 +1,296 @@
+"""
+AI 케어브릿지 - 대화 기록 로그
+세션별 추가 전용(append-only) 로그와 오프셋 인덱스로 대화 기록을 저장/조회합니다.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import re
+import struct
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from app.config import settings
+from app.utils.stats import RollingWindow
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 항목: 레코드 끝 오프셋 (uint64, little-endian) - 다음 레코드의 시작 위치
+_OFFSET = struct.Struct("<Q")
+# close()가 작성기에 보내는 종료 신호
+_CLOSE = object()
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    """레코드를 짧은 키의 JSON 한 줄로 직렬화"""
+    emotion = record.get("emotion")
+    compact = {
+        "i": record.get("id"),
+        "r": record["role"],
+        "c": record["content"],
+        "t": round(record.get("timestamp", time.time()), 3),
+    }
+    if record.get("agent_type"):
+        compact["a"] = record["agent_type"]
+    if emotion:
+        compact["e"] = [emotion.get("primary", "neutral"), emotion.get("risk_level", 0)]
+    return (json.dumps(compact, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _decode(line: bytes) -> Dict[str, Any]:
+    """짧은 키 레코드를 API 응답 형식으로 복원"""
+    compact = json.loads(line)
+    emotion = compact.get("e")
+    return {
+        "id": compact.get("i"),
+        "role": compact["r"],
+        "content": compact["c"],
+        "agent_type": compact.get("a"),
+        "emotion": {"primary": emotion[0], "risk_level": emotion[1]} if emotion else None,
+        "timestamp": datetime.fromtimestamp(compact["t"]).isoformat()
+    }
+
+
+class ConversationLog:
+    """세션별 추가 전용 대화 로그
+
+    세션마다 두 파일(세그먼트)을 사용합니다.
+    - {id}.log: 레코드당 JSON 한 줄
+    - {id}.idx: 레코드 끝 오프셋 배열 (8바이트 고정 길이)
+
+    커서는 레코드 순번이라서 한 페이지는 인덱스 두 항목으로 바이트 범위를 구한 뒤
+    로그 파일을 한 번 읽어 가져옵니다. 읽기 범위는 항상 인덱스에 기록된
+    끝 오프셋까지라서 쓰는 중인 레코드나 아직 인덱스에 없는 레코드는 보이지 않습니다.
+    쓰기는 메모리 큐에 넣기만 하고 백그라운드 작업이 배치로 디스크에 기록하므로
+    응답 경로에 지연을 더하지 않습니다.
+    """
+
+    def __init__(self, directory: str, batch_size: int = 256, flush_interval_ms: float = 50.0,
+                 max_queue: int = 10000):
+        self.directory = directory
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.max_queue = max_queue
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+
+        self.records_written = 0
+        self.batches_written = 0
+        self.bytes_written = 0
+        self.dropped = 0
+        self.read_time = RollingWindow()
+        self.write_time = RollingWindow()
+
+    # === 경로 ===
+
+    def _paths(self, session_id: str) -> Tuple[str, str]:
+        """세션 로그/인덱스 경로 (디렉터리 하나에 파일이 몰리지 않게 해시 앞 2자리로 분산)"""
+        digest = hashlib.sha1(session_id.encode("utf-8")).hexdigest()
+        name = session_id if _SAFE_ID.match(session_id) else digest
+        base = os.path.join(self.directory, digest[:2], name)
+        return f"{base}.log", f"{base}.idx"
+
+    # === 쓰기 ===
+
+    def append(self, session_id: str, records: List[Dict[str, Any]]) -> None:
+        """레코드 기록 예약 (즉시 반환)"""
+        if not records:
+            return
+        self._ensure_writer()
+        for record in records:
+            try:
+                self._queue.put_nowait((session_id, record))
+            except asyncio.QueueFull:
+                self.dropped += 1
+                logger.warning(f"대화 로그 큐 가득 참, 레코드 버림 - Session: {session_id}")
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or self._writer.done():
+            if self._queue is None:
+                self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._writer = asyncio.create_task(self._write_loop())
+
+    async def _write_loop(self) -> None:
+        """큐에서 레코드를 모아 배치로 기록 (종료 신호를 받으면 모은 배치까지 쓰고 끝냄)"""
+        while True:
+            item = await self._queue.get()
+            if item is _CLOSE:
+                return
+            batch = [item]
+            closing = False
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+            if closing:
+                return
+
+    async def _flush(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        grouped: Dict[str, List[bytes]] = defaultdict(list)
+        for session_id, record in batch:
+            grouped[session_id].append(_encode(record))
+        try:
+            await asyncio.to_thread(self._write_batch, grouped)
+        except Exception as e:
+            logger.error(f"대화 로그 기록 실패 ({len(batch)}개): {e}")
+
+    def _write_batch(self, grouped: Dict[str, List[bytes]]) -> None:
+        """세션별로 로그를 먼저 쓰고 인덱스를 나중에 추가 (인덱스에 있는 레코드는 항상 완전함)"""
+        started = time.perf_counter()
+        written = 0
+        for session_id, lines in grouped.items():
+            log_path, idx_path = self._paths(session_id)
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+
+            with open(idx_path, "a+b") as idx:
+                offset = self._repair(session_id, idx, log_path)
+                offsets = bytearray()
+                for line in lines:
+                    offset += len(line)
+                    offsets += _OFFSET.pack(offset)
+                data = b"".join(lines)
+                with open(log_path, "ab") as log:
+                    log.write(data)
+                idx.write(offsets)
+
+            written += len(data) + len(offsets)
+            self.records_written += len(lines)
+
+        self.batches_written += 1
+        self.bytes_written += written
+        self.write_time.add(time.perf_counter() - started)
+
+    def _repair(self, session_id: str, idx, log_path: str) -> int:
+        """인덱스가 가리키는 마지막 끝 오프셋 반환, 그 뒤에 남은 로그/인덱스 조각은 잘라냄
+
+        로그를 쓴 뒤 인덱스를 쓰기 전에 실패하거나 프로세스가 죽으면 로그 끝에
+        인덱스에 없는 바이트가 남습니다. 범위가 끝 오프셋 기준이라 그대로 두면
+        다음 레코드가 그 조각과 함께 읽히므로 새로 쓰기 전에 잘라냅니다.
+        """
+        size = idx.seek(0, os.SEEK_END)
+        whole = size - size % _OFFSET.size
+        if whole != size:
+            idx.truncate(whole)
+        indexed_end = self._end_offset(idx, whole // _OFFSET.size - 1) if whole else 0
+
+        try:
+            log_size = os.path.getsize(log_path)
+        except FileNotFoundError:
+            log_size = 0
+        if log_size > indexed_end:
+            logger.warning(f"대화 로그 끝의 인덱스 없는 {log_size - indexed_end}바이트 정리 - Session: {session_id}")
+            with open(log_path, "r+b") as log:
+                log.truncate(indexed_end)
+        idx.seek(0, os.SEEK_END)
+        return indexed_end
+
+    async def close(self) -> None:
+        """남은 레코드를 기록하고 작성기 종료"""
+        writer, self._writer = self._writer, None
+        if writer is not None and not writer.done():
+            # 작성기가 모으던 배치와 큐에 남은 레코드를 모두 기록한 뒤 종료
+            await self._queue.put(_CLOSE)
+            await writer
+        if self._queue is not None and not self._queue.empty():
+            pending = []
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is not _CLOSE:
+                    pending.append(item)
+            if pending:
+                await self._flush(pending)
+
+    # === 읽기 ===
+
+    def count(self, session_id: str) -> int:
+        """세션 레코드 수"""
+        _, idx_path = self._paths(session_id)
+        try:
+            return os.path.getsize(idx_path) // _OFFSET.size
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _end_offset(idx, position: int) -> int:
+        """position번 레코드의 끝 오프셋"""
+        idx.seek(position * _OFFSET.size)
+        return _OFFSET.unpack(idx.read(_OFFSET.size))[0]
+
+    def read_page(
+        self,
+        session_id: str,
+        limit: int = 50,
+        before: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], int]:
+        """
+        커서 이전의 최근 레코드를 시간순으로 조회
+
+        Args:
+            session_id: 세션 ID
+            limit: 최대 레코드 수
+            before: 이 순번 이전 레코드만 (None이면 가장 최근부터)
+
+        Returns:
+            (레코드 목록, 다음 페이지 커서 또는 None, 전체 레코드 수)
+        """
+        started = time.perf_counter()
+        log_path, idx_path = self._paths(session_id)
+        try:
+            idx = open(idx_path, "rb")
+        except FileNotFoundError:
+            return [], None, 0
+
+        with idx:
+            total = os.fstat(idx.fileno()).st_size // _OFFSET.size
+            end = total if before is None else max(0, min(before, total))
+            start = max(0, end - max(0, limit))
+            if start >= end:
+                return [], None, total
+
+            # 레코드 start-1, end-1의 끝 오프셋 → [start, end) 바이트 범위
+            begin = self._end_offset(idx, start - 1) if start > 0 else 0
+            stop = self._end_offset(idx, end - 1)
+
+        with open(log_path, "rb") as log:
+            log.seek(begin)
+            data = log.read(stop - begin)
+
+        records = [_decode(line) for line in data.splitlines() if line]
+        self.read_time.add(time.perf_counter() - started)
+        return records, (start if start > 0 else None), total
+
+    def stats(self) -> dict:
+        """기록/조회 통계"""
+        return {
+            "records_written": self.records_written,
+            "batches_written": self.batches_written,
+            "bytes_written": self.bytes_written,
+            "dropped": self.dropped,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "write_ms": self.write_time.summary(scale=1000.0),
+            "read_ms": self.read_time.summary(scale=1000.0)
+        }
+
+
+# 싱글톤 인스턴스
+conversation_log = ConversationLog(
+    directory=settings.CONVERSATION_LOG_DIR,
+    batch_size=settings.CONVERSATION_LOG_BATCH_SIZE,
+    flush_interval_ms=settings.CONVERSATION_LOG_FLUSH_MS,
+    max_queue=settings.CONVERSATION_LOG_MAX_QUEUE
+)
@@ -0,0 +1,199 @@
+"""
+AI 케어브릿지 - 사용자별 장기 기억
+대화에서 뽑은 사실(가족, 취미, 건강, 일정)을 벡터로 저장하고 턴마다 관련 기억을 불러옵니다.
+"""
+import asyncio
+import hashlib
+import re
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from app.config import settings
+from app.services.embedding import embedding_service
+from app.services.vectorstore import vectorstore_service
+from app.utils.sharding import shard_of
+from app.utils.stats import RollingWindow
+import logging
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_PREFIX = "user_memory"
+
+# 기억할 만한 발화 유형 (규칙 기반 추출)
+FACT_PATTERNS: Dict[str, List[str]] = {
+    "family": [r"아들", r"딸", r"며느리", r"사위", r"손[주자녀]", r"영감", r"남편", r"아내", r"할아버지", r"할머니", r"동생", r"형님", r"언니", r"누나"],
+    "interest": [r"좋아하", r"좋아해", r"취미", r"즐겨", r"자주\s*(보|듣|가|해)", r"텃밭", r"화투", r"노래", r"트로트", r"등산", r"산책", r"뜨개"],
+    "health": [r"아파", r"아프", r"병원", r"약\s*(먹|드)", r"수술", r"혈압", r"당뇨", r"관절", r"허리", r"무릎"],
+    "schedule": [r"내일", r"모레", r"다음\s*주", r"주말에", r"[0-9]+일에", r"약속", r"생신", r"생일", r"제사"],
+}
+_FACT_RES = {category: re.compile("|".join(patterns)) for category, patterns in FACT_PATTERNS.items()}
+_SENTENCE_SPLIT = re.compile(r"(?<=[.?!。])\s+|\n+")
+_MIN_FACT_CHARS = 6
+
+
+def extract_facts(text: str) -> List[Tuple[str, str]]:
+    """발화에서 기억할 문장과 유형 추출 [(category, sentence)]"""
+    facts = []
+    for sentence in _SENTENCE_SPLIT.split(text.strip()):
+        sentence = sentence.strip()
+        if len(sentence) < _MIN_FACT_CHARS or sentence.endswith("?"):
+            continue
+        for category, pattern in _FACT_RES.items():
+            if pattern.search(sentence):
+                facts.append((category, sentence))
+                break
+    return facts
+
+
+class LongTermMemory:
+    """사용자별 장기 기억 저장소
+
+    사용자를 해시로 LONG_TERM_MEMORY_SHARDS개 컬렉션에 나눠 담고
+    조회는 해당 샤드에서 user_id 메타데이터 필터로 수행합니다.
+    사용자 수가 늘어도 한 컬렉션 크기는 전체의 1/샤드 수로 유지됩니다.
+
+    저장은 응답 후 백그라운드에서 수행합니다. 조회는 쿼리 임베딩을 먼저 구한 뒤
+    벡터 DB 검색만 시간 제한 안에서 수행하고, 제한을 넘기면 기억 없이 응답합니다.
+    (임베딩은 원격 API라 캐시 미스 한 번만으로도 검색 제한 시간을 넘기기 때문)
+    """
+
+    def __init__(self, shards: int):
+        self.shards = max(1, shards)
+        self._collections: Dict[int, object] = {}
+        self._pending: Set[asyncio.Task] = set()
+
+        self.stored = 0
+        self.skipped = 0
+        self.recalls = 0
+        self.recall_timeouts = 0
+        self.recall_errors = 0
+        self.recall_time = RollingWindow()
+        self.store_time = RollingWindow()
+
+    def _collection_name(self, user_id: str) -> str:
+        return f"{COLLECTION_PREFIX}_{shard_of(user_id, self.shards):03d}"
+
+    def _collection(self, user_id: str):
+        """샤드 컬렉션 (핸들 재사용)"""
+        shard = shard_of(user_id, self.shards)
+        collection = self._collections.get(shard)
+        if collection is None:
+            collection = vectorstore_service.get_or_create_collection(self._collection_name(user_id))
+            self._collections[shard] = collection
+        return collection
+
+    # === 저장 ===
+
+    def remember(self, user_id: str, text: str) -> None:
+        """발화에서 사실을 추출해 백그라운드로 저장 (즉시 반환)"""
+        if not settings.LONG_TERM_MEMORY_ENABLED or not user_id or not text:
+            return
+        facts = extract_facts(text)
+        if not facts:
+            return
+        if len(self._pending) >= settings.LONG_TERM_MAX_PENDING:
+            self.skipped += len(facts)
+            logger.warning(f"장기 기억 저장 대기열 초과, 건너뜀 - User: {user_id}")
+            return
+
+        task = asyncio.create_task(self._store(user_id, facts))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _store(self, user_id: str, facts: List[Tuple[str, str]]) -> None:
+        started = time.perf_counter()
+        sentences = [sentence for _, sentence in facts]
+        try:
+            embeddings = await embedding_service.embed_texts(sentences)
+        except Exception as e:
+            self.skipped += len(facts)
+            logger.warning(f"장기 기억 임베딩 실패 - User: {user_id}: {e}")
+            return
+
+        if embedding_service.degraded:
+            # 더미 벡터로 저장하면 나중에 엉뚱한 기억이 떠오르므로 저장하지 않음
+            self.skipped += len(facts)
+            return
+
+        now = time.time()
+        # 같은 사용자의 같은 문장은 같은 ID로 덮어써서 중복 저장하지 않음
+        ids = [hashlib.sha1(f"{user_id}\0{sentence}".encode("utf-8")).hexdigest() for sentence in sentences]
+        metadatas = [{"user_id": user_id, "category": category, "created_at": now} for category, _ in facts]
+
+        success = await asyncio.to_thread(
+            vectorstore_service.upsert_documents,
+            self._collection_name(user_id), sentences, embeddings, metadatas, ids
+        )
+        if success:
+            self.stored += len(facts)
+            self.store_time.add(time.perf_counter() - started)
+            logger.info(f"장기 기억 저장 - User: {user_id}, Facts: {len(facts)}")
+
+    # === 조회 ===
+
+    async def recall(self, user_id: str, query: str, k: Optional[int] = None) -> List[str]:
+        """현재 발화와 관련된 기억 상위 k개 (검색 시간 제한 초과 시 빈 목록)"""
+        if not settings.LONG_TERM_MEMORY_ENABLED or not user_id or not query:
+            return []
+
+        started = time.perf_counter()
+        self.recalls += 1
+        try:
+            embedding = await embedding_service.embed_text(query)
+            if embedding_service.degraded or not embedding:
+                return []
+            # 시간 제한은 벡터 DB 검색에만 적용
+            memories = await asyncio.wait_for(
+                asyncio.to_thread(self._search, user_id, embedding, k or settings.LONG_TERM_RECALL_K),
+                timeout=settings.LONG_TERM_RECALL_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            self.recall_timeouts += 1
+            logger.info(f"장기 기억 조회 시간 초과 - User: {user_id}")
+            return []
+        except Exception as e:
+            self.recall_errors += 1
+            logger.warning(f"장기 기억 조회 실패 - User: {user_id}: {e}")
+            return []
+
+        self.recall_time.add(time.perf_counter() - started)
+        return memories
+
+    def _search(self, user_id: str, embedding: List[float], k: int) -> List[str]:
+        """샤드 컬렉션에서 사용자 기억 top-k 검색 (동기, 거리 제한 밖은 버림)"""
+        result = self._collection(user_id).query(
+            query_embeddings=[embedding],
+            n_results=k,
+            where={"user_id": user_id},
+            include=["documents", "distances"]
+        )
+        documents = result.get("documents", [[]])[0]
+        distances = result.get("distances", [[]])[0]
+        return [
+            doc for doc, distance in zip(documents, distances)
+            if distance <= settings.LONG_TERM_MAX_DISTANCE
+        ]
+
+    async def close(self) -> None:
+        """대기 중인 저장 작업 취소"""
+        for task in list(self._pending):
+            task.cancel()
+        self._pending.clear()
+
+    def stats(self) -> dict:
+        """저장/조회 통계"""
+        return {
+            "enabled": settings.LONG_TERM_MEMORY_ENABLED,
+            "shards": self.shards,
+            "stored": self.stored,
+            "skipped": self.skipped,
+            "pending": len(self._pending),
+            "recalls": self.recalls,
+            "recall_timeouts": self.recall_timeouts,
+            "recall_errors": self.recall_errors,
+            "recall_ms": self.recall_time.summary(scale=1000.0),
+            "store_ms": self.store_time.summary(scale=1000.0)
+        }
+
+
+# 싱글톤 인스턴스
+long_term_memory = LongTermMemory(settings.LONG_TERM_MEMORY_SHARDS)
@@ -0,0 +1,260 @@
+"""
+AI 케어브릿지 - 사용자 프로필 저장소
+Redis(또는 메모리) 백엔드 + 프로세스 내 read-through 캐시
+"""
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+from app.config import settings
+from app.agents.state import UserProfileData
+from app.memory.redis_client import get_redis
+from app.utils.cache import MISSING, TTLCache
+from app.utils.stats import RollingWindow
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 개발/데모용 기본 사용자 (메모리 백엔드 초기 데이터)
+USER_PROFILES: Dict[str, UserProfileData] = {
+    "user_001": UserProfileData(
+        user_id="user_001",
+        name="김순자",
+        age=75,
+        address="서울 강북구",
+        health_conditions=["고혈압", "당뇨", "무릎 관절염"],
+        is_basic_pension=True,
+        family_members=[
+            {"relation": "아들", "name": "민수"},
+            {"relation": "손녀", "name": "지은"}
+        ]
+    )
+}
+
+# 전체 캐시 무효화 메시지 (대량 등록 후)
+INVALIDATE_ALL = "*"
+
+
+class ProfileBackend(ABC):
+    """프로필 영속 저장소 인터페이스"""
+
+    name = "base"
+
+    @abstractmethod
+    async def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """프로필 조회"""
+
+    @abstractmethod
+    async def put_many(self, profiles: List[Dict[str, Any]]) -> int:
+        """프로필 일괄 저장 (저장 건수 반환)"""
+
+    @abstractmethod
+    async def delete(self, user_id: str) -> bool:
+        """프로필 삭제"""
+
+
+class InMemoryProfileBackend(ProfileBackend):
+    """프로세스 내 프로필 저장소 (개발용, USER_PROFILES로 초기화)"""
+
+    name = "memory"
+
+    def __init__(self, profiles: Dict[str, UserProfileData]):
+        self._profiles = profiles
+
+    async def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return self._profiles.get(user_id)
+
+    async def put_many(self, profiles: List[Dict[str, Any]]) -> int:
+        for profile in profiles:
+            self._profiles[profile["user_id"]] = profile
+        return len(profiles)
+
+    async def delete(self, user_id: str) -> bool:
+        return self._profiles.pop(user_id, None) is not None
+
+
+class RedisProfileBackend(ProfileBackend):
+    """Redis 프로필 저장소 (사용자당 JSON 문자열 키 하나)"""
+
+    name = "redis"
+
+    def __init__(self, prefix: str = "carebridge:profile"):
+        self.prefix = prefix
+
+    def _key(self, user_id: str) -> str:
+        return f"{self.prefix}:{user_id}"
+
+    async def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        raw = await get_redis().get(self._key(user_id))
+        return json.loads(raw) if raw else None
+
+    async def put_many(self, profiles: List[Dict[str, Any]]) -> int:
+        if not profiles:
+            return 0
+        async with get_redis().pipeline(transaction=False) as pipe:
+            for profile in profiles:
+                pipe.set(self._key(profile["user_id"]), json.dumps(profile, ensure_ascii=False))
+            await pipe.execute()
+        return len(profiles)
+
+    async def delete(self, user_id: str) -> bool:
+        return bool(await get_redis().delete(self._key(user_id)))
+
+
+class ProfileRepository:
+    """사용자 프로필 저장소
+
+    매 턴 memory_load에서 호출되므로 프로세스 내 TTL LRU 캐시를 먼저 보고,
+    없을 때만 백엔드를 조회합니다 (없는 사용자도 짧게 캐시).
+    수정/삭제 시 Redis pub/sub으로 다른 워커의 캐시도 무효화합니다.
+    """
+
+    def __init__(self, backend: ProfileBackend, cache: TTLCache):
+        self.backend = backend
+        self.cache = cache
+        self.channel = settings.PROFILE_INVALIDATION_CHANNEL
+
+        self._listener: Optional[asyncio.Task] = None
+        self.backend_errors = 0
+        self.hit_time = RollingWindow()
+        self.miss_time = RollingWindow()
+
+    @property
+    def _shared(self) -> bool:
+        """워커 간 공유 백엔드 여부 (pub/sub 무효화 필요)"""
+        return self.backend.name == "redis"
+
+    async def get(self, user_id: str) -> Optional[UserProfileData]:
+        """프로필 조회 (캐시 → 백엔드)"""
+        started = time.perf_counter()
+
+        cached = self.cache.get(user_id)
+        if cached is not MISSING:
+            self.hit_time.add(time.perf_counter() - started)
+            return cached
+
+        try:
+            profile = await self.backend.get(user_id)
+        except Exception as e:
+            # 백엔드 장애 시 프로필 없이 진행 (캐시하지 않아 복구 후 바로 반영)
+            self.backend_errors += 1
+            logger.error(f"프로필 조회 실패 - User: {user_id}: {e}")
+            return None
+
+        if profile is None:
+            self.cache.set(user_id, None, ttl=settings.PROFILE_NEGATIVE_TTL_SECONDS)
+        else:
+            self.cache.set(user_id, profile)
+        self.miss_time.add(time.perf_counter() - started)
+        return profile
+
+    async def save(self, profile: UserProfileData) -> None:
+        """프로필 저장 후 모든 워커의 캐시 무효화"""
+        await self.backend.put_many([dict(profile)])
+        await self._invalidate(profile["user_id"])
+
+    async def delete(self, user_id: str) -> bool:
+        """프로필 삭제 후 모든 워커의 캐시 무효화"""
+        deleted = await self.backend.delete(user_id)
+        await self._invalidate(user_id)
+        return deleted
+
+    async def bulk_import(self, profiles: Iterable[Dict[str, Any]], batch_size: int = 1000) -> int:
+        """
+        프로필 대량 등록 (파이프라인 배치 저장)
+
+        Args:
+            profiles: user_id를 포함한 프로필 dict (제너레이터 가능)
+            batch_size: 한 번에 보낼 건수
+
+        Returns:
+            저장 건수
+        """
+        total = 0
+        batch: List[Dict[str, Any]] = []
+        for profile in profiles:
+            if not profile.get("user_id"):
+                continue
+            batch.append(profile)
+            if len(batch) >= batch_size:
+                total += await self.backend.put_many(batch)
+                batch = []
+        if batch:
+            total += await self.backend.put_many(batch)
+
+        await self._invalidate(INVALIDATE_ALL)
+        logger.info(f"프로필 대량 등록 완료: {total}건")
+        return total
+
+    async def _invalidate(self, user_id: str) -> None:
+        """로컬 캐시 무효화 + 다른 워커에 알림"""
+        self._apply_invalidation(user_id)
+        if self._shared:
+            try:
+                await get_redis().publish(self.channel, user_id)
+            except Exception as e:
+                logger.warning(f"프로필 무효화 알림 실패: {e}")
+
+    def _apply_invalidation(self, user_id: str) -> None:
+        if user_id == INVALIDATE_ALL:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(user_id)
+
+    async def start(self) -> None:
+        """무효화 구독 시작 (Redis 백엔드만)"""
+        if self._shared and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """다른 워커의 무효화 메시지 수신 (연결이 끊기면 재구독)"""
+        while True:
+            pubsub = get_redis().pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # 구독이 끊겨 있던 동안의 변경을 놓쳤을 수 있으므로 전체 무효화
+                self.cache.clear()
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"프로필 무효화 구독 오류, 재연결: {e}")
+                await asyncio.sleep(1.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def close(self) -> None:
+        """구독 종료"""
+        if self._listener:
+            self._listener.cancel()
+            self._listener = None
+
+    def stats(self) -> dict:
+        """캐시 적중률과 조회 지연 (ms)"""
+        return {
+            "backend": self.backend.name,
+            "cache": self.cache.stats(),
+            "backend_errors": self.backend_errors,
+            "load_hit_ms": self.hit_time.summary(scale=1000.0, digits=3),
+            "load_miss_ms": self.miss_time.summary(scale=1000.0, digits=3)
+        }
+
+
+def create_profile_repository() -> ProfileRepository:
+    """설정에 맞는 프로필 저장소 생성"""
+    if settings.PROFILE_STORE_BACKEND.lower() == "redis":
+        backend: ProfileBackend = RedisProfileBackend()
+    else:
+        backend = InMemoryProfileBackend(USER_PROFILES)
+    cache = TTLCache(settings.PROFILE_CACHE_MAX_ITEMS, settings.PROFILE_CACHE_TTL_SECONDS)
+    return ProfileRepository(backend, cache)
+
+
+# 싱글톤 인스턴스
+profile_repository = create_profile_repository()
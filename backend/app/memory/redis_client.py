@@ -0,0 +1,38 @@
+"""
+AI 케어브릿지 - 공유 Redis 클라이언트
+세션/프로필 저장소가 하나의 커넥션 풀을 함께 사용합니다.
+"""
+from typing import Optional
+from app.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def get_redis():
+    """redis.asyncio 클라이언트 반환 (최초 호출 시 생성)"""
+    global _client
+    if _client is None:
+        import redis.asyncio as redis
+
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            password=settings.REDIS_PASSWORD or None,
+            decode_responses=True
+        )
+        logger.info("Redis 클라이언트 생성")
+    return _client
+
+
+async def close_redis() -> None:
+    """Redis 연결 종료"""
+    global _client
+    client: Optional[object] = _client
+    _client = None
+    if client is not None:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Redis 연결 종료 실패: {e}")
@@ -0,0 +1,190 @@
+"""
+AI 케어브릿지 - 대화 세션 저장소
+TTL + LRU로 크기가 제한되는 세션 저장소 (메모리 / Redis)
+"""
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from app.config import settings
+from app.memory.redis_client import get_redis
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore(ABC):
+    """세션 저장소 인터페이스
+
+    세션 데이터는 JSON 직렬화 가능한 dict로 다루며,
+    조회할 때마다 만료 시간이 연장됩니다 (sliding TTL).
+    """
+
+    def __init__(self, max_sessions: int, ttl_seconds: float):
+        self.max_sessions = max(1, max_sessions)
+        self.ttl = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions_lru = 0
+        self.evictions_ttl = 0
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 조회 (만료 연장)"""
+
+    @abstractmethod
+    async def put(self, session_id: str, data: Dict[str, Any]) -> None:
+        """세션 저장 (용량 초과 시 가장 오래 쓰지 않은 세션 제거)"""
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> bool:
+        """세션 삭제"""
+
+    @abstractmethod
+    async def count(self) -> int:
+        """현재 세션 수"""
+
+    async def stats(self) -> dict:
+        """적중/제거 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend,
+            "sessions": await self.count(),
+            "max_sessions": self.max_sessions,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions_lru": self.evictions_lru,
+            "evictions_ttl": self.evictions_ttl
+        }
+
+
+class InMemorySessionStore(SessionStore):
+    """프로세스 내 세션 저장소
+
+    OrderedDict를 접근 순서로 유지해서 touch와 LRU 제거가 O(1)입니다.
+    만료 시간이 모두 같은 sliding TTL이므로 가장 앞쪽 항목이 항상 먼저 만료되고,
+    만료 정리는 앞에서부터 만료되지 않은 항목을 만날 때까지만 진행합니다.
+    """
+
+    backend = "memory"
+
+    def __init__(self, max_sessions: int, ttl_seconds: float):
+        super().__init__(max_sessions, ttl_seconds)
+        self._items: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def _purge_expired(self, now: float) -> None:
+        while self._items:
+            session_id, (expires_at, _) = next(iter(self._items.items()))
+            if expires_at > now:
+                break
+            del self._items[session_id]
+            self.evictions_ttl += 1
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        self._purge_expired(now)
+
+        item = self._items.get(session_id)
+        if item is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._items[session_id] = (now + self.ttl, item[1])
+        self._items.move_to_end(session_id)
+        return item[1]
+
+    async def put(self, session_id: str, data: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        self._purge_expired(now)
+
+        self._items[session_id] = (now + self.ttl, data)
+        self._items.move_to_end(session_id)
+
+        while len(self._items) > self.max_sessions:
+            self._items.popitem(last=False)
+            self.evictions_lru += 1
+
+    async def delete(self, session_id: str) -> bool:
+        return self._items.pop(session_id, None) is not None
+
+    async def count(self) -> int:
+        self._purge_expired(time.monotonic())
+        return len(self._items)
+
+
+class RedisSessionStore(SessionStore):
+    """Redis 세션 저장소 (여러 uvicorn 워커가 공유)
+
+    세션 본문은 만료 시간이 있는 문자열 키에, 마지막 접근 시각은 정렬 집합에 저장해
+    용량을 넘으면 가장 오래 쓰지 않은 세션부터 제거합니다.
+    """
+
+    backend = "redis"
+
+    def __init__(self, max_sessions: int, ttl_seconds: float, prefix: str = "carebridge:session"):
+        super().__init__(max_sessions, ttl_seconds)
+        self.prefix = prefix
+        self._index_key = f"{prefix}:lru"
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.prefix}:{session_id}"
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        client = get_redis()
+        raw = await client.getex(self._key(session_id), ex=int(self.ttl))
+        if raw is None:
+            self.misses += 1
+            # 만료된 세션이 인덱스에 남아 있으면 정리
+            if await client.zrem(self._index_key, session_id):
+                self.evictions_ttl += 1
+            return None
+
+        self.hits += 1
+        await client.zadd(self._index_key, {session_id: time.time()})
+        return json.loads(raw)
+
+    async def put(self, session_id: str, data: Dict[str, Any]) -> None:
+        client = get_redis()
+        now = time.time()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(session_id), json.dumps(data, ensure_ascii=False), ex=int(self.ttl))
+            # TTL로 이미 사라진 세션은 인덱스에서도 제거
+            pipe.zremrangebyscore(self._index_key, "-inf", now - self.ttl)
+            pipe.zadd(self._index_key, {session_id: now})
+            pipe.zcard(self._index_key)
+            _, expired, _, size = await pipe.execute()
+        self.evictions_ttl += expired
+
+        overflow = size - self.max_sessions
+        if overflow > 0:
+            evicted = await client.zpopmin(self._index_key, overflow)
+            if evicted:
+                await client.delete(*(self._key(sid) for sid, _ in evicted))
+                self.evictions_lru += len(evicted)
+
+    async def delete(self, session_id: str) -> bool:
+        client = get_redis()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.delete(self._key(session_id))
+            pipe.zrem(self._index_key, session_id)
+            deleted, _ = await pipe.execute()
+        return bool(deleted)
+
+    async def count(self) -> int:
+        return await get_redis().zcard(self._index_key)
+
+
+def create_session_store() -> SessionStore:
+    """설정에 맞는 세션 저장소 생성"""
+    backend = settings.SESSION_STORE_BACKEND.lower()
+    if backend == "redis":
+        return RedisSessionStore(settings.SESSION_MAX_SESSIONS, settings.SESSION_TTL_SECONDS)
+    return InMemorySessionStore(settings.SESSION_MAX_SESSIONS, settings.SESSION_TTL_SECONDS)
+
+
+# 싱글톤 인스턴스
+session_store = create_session_store()
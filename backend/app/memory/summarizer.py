@@ -0,0 +1,216 @@
+"""
+AI 케어브릿지 - 대화 롤링 요약
+오래된 대화를 백그라운드에서 누적 요약으로 접어 넣습니다.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, RemoveMessage, SystemMessage
+from app.config import settings
+from app.agents.context import estimate_tokens, message_tokens
+from app.agents.llm import get_llm
+from app.agents.prompts.summary import SUMMARY_SYSTEM_PROMPT, SUMMARY_USER_PROMPT
+from app.utils.stats import RollingWindow
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ConversationSummarizer:
+    """세션별 롤링 요약기
+
+    턴이 끝날 때 메시지 토큰 합이 SUMMARY_TRIGGER_TOKENS를 넘으면
+    최근 SUMMARY_KEEP_TURNS턴을 제외한 앞부분을 기존 요약과 합쳐 새 요약을 만듭니다.
+    요약은 응답 경로 밖에서 실행되고, 끝나면 체크포인터에 바로 반영합니다
+    (summary 갱신 + 요약된 메시지 삭제). 체크포인트는 Redis 등으로 공유되므로
+    다음 턴을 다른 워커가 처리해도 요약이 보입니다.
+
+    요약하는 동안 새 턴이 시작되었거나 저장되었으면 체크포인트를 덮어쓰지 않습니다.
+    그런 결과와 체크포인터 반영에 실패한 결과는 프로세스 안에 잠시 보관했다가
+    다음 턴의 memory_load가 그래프 안에서 반영합니다.
+    보관은 SUMMARY_PENDING_MAX개, 세션 만료 시간까지입니다.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._results: "OrderedDict[str, Tuple[float, str, List[str]]]" = OrderedDict()
+        self.applied = 0
+        self.deferred = 0
+        self.expired = 0
+
+        self.runs = 0
+        self.failures = 0
+        self.folded_messages = 0
+        self.folded_tokens = 0
+        self.run_time = RollingWindow()
+
+    def _split(self, messages: List[BaseMessage]) -> List[BaseMessage]:
+        """요약으로 접을 앞부분 메시지 (필요 없으면 빈 목록)"""
+        conversation = [m for m in messages if isinstance(m, (HumanMessage, AIMessage)) and m.id]
+        if message_tokens(conversation) <= settings.SUMMARY_TRIGGER_TOKENS:
+            return []
+        keep = settings.SUMMARY_KEEP_TURNS * 2
+        return conversation[:-keep] if keep else conversation
+
+    def maybe_schedule(self, session_id: str, messages: List[BaseMessage], summary: Optional[str]) -> bool:
+        """예산 초과 시 백그라운드 요약 시작 (이미 진행 중이거나 반영 대기 중이면 건너뜀)"""
+        if not settings.SUMMARY_ENABLED or not session_id:
+            return False
+        if self._pending(session_id) is not None:
+            return False
+        task = self._tasks.get(session_id)
+        if task is not None and not task.done():
+            return False
+
+        older = self._split(messages)
+        if not older:
+            return False
+
+        # 요약을 반영할 때 스레드가 이 시점 그대로인지 확인하는 기준 (마지막 메시지)
+        last_id = messages[-1].id
+        task = asyncio.create_task(self._summarize(session_id, older, summary, last_id))
+        self._tasks[session_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(session_id, None))
+        return True
+
+    async def _summarize(
+        self,
+        session_id: str,
+        older: List[BaseMessage],
+        summary: Optional[str],
+        last_id: Optional[str]
+    ) -> None:
+        """기존 요약 + 오래된 대화 → 새 요약"""
+        started = time.perf_counter()
+        self.runs += 1
+
+        lines = []
+        for message in older:
+            speaker = "어르신" if isinstance(message, HumanMessage) else "케어"
+            lines.append(f"{speaker}: {message.content}")
+
+        max_chars = settings.SUMMARY_MAX_TOKENS * 2
+        try:
+            llm = get_llm("summary", temperature=0.2)
+            response = await llm.ainvoke([
+                SystemMessage(content=SUMMARY_SYSTEM_PROMPT.format(max_chars=max_chars)),
+                HumanMessage(content=SUMMARY_USER_PROMPT.format(
+                    summary=summary or "없음",
+                    conversation="\n".join(lines)
+                ))
+            ])
+            new_summary = response.content.strip()[:max_chars]
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"대화 요약 실패 - Session: {session_id}: {e}")
+            return
+
+        if not new_summary:
+            self.failures += 1
+            return
+
+        folded_ids = [m.id for m in older]
+        if await self._apply(session_id, new_summary, folded_ids, summary, last_id):
+            self.applied += 1
+        else:
+            self._keep(session_id, new_summary, folded_ids)
+        self.folded_messages += len(older)
+        self.folded_tokens += message_tokens(older)
+        self.run_time.add(time.perf_counter() - started)
+        logger.info(f"대화 요약 완료 - Session: {session_id}, Folded: {len(older)}, Summary: ~{estimate_tokens(new_summary)} tokens")
+
+    async def _apply(
+        self,
+        session_id: str,
+        summary: str,
+        folded_ids: List[str],
+        base_summary: Optional[str],
+        last_id: Optional[str]
+    ) -> bool:
+        """요약을 세션 체크포인트에 반영 (memory_save가 쓴 것처럼 기록하므로 이어서 실행되는 노드 없음)
+
+        요약을 시작한 턴 이후 스레드가 바뀌었으면 (다음 턴 실행 중이거나 이미 저장됨)
+        그 체크포인트 위에 덮어쓰지 않고 False를 반환합니다.
+        """
+        # 그래프가 이 모듈을 import하므로 실행 시점에 가져옴
+        from app.agents.graph import get_agent_graph, thread_config
+
+        try:
+            graph = get_agent_graph()
+            config = thread_config(session_id)
+            snapshot = await graph.aget_state(config)
+            messages = snapshot.values.get("messages", [])
+            if (
+                snapshot.next
+                or not messages
+                or messages[-1].id != last_id
+                or (snapshot.values.get("summary") or None) != (base_summary or None)
+            ):
+                self.deferred += 1
+                logger.info(f"대화 요약 중 새 턴 진행, 다음 턴에 반영 - Session: {session_id}")
+                return False
+            existing = {m.id for m in messages}
+            await graph.aupdate_state(
+                config,
+                {
+                    "summary": summary,
+                    "messages": [RemoveMessage(id=mid) for mid in folded_ids if mid in existing]
+                },
+                as_node="memory_save"
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"대화 요약 체크포인트 반영 실패, 다음 턴에 반영 - Session: {session_id}: {e}")
+            return False
+
+    def _keep(self, session_id: str, summary: str, folded_ids: List[str]) -> None:
+        """체크포인터에 반영하지 못한 결과 보관 (가장 오래된 것부터 버림)"""
+        self._results[session_id] = (time.monotonic(), summary, folded_ids)
+        self._results.move_to_end(session_id)
+        while len(self._results) > settings.SUMMARY_PENDING_MAX:
+            self._results.popitem(last=False)
+            self.expired += 1
+
+    def _pending(self, session_id: str) -> Optional[Tuple[float, str, List[str]]]:
+        entry = self._results.get(session_id)
+        if entry is not None and time.monotonic() - entry[0] > settings.SESSION_TTL_SECONDS:
+            # 세션이 만료되어 다음 턴이 오지 않은 결과
+            del self._results[session_id]
+            self.expired += 1
+            return None
+        return entry
+
+    def take(self, session_id: str) -> Optional[Tuple[str, List[str]]]:
+        """반영 대기 중인 요약 결과 (새 요약, 삭제할 메시지 ID 목록)"""
+        entry = self._pending(session_id)
+        if entry is None:
+            return None
+        del self._results[session_id]
+        return entry[1], entry[2]
+
+    async def close(self) -> None:
+        """진행 중인 요약 취소"""
+        for task in list(self._tasks.values()):
+            task.cancel()
+        self._tasks.clear()
+
+    def stats(self) -> dict:
+        """요약 실행 통계"""
+        return {
+            "enabled": settings.SUMMARY_ENABLED,
+            "runs": self.runs,
+            "failures": self.failures,
+            "in_progress": len(self._tasks),
+            "applied": self.applied,
+            "deferred": self.deferred,
+            "pending_apply": len(self._results),
+            "expired": self.expired,
+            "folded_messages": self.folded_messages,
+            "folded_tokens": self.folded_tokens,
+            "run_ms": self.run_time.summary(scale=1000.0)
+        }
+
+
+# 싱글톤 인스턴스
+conversation_summarizer = ConversationSummarizer()
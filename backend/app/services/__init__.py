@@ -3,6 +3,7 @@ AI 케어브릿지 - 서비스 모듈
 """
 from app.services.vectorstore import vectorstore_service
 from app.services.embedding import embedding_service
+from app.services.catalog import program_catalog
 from app.services.rag import rag_service
 from app.services.stt import stt_service
 from app.services.tts import tts_service
@@ -10,6 +11,7 @@ from app.services.tts import tts_service
 __all__ = [
     "vectorstore_service",
     "embedding_service",
+    "program_catalog",
     "rag_service",
     "stt_service",
     "tts_service"
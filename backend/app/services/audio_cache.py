@@ -0,0 +1,186 @@
+"""
+AI 케어브릿지 - TTS 오디오 캐시
+(제공자, 음성, 속도, 형식, 텍스트) sha256 키의 디스크 캐시 + 메모리 LRU
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES: Dict[str, str] = {
+    "mp3": "audio/mpeg",
+    "opus": "audio/opus",
+    "aac": "audio/aac",
+    "flac": "audio/flac",
+    "wav": "audio/wav"
+}
+
+
+def make_key(provider: str, voice: str, speed: float, response_format: str, text: str) -> str:
+    """콘텐츠 주소 키 (hex, ETag로도 사용)"""
+    raw = f"{provider}\0{voice}\0{speed:.2f}\0{response_format}\0{text.strip()}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def media_type_of(response_format: str) -> str:
+    return MEDIA_TYPES.get(response_format, "audio/mpeg")
+
+
+class AudioCache:
+    """합성 오디오 캐시
+
+    - 메모리: 최근 사용 클립 LRU (max_memory_bytes)
+    - 디스크: 클립마다 파일 하나 ({dir}/{key[:2]}/{key}.{format})
+    - 디스크 용량이 max_bytes를 넘으면 오래 안 쓴 파일부터 삭제
+      (사용 순서는 파일 mtime으로 남겨 재시작 후에도 유지)
+    """
+
+    def __init__(self, directory: str, max_bytes: int, max_memory_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_memory_bytes = max_memory_bytes
+
+        self._memory: "OrderedDict[str, Tuple[bytes, str]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: Optional["OrderedDict[str, Tuple[int, str]]"] = None
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, key: str, response_format: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.{response_format}")
+
+    def _index(self) -> "OrderedDict[str, Tuple[int, str]]":
+        """디스크 색인 (최초 1회 디렉터리 스캔, 오래 안 쓴 순서)"""
+        if self._disk is None:
+            entries = []
+            if os.path.isdir(self.directory):
+                for shard in os.scandir(self.directory):
+                    if not shard.is_dir():
+                        continue
+                    for entry in os.scandir(shard.path):
+                        key, _, response_format = entry.name.partition(".")
+                        if not response_format or response_format.endswith(".tmp"):
+                            continue
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, key, stat.st_size, response_format))
+            entries.sort()
+            self._disk = OrderedDict((key, (size, fmt)) for _, key, size, fmt in entries)
+            self._disk_bytes = sum(size for _, _, size, _ in entries)
+            logger.info(f"TTS 오디오 캐시 열기: {self.directory} ({len(self._disk)}개, {self._disk_bytes} bytes)")
+        return self._disk
+
+    def _remember(self, key: str, data: bytes, response_format: str) -> None:
+        """메모리 LRU에 저장 (메모리 한도의 1/4보다 큰 클립은 제외)"""
+        if len(data) > self.max_memory_bytes // 4:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous[0])
+        self._memory[key] = (data, response_format)
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, (evicted, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        """캐시 조회 → (오디오, 형식) 또는 None"""
+        with self._lock:
+            item = self._memory.get(key)
+            if item is not None:
+                self._memory.move_to_end(key)
+                self.hits_memory += 1
+                return item
+
+            index = self._index()
+            entry = index.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            _, response_format = entry
+            path = self._path(key, response_format)
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.utime(path)
+            except OSError as e:
+                # 외부에서 지워진 파일은 색인에서도 제거
+                logger.warning(f"TTS 오디오 캐시 읽기 실패: {e}")
+                index.pop(key, None)
+                self._disk_bytes -= entry[0]
+                self.misses += 1
+                return None
+
+            index.move_to_end(key)
+            self._remember(key, data, response_format)
+            self.hits_disk += 1
+            return data, response_format
+
+    def put(self, key: str, data: bytes, response_format: str) -> None:
+        """캐시 저장 (임시 파일에 쓴 뒤 교체해 읽는 쪽이 잘린 파일을 보지 않음)"""
+        if not data:
+            return
+
+        with self._lock:
+            self._remember(key, data, response_format)
+            index = self._index()
+
+            path = self._path(key, response_format)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"TTS 오디오 캐시 저장 실패: {e}")
+                return
+
+            previous = index.pop(key, None)
+            if previous is not None:
+                self._disk_bytes -= previous[0]
+            index[key] = (len(data), response_format)
+            self._disk_bytes += len(data)
+            if self._disk_bytes > self.max_bytes:
+                self._evict(index)
+
+    def _evict(self, index: "OrderedDict[str, Tuple[int, str]]") -> None:
+        """용량 초과 시 오래 안 쓴 파일 삭제 (용량의 90%까지)"""
+        target = int(self.max_bytes * 0.9)
+        while self._disk_bytes > target and index:
+            key, (size, response_format) = index.popitem(last=False)
+            try:
+                os.remove(self._path(key, response_format))
+            except OSError:
+                pass
+            self._disk_bytes -= size
+            cached = self._memory.pop(key, None)
+            if cached is not None:
+                self._memory_bytes -= len(cached[0])
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """캐시 적중/미스 통계"""
+        lookups = self.hits_memory + self.hits_disk + self.misses
+        return {
+            "hits_memory": self.hits_memory,
+            "hits_disk": self.hits_disk,
+            "misses": self.misses,
+            "hit_rate": round((self.hits_memory + self.hits_disk) / lookups, 4) if lookups else 0.0,
+            "memory_items": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_items": len(self._disk) if self._disk is not None else None,
+            "disk_bytes": self._disk_bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions
+        }
+
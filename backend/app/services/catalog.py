@@ -0,0 +1,206 @@
+"""
+AI 케어브릿지 - 복지 프로그램 카탈로그
+welfare_programs.json을 한 번만 읽어 메모리 인덱스로 유지합니다.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import List, Dict, Any, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "data", "welfare_programs.json")
+
+# 파일 변경 확인 최소 간격 (초) - 매 조회마다 stat 호출 방지
+RELOAD_CHECK_INTERVAL = 1.0
+
+
+@dataclass
+class SearchResult:
+    """검색 결과"""
+    program_id: str
+    name: str
+    category: str
+    description: str
+    benefit: str
+    eligibility: List[str]
+    how_to_apply: str
+    contact: str
+    score: float  # 유사도 점수 (낮을수록 유사)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """카탈로그 스냅샷 (불변, 통째로 교체됨)"""
+    programs: List[Dict[str, Any]] = field(default_factory=list)
+    programs_by_id: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    ids_by_category: Dict[str, List[str]] = field(default_factory=dict)
+    results_by_id: Dict[str, SearchResult] = field(default_factory=dict)
+    context_by_id: Dict[str, str] = field(default_factory=dict)
+    categories: List[str] = field(default_factory=list)
+    mtime: float = 0.0
+    size: int = 0
+    digest: str = ""
+
+
+def _build_result(program: Dict[str, Any]) -> SearchResult:
+    """프로그램 원본으로 검색 결과 페이로드 생성"""
+    return SearchResult(
+        program_id=program.get("id", ""),
+        name=program.get("name", ""),
+        category=program.get("category", ""),
+        description=program.get("description", ""),
+        benefit=program.get("benefit", ""),
+        eligibility=program.get("eligibility", []),
+        how_to_apply=program.get("how_to_apply", ""),
+        contact=program.get("contact", ""),
+        score=0.0
+    )
+
+
+def _build_context_block(result: SearchResult) -> str:
+    """LLM 컨텍스트용 프로그램 설명 블록 (번호 제외)"""
+    return "\n".join([
+        f"분류: {result.category}",
+        f"설명: {result.description}",
+        f"혜택: {result.benefit}",
+        f"자격요건: {', '.join(result.eligibility)}",
+        f"신청방법: {result.how_to_apply}",
+        f"문의: {result.contact}"
+    ])
+
+
+class ProgramCatalog:
+    """복지 프로그램 메모리 카탈로그
+
+    파일의 mtime/크기가 바뀌면 해시를 비교해 새 스냅샷을 만들고
+    참조를 한 번에 교체합니다. 조회는 항상 하나의 일관된 스냅샷을 봅니다.
+    """
+
+    def __init__(self, data_file: str = DATA_FILE):
+        self.data_file = os.path.normpath(data_file)
+        self._snapshot = CatalogSnapshot()
+        self._lock = threading.Lock()
+        self._last_check = float("-inf")
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        """현재 스냅샷 (필요 시 재로드)"""
+        now = time.monotonic()
+        if now - self._last_check >= RELOAD_CHECK_INTERVAL:
+            self._last_check = now
+            self._reload_if_changed()
+        return self._snapshot
+
+    def _reload_if_changed(self) -> None:
+        """파일 변경 시 스냅샷 재생성"""
+        try:
+            stat = os.stat(self.data_file)
+        except FileNotFoundError:
+            if self._snapshot.digest:
+                logger.warning(f"데이터 파일 없음: {self.data_file}")
+            return
+
+        current = self._snapshot
+        if stat.st_mtime == current.mtime and stat.st_size == current.size:
+            return
+
+        with self._lock:
+            current = self._snapshot
+            if stat.st_mtime == current.mtime and stat.st_size == current.size:
+                return
+
+            with open(self.data_file, "rb") as f:
+                raw = f.read()
+            digest = hashlib.sha256(raw).hexdigest()
+
+            if digest == current.digest:
+                # 내용은 같고 mtime만 바뀐 경우
+                self._snapshot = replace(current, mtime=stat.st_mtime, size=stat.st_size)
+                return
+
+            try:
+                data = json.loads(raw.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                # 편집 중인 파일 등 - 기존 스냅샷 유지
+                logger.error(f"카탈로그 파싱 실패, 기존 데이터 유지: {e}")
+                return
+
+            self._snapshot = self._build_snapshot(data, stat.st_mtime, stat.st_size, digest)
+            logger.info(f"복지 카탈로그 로드 완료: {len(self._snapshot.programs)}개 프로그램")
+
+    def _build_snapshot(
+        self,
+        data: Dict[str, Any],
+        mtime: float,
+        size: int,
+        digest: str
+    ) -> CatalogSnapshot:
+        """원본 데이터로 인덱스 생성"""
+        programs = [p for p in data.get("programs", []) if p.get("id")]
+
+        programs_by_id: Dict[str, Dict[str, Any]] = {}
+        ids_by_category: Dict[str, List[str]] = {}
+        results_by_id: Dict[str, SearchResult] = {}
+        context_by_id: Dict[str, str] = {}
+
+        for program in programs:
+            program_id = program["id"]
+            programs_by_id[program_id] = program
+            if cat := program.get("category"):
+                ids_by_category.setdefault(cat, []).append(program_id)
+            result = _build_result(program)
+            results_by_id[program_id] = result
+            context_by_id[program_id] = _build_context_block(result)
+
+        return CatalogSnapshot(
+            programs=programs,
+            programs_by_id=programs_by_id,
+            ids_by_category=ids_by_category,
+            results_by_id=results_by_id,
+            context_by_id=context_by_id,
+            categories=sorted(ids_by_category.keys()),
+            mtime=mtime,
+            size=size,
+            digest=digest
+        )
+
+    def get_programs(self) -> List[Dict[str, Any]]:
+        """전체 프로그램 목록"""
+        return self.snapshot.programs
+
+    def get_program(self, program_id: str) -> Optional[Dict[str, Any]]:
+        """ID로 프로그램 원본 조회"""
+        return self.snapshot.programs_by_id.get(program_id)
+
+    def get_result(self, program_id: str, score: float) -> Optional[SearchResult]:
+        """미리 만든 검색 결과 페이로드에 점수만 채워 반환"""
+        result = self.snapshot.results_by_id.get(program_id)
+        if result is None:
+            return None
+        return replace(result, score=score)
+
+    def get_context_block(self, program_id: str) -> str:
+        """LLM 컨텍스트용 프로그램 설명 블록"""
+        return self.snapshot.context_by_id.get(program_id, "")
+
+    def get_ids_by_category(self, category: str) -> List[str]:
+        """카테고리별 프로그램 ID 목록"""
+        return self.snapshot.ids_by_category.get(category, [])
+
+    def get_categories(self) -> List[str]:
+        """모든 카테고리 목록 (정렬됨)"""
+        return self.snapshot.categories
+
+    @property
+    def digest(self) -> str:
+        """현재 데이터 해시 (인덱스 무효화 판단용)"""
+        return self.snapshot.digest
+
+
+# 싱글톤 인스턴스
+program_catalog = ProgramCatalog()
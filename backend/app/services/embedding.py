@@ -2,13 +2,21 @@
 AI 케어브릿지 - 임베딩 서비스
 Upstage Solar Embedding 또는 로컬 모델 사용
 """
+import asyncio
 import os
-from typing import List, Optional
+import threading
+from typing import List, Optional, Tuple
 from app.config import settings
+from app.services.embedding_cache import EmbeddingCache
+from app.services.embedding_batcher import EmbeddingBatcher
+from app.services.inference import inference_executor, InferenceQueueFull
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 더미 임베딩 모델명 (캐시하지 않음)
+DUMMY_MODEL = "dummy"
+
 
 class EmbeddingService:
     """텍스트 임베딩 서비스"""
@@ -18,6 +26,39 @@ class EmbeddingService:
         self.model = "solar-embedding-1-large"
         self._upstage_embeddings = None
         self._local_model = None
+        self._local_model_lock = threading.Lock()
+        self.provider_calls = 0
+        self.last_model: Optional[str] = None
+
+        self._cache: Optional[EmbeddingCache] = None
+        if settings.EMBEDDING_CACHE_ENABLED:
+            self._cache = EmbeddingCache(
+                path=settings.EMBEDDING_CACHE_PATH,
+                max_bytes=settings.EMBEDDING_CACHE_MAX_MB * 1024 * 1024,
+                max_memory_items=settings.EMBEDDING_CACHE_MEMORY_ITEMS
+            )
+
+        self._batcher: Optional[EmbeddingBatcher] = None
+        if settings.EMBEDDING_BATCH_ENABLED:
+            self._batcher = EmbeddingBatcher(
+                batch_fn=self._embed_and_store,
+                window_ms=settings.EMBEDDING_BATCH_WINDOW_MS,
+                max_batch_size=settings.EMBEDDING_BATCH_MAX_SIZE
+            )
+
+    def _use_upstage(self) -> bool:
+        """Upstage API 사용 여부"""
+        return bool(self.api_key) and self.api_key != "your_upstage_api_key"
+
+    @property
+    def active_model(self) -> str:
+        """현재 우선 사용되는 임베딩 모델명 (캐시 키)"""
+        return self.model if self._use_upstage() else settings.EMBEDDING_MODEL
+
+    @property
+    def degraded(self) -> bool:
+        """마지막 제공자 호출이 더미 임베딩으로 떨어졌는지 여부 (유사도 판단 불가)"""
+        return self.last_model == DUMMY_MODEL
 
     def _get_upstage_embeddings(self):
         """Upstage 임베딩 인스턴스 반환"""
@@ -35,59 +76,108 @@ class EmbeddingService:
         return self._upstage_embeddings
 
     async def embed_text(self, text: str) -> List[float]:
-        """단일 텍스트 임베딩"""
-        embeddings = await self.embed_texts([text])
-        return embeddings[0] if embeddings else []
+        """단일 텍스트 임베딩 (동시 요청은 배치로 병합)"""
+        if self._batcher is None:
+            embeddings = await self.embed_texts([text])
+            return embeddings[0] if embeddings else []
+
+        # 캐시 적중은 배치 대기 없이 바로 반환 (SQLite 조회는 이벤트 루프 밖에서)
+        if self._cache is not None:
+            cached = (await asyncio.to_thread(self._cache.get_many, self.active_model, [text]))[0]
+            if cached is not None:
+                return cached
+
+        return await self._batcher.submit(text)
 
     async def embed_texts(self, texts: List[str]) -> List[List[float]]:
-        """여러 텍스트 임베딩"""
+        """여러 텍스트 임베딩 (캐시 적중 시 제공자 호출 생략)"""
         if not texts:
             return []
 
-        # API 키가 있으면 Upstage API 사용
-        if self.api_key and self.api_key != "" and self.api_key != "your_upstage_api_key":
-            return await self._embed_with_upstage(texts)
+        if self._cache is None:
+            return await self._embed_and_store(texts)
 
-        # 없으면 로컬 모델 사용
-        return self._embed_with_local(texts)
+        model = self.active_model
+        results = await asyncio.to_thread(self._cache.get_many, model, texts)
 
-    async def _embed_with_upstage(self, texts: List[str]) -> List[List[float]]:
-        """Upstage API로 임베딩 (langchain-upstage 사용)"""
-        try:
-            embeddings_model = self._get_upstage_embeddings()
-            if embeddings_model is None:
-                return self._embed_with_local(texts)
+        # 캐시 미스 텍스트만 (중복 제거 후) 임베딩
+        missing = list(dict.fromkeys(t for t, v in zip(texts, results) if v is None))
+        if not missing:
+            return results
 
-            # 비동기 임베딩
-            embeddings = await embeddings_model.aembed_documents(texts)
-            logger.info(f"Upstage 임베딩 성공: {len(texts)}개 텍스트")
-            return embeddings
+        embeddings = await self._embed_and_store(missing)
+        computed = dict(zip(missing, embeddings))
+        return [v if v is not None else computed[t] for t, v in zip(texts, results)]
 
-        except Exception as e:
-            logger.error(f"Upstage 임베딩 실패: {e}")
-            # 폴백: 로컬 모델
-            return self._embed_with_local(texts)
+    async def _embed_and_store(self, texts: List[str]) -> List[List[float]]:
+        """제공자로 임베딩 후 캐시에 저장"""
+        embeddings, used_model = await self._embed_uncached(texts)
+        self.last_model = used_model
+        if self._cache is not None and used_model != DUMMY_MODEL:
+            await asyncio.to_thread(self._cache.put_many, used_model, texts, embeddings)
+        return embeddings
 
-    def _embed_with_local(self, texts: List[str]) -> List[List[float]]:
-        """로컬 모델로 임베딩 (sentence-transformers)"""
-        try:
-            if self._local_model is None:
-                from sentence_transformers import SentenceTransformer
-                model_name = settings.EMBEDDING_MODEL
-                logger.info(f"로컬 임베딩 모델 로딩: {model_name}")
-                self._local_model = SentenceTransformer(model_name)
-
-            embeddings = self._local_model.encode(
-                texts,
-                normalize_embeddings=True,
-                show_progress_bar=False
-            )
-            return embeddings.tolist()
+    async def _embed_uncached(self, texts: List[str]) -> Tuple[List[List[float]], str]:
+        """제공자로 임베딩 (실제 사용된 모델명과 함께 반환)"""
+        self.provider_calls += 1
+
+        # API 키가 있으면 Upstage API 사용
+        if self._use_upstage():
+            try:
+                return await self._embed_with_upstage(texts), self.model
+            except Exception as e:
+                logger.error(f"Upstage 임베딩 실패: {e}")
 
+        # 없거나 실패하면 로컬 모델 사용 (워커 풀에서 실행)
+        try:
+            embeddings = await inference_executor.run(self._embed_with_local, texts)
+            return embeddings, settings.EMBEDDING_MODEL
+        except InferenceQueueFull:
+            # 과부하 시 더미 벡터로 검색을 오염시키지 않고 호출자에게 알림
+            raise
         except Exception as e:
             logger.error(f"로컬 임베딩 실패: {e}")
             # 최후의 폴백: 더미 임베딩
-            return self._dummy_embedding(texts)
+            return self._dummy_embedding(texts), DUMMY_MODEL
+
+    async def _embed_with_upstage(self, texts: List[str]) -> List[List[float]]:
+        """Upstage API로 임베딩 (langchain-upstage 사용)"""
+        embeddings_model = self._get_upstage_embeddings()
+        if embeddings_model is None:
+            raise RuntimeError("Upstage 임베딩 인스턴스 없음")
+
+        # 비동기 임베딩
+        embeddings = await embeddings_model.aembed_documents(texts)
+        logger.info(f"Upstage 임베딩 성공: {len(texts)}개 텍스트")
+        return embeddings
+
+    def _embed_with_local(self, texts: List[str]) -> List[List[float]]:
+        """로컬 모델로 임베딩 (sentence-transformers, 워커 스레드에서 호출)"""
+        if self._local_model is None:
+            # 여러 워커가 동시에 첫 호출을 해도 모델은 한 번만 로드
+            with self._local_model_lock:
+                if self._local_model is None:
+                    from sentence_transformers import SentenceTransformer
+                    model_name = settings.EMBEDDING_MODEL
+                    logger.info(f"로컬 임베딩 모델 로딩: {model_name}")
+                    self._local_model = SentenceTransformer(model_name)
+
+        embeddings = self._local_model.encode(
+            texts,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        return embeddings.tolist()
+
+    def cache_stats(self) -> dict:
+        """임베딩 캐시 통계"""
+        stats = self._cache.stats() if self._cache else {"enabled": False}
+        stats["provider_calls"] = self.provider_calls
+        return stats
+
+    def batch_stats(self) -> dict:
+        """마이크로 배칭 통계"""
+        return self._batcher.stats() if self._batcher else {"enabled": False}
 
     def _dummy_embedding(self, texts: List[str], dim: int = 1024) -> List[List[float]]:
         """테스트용 더미 임베딩"""
@@ -0,0 +1,90 @@
+"""
+AI 케어브릿지 - 임베딩 마이크로 배칭
+짧은 시간 안에 들어온 단일 텍스트 요청을 모아 한 번에 임베딩합니다.
+"""
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+BatchFn = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+class EmbeddingBatcher:
+    """동시 임베딩 요청 병합기
+
+    첫 요청이 들어오면 window_ms 동안 기다렸다가(또는 max_batch_size가 차면 즉시)
+    모인 텍스트를 batch_fn 한 번으로 처리하고 결과를 각 요청자에게 나눠줍니다.
+    """
+
+    def __init__(self, batch_fn: BatchFn, window_ms: float = 5.0, max_batch_size: int = 32):
+        self.batch_fn = batch_fn
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.batches = 0
+        self.items = 0
+        self.max_observed_batch = 0
+
+    async def submit(self, text: str) -> List[float]:
+        """텍스트 하나를 배치에 넣고 결과 벡터를 기다림"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """대기 중인 요청을 배치로 떼어내 실행"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size:]
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """배치 임베딩 후 결과 분배"""
+        # 같은 텍스트는 한 번만 임베딩
+        texts = list(dict.fromkeys(text for text, _ in batch))
+
+        self.batches += 1
+        self.items += len(batch)
+        self.max_observed_batch = max(self.max_observed_batch, len(batch))
+
+        try:
+            vectors = await self.batch_fn(texts)
+            by_text = dict(zip(texts, vectors))
+            for text, future in batch:
+                if not future.done():
+                    future.set_result(by_text[text])
+        except Exception as e:
+            logger.error(f"배치 임베딩 실패 ({len(texts)}개): {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    def stats(self) -> dict:
+        """배칭 통계"""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_observed_batch,
+            "window_ms": self.window * 1000.0,
+            "max_batch_limit": self.max_batch_size
+        }
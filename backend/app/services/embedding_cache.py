@@ -0,0 +1,212 @@
+"""
+AI 케어브릿지 - 임베딩 캐시
+(모델명, 텍스트 sha256) 키의 디스크 캐시 + 메모리 LRU
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Dict
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 정리할 최대 행 수
+EVICTION_BATCH = 256
+
+# SQLite IN 절 변수 개수 제한 대응
+QUERY_CHUNK = 500
+
+
+def make_key(model: str, text: str) -> bytes:
+    """콘텐츠 주소 키 (32바이트)"""
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """임베딩 벡터 캐시
+
+    - 메모리: 최근 사용 벡터 LRU (max_memory_items)
+    - 디스크: SQLite 단일 파일, 벡터는 float32 바이너리(BLOB)
+    - 디스크 용량이 max_bytes를 넘으면 오래 안 쓴 항목부터 삭제
+    """
+
+    def __init__(self, path: str, max_bytes: int, max_memory_items: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_memory_items = max_memory_items
+
+        self._memory: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_bytes = 0
+
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 (최초 1회)"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key BLOB PRIMARY KEY,"
+                " vector BLOB NOT NULL,"
+                " last_used REAL NOT NULL"
+                ")"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)")
+            row = conn.execute("SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings").fetchone()
+            self._disk_bytes = row[0]
+            self._conn = conn
+            logger.info(f"임베딩 캐시 열기: {self.path} ({self._disk_bytes} bytes)")
+        return self._conn
+
+    def _remember(self, key: bytes, vector: List[float]) -> None:
+        """메모리 LRU에 저장"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """캐시 조회 (없는 항목은 None)"""
+        keys = [make_key(model, text) for text in texts]
+        results: List[Optional[List[float]]] = [None] * len(texts)
+
+        with self._lock:
+            disk_lookup: Dict[bytes, List[int]] = {}
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    results[i] = vector
+                    self.hits_memory += 1
+                else:
+                    disk_lookup.setdefault(key, []).append(i)
+
+            if not disk_lookup:
+                return results
+
+            try:
+                conn = self._connect()
+                lookup_keys = list(disk_lookup.keys())
+                rows = []
+                for start in range(0, len(lookup_keys), QUERY_CHUNK):
+                    chunk = lookup_keys[start:start + QUERY_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows.extend(conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        chunk
+                    ).fetchall())
+
+                now = time.time()
+                for key, blob in rows:
+                    vector = array("f", blob).tolist()
+                    self._remember(key, vector)
+                    for i in disk_lookup.pop(key):
+                        results[i] = vector
+                        self.hits_disk += 1
+
+                if rows:
+                    conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                        [(now, key) for key, _ in rows]
+                    )
+                    conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"임베딩 캐시 조회 실패: {e}")
+
+            self.misses += sum(len(idx) for idx in disk_lookup.values())
+
+        return results
+
+    def put_many(self, model: str, texts: List[str], vectors: List[List[float]]) -> None:
+        """캐시 저장"""
+        if not texts:
+            return
+
+        now = time.time()
+        rows = []
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                key = make_key(model, text)
+                self._remember(key, list(vector))
+                rows.append((key, array("f", vector).tobytes(), now))
+
+            try:
+                conn = self._connect()
+                # 덮어쓰는 기존 항목 크기를 빼서 용량 집계를 맞춤
+                replaced = 0
+                for start in range(0, len(rows), QUERY_CHUNK):
+                    chunk = [row[0] for row in rows[start:start + QUERY_CHUNK]]
+                    placeholders = ",".join("?" * len(chunk))
+                    replaced += conn.execute(
+                        f"SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings WHERE key IN ({placeholders})",
+                        chunk
+                    ).fetchone()[0]
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                    rows
+                )
+                self._disk_bytes += sum(len(row[1]) for row in rows) - replaced
+                if self._disk_bytes > self.max_bytes:
+                    self._evict(conn)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"임베딩 캐시 저장 실패: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """용량 초과 시 오래 안 쓴 항목 삭제 (용량의 90%까지)"""
+        target = int(self.max_bytes * 0.9)
+        while self._disk_bytes > target:
+            rows = conn.execute(
+                "SELECT key, LENGTH(vector) FROM embeddings ORDER BY last_used LIMIT ?",
+                (EVICTION_BATCH,)
+            ).fetchall()
+            if not rows:
+                self._disk_bytes = 0
+                break
+
+            evict_keys = []
+            for key, size in rows:
+                evict_keys.append((key,))
+                self._disk_bytes -= size
+                if self._disk_bytes <= target:
+                    break
+
+            conn.executemany("DELETE FROM embeddings WHERE key = ?", evict_keys)
+            for (key,) in evict_keys:
+                self._memory.pop(key, None)
+            self.evictions += len(evict_keys)
+
+    def stats(self) -> dict:
+        """캐시 적중/미스 통계"""
+        lookups = self.hits_memory + self.hits_disk + self.misses
+        return {
+            "hits_memory": self.hits_memory,
+            "hits_disk": self.hits_disk,
+            "misses": self.misses,
+            "hit_rate": round((self.hits_memory + self.hits_disk) / lookups, 4) if lookups else 0.0,
+            "memory_items": len(self._memory),
+            "disk_bytes": self._disk_bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions
+        }
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
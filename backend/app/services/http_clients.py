@@ -0,0 +1,74 @@
+"""
+AI 케어브릿지 - 외부 API HTTP 클라이언트 레지스트리
+제공자별로 장기 유지되는 커넥션 풀을 공유합니다.
+"""
+from typing import Dict
+import httpx
+from app.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """h2 패키지 설치 여부 (httpx[http2])"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class ProviderClientRegistry:
+    """제공자별 httpx.AsyncClient 레지스트리
+
+    요청마다 클라이언트를 만들면 TCP/TLS 핸드셰이크를 매번 다시 하므로
+    제공자당 하나의 클라이언트를 keep-alive 풀과 함께 재사용합니다.
+    앱 lifespan 종료 시 aclose()로 정리합니다.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._http2 = _http2_available()
+
+    def _timeout_for(self, provider: str) -> float:
+        """제공자별 요청 타임아웃 (초)"""
+        timeouts = {
+            "upstage": settings.UPSTAGE_HTTP_TIMEOUT,
+            "openai": settings.OPENAI_HTTP_TIMEOUT,
+        }
+        return timeouts.get(provider, settings.HTTP_DEFAULT_TIMEOUT)
+
+    def get(self, provider: str) -> httpx.AsyncClient:
+        """제공자 클라이언트 반환 (최초 호출 시 생성)"""
+        client = self._clients.get(provider)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self._http2,
+                timeout=httpx.Timeout(
+                    self._timeout_for(provider),
+                    connect=settings.HTTP_CONNECT_TIMEOUT
+                ),
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY
+                )
+            )
+            self._clients[provider] = client
+            logger.info(f"HTTP 클라이언트 생성: {provider} (http2={self._http2})")
+        return client
+
+    async def aclose(self) -> None:
+        """모든 클라이언트 종료"""
+        for provider, client in list(self._clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"HTTP 클라이언트 종료 실패 ({provider}): {e}")
+        self._clients.clear()
+        logger.info("HTTP 클라이언트 정리 완료")
+
+
+# 싱글톤 인스턴스
+http_clients = ProviderClientRegistry()
@@ -0,0 +1,111 @@
+"""
+AI 케어브릿지 - 로컬 추론 실행기
+sentence-transformers, Whisper 등 CPU/GPU 연산을 이벤트 루프 밖의 워커 풀에서 실행합니다.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from app.config import settings
+from app.utils.stats import RollingWindow
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceQueueFull(Exception):
+    """추론 대기열이 가득 참"""
+
+
+class InferenceExecutor:
+    """대기열 깊이가 제한된 추론 워커 풀
+
+    - 워커 수만큼 동시에 실행하고, 추가로 max_queue개까지 대기시킵니다.
+    - 한도를 넘는 요청은 이벤트 루프를 막는 대신 InferenceQueueFull로 거절합니다.
+    - torch/whisper 연산은 GIL을 놓으므로 스레드 풀로 충분합니다.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight = 0
+        self._inflight_lock = threading.Lock()
+        self._closed = False
+
+        self.queue_wait = RollingWindow()
+        self.run_time = RollingWindow()
+        self.rejected = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """워커 풀 (최초 사용 시 생성)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="inference"
+            )
+            logger.info(f"추론 워커 풀 시작: workers={self.max_workers}, queue={self.max_queue}")
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """워커 풀에서 fn 실행 후 결과 반환"""
+        if self._closed:
+            raise RuntimeError("추론 실행기가 종료되었습니다")
+
+        with self._inflight_lock:
+            if self._inflight >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise InferenceQueueFull(f"추론 대기열 초과 ({self._inflight}개 처리 중)")
+            self._inflight += 1
+
+        submitted = time.perf_counter()
+
+        def call():
+            started = time.perf_counter()
+            result = fn(*args, **kwargs)
+            return result, started - submitted, time.perf_counter() - started
+
+        try:
+            future = self._get_executor().submit(call)
+        except BaseException:
+            self._release()
+            raise
+        # 기다리던 코루틴이 취소돼도 이미 실행 중인 작업은 워커를 계속 쓰므로
+        # 작업이 실제로 끝나거나 (대기 중에) 취소될 때 자리를 반납
+        future.add_done_callback(lambda _: self._release())
+        result, waited, elapsed = await asyncio.wrap_future(future)
+
+        self.queue_wait.add(waited)
+        self.run_time.add(elapsed)
+        return result
+
+    def _release(self) -> None:
+        with self._inflight_lock:
+            self._inflight -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """워커 풀 종료 (대기 중인 작업은 취소)"""
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+            logger.info("추론 워커 풀 종료")
+
+    def stats(self) -> dict:
+        """대기 시간/실행 시간 통계 (ms)"""
+        return {
+            "workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "inflight": self._inflight,
+            "rejected": self.rejected,
+            "queue_wait_ms": self.queue_wait.summary(scale=1000.0),
+            "run_time_ms": self.run_time.summary(scale=1000.0)
+        }
+
+
+# 싱글톤 인스턴스
+inference_executor = InferenceExecutor(
+    max_workers=settings.INFERENCE_WORKERS,
+    max_queue=settings.INFERENCE_MAX_QUEUE
+)
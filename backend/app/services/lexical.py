@@ -0,0 +1,212 @@
+"""
+AI 케어브릿지 - 복지 프로그램 어휘(lexical) 인덱스
+한국어 문자 n-gram 기반 BM25 역색인
+"""
+import math
+import re
+import threading
+from collections import Counter
+from typing import List, Dict, Tuple, Optional, Iterable
+from app.services.catalog import program_catalog, ProgramCatalog
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 필드별 가중치 (프로그램명 > 키워드 > 자격요건)
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "keywords": 2.0,
+    "eligibility": 1.0,
+}
+
+NGRAM_SIZES = (2, 3)
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_NON_WORD = re.compile(r"[^0-9a-z가-힣\s]")
+
+
+def normalize(text: str) -> str:
+    """소문자화 및 특수문자 제거"""
+    return _NON_WORD.sub(" ", text.lower())
+
+
+def compact(text: str) -> str:
+    """공백까지 제거한 정규화 문자열 (부분 문자열 매칭용)"""
+    return "".join(normalize(text).split())
+
+
+def char_ngrams(text: str, sizes: Iterable[int] = NGRAM_SIZES) -> List[str]:
+    """어절별 문자 n-gram 생성
+
+    조사가 붙은 어절("기초연금은")도 원형과 n-gram을 공유하므로
+    형태소 분석기 없이 부분 일치가 됩니다.
+    """
+    grams = []
+    for token in normalize(text).split():
+        if len(token) == 1:
+            grams.append(token)
+            continue
+        for n in sizes:
+            if len(token) < n:
+                continue
+            grams.extend(token[i:i + n] for i in range(len(token) - n + 1))
+    return grams
+
+
+class LexicalIndex:
+    """카탈로그 기반 BM25 역색인
+
+    카탈로그 해시가 바뀌면 다음 조회 시 다시 만듭니다.
+    """
+
+    def __init__(self, catalog: ProgramCatalog = program_catalog):
+        self.catalog = catalog
+        self._lock = threading.Lock()
+        self._digest = ""
+        self._doc_ids: List[str] = []
+        self._postings: Dict[str, List[Tuple[int, float]]] = {}
+        self._idf: Dict[str, float] = {}
+        self._exact_terms: Dict[str, List[str]] = {}
+        self._max_term_len = 0
+
+    def _ensure_fresh(self) -> None:
+        """카탈로그가 바뀌었으면 인덱스 재생성"""
+        digest = self.catalog.digest
+        if digest == self._digest:
+            return
+        with self._lock:
+            if digest != self._digest:
+                self._build(self.catalog.get_programs())
+                self._digest = digest
+
+    def _build(self, programs: List[dict]) -> None:
+        """역색인 생성"""
+        doc_ids: List[str] = []
+        doc_tfs: List[Counter] = []
+        doc_lens: List[float] = []
+        exact_terms: Dict[str, List[str]] = {}
+
+        for program in programs:
+            fields = {
+                "name": [program.get("name", "")],
+                "keywords": program.get("keywords", []),
+                "eligibility": program.get("eligibility", []),
+            }
+            tf: Counter = Counter()
+            for field_name, values in fields.items():
+                weight = FIELD_WEIGHTS[field_name]
+                for value in values:
+                    for gram in char_ngrams(value):
+                        tf[gram] += weight
+
+            doc_ids.append(program["id"])
+            doc_tfs.append(tf)
+            doc_lens.append(sum(tf.values()))
+
+            # 프로그램명/키워드 완전 일치용 사전
+            for term in [program.get("name", "")] + program.get("keywords", []):
+                key = compact(term)
+                if len(key) >= 2:
+                    exact_terms.setdefault(key, []).append(program["id"])
+
+        n_docs = len(doc_ids)
+        avg_len = (sum(doc_lens) / n_docs) if n_docs else 0.0
+
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        for doc_idx, tf in enumerate(doc_tfs):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lens[doc_idx] / avg_len) if avg_len else BM25_K1
+            for gram, freq in tf.items():
+                # 문서별 BM25 tf 성분을 미리 계산해 둠
+                postings.setdefault(gram, []).append((doc_idx, freq * (BM25_K1 + 1) / (freq + norm)))
+
+        idf = {
+            gram: math.log(1 + (n_docs - len(plist) + 0.5) / (len(plist) + 0.5))
+            for gram, plist in postings.items()
+        }
+
+        self._doc_ids = doc_ids
+        self._postings = postings
+        self._idf = idf
+        self._exact_terms = exact_terms
+        self._max_term_len = max((len(t) for t in exact_terms), default=0)
+        logger.info(f"어휘 인덱스 생성 완료: {n_docs}개 문서, {len(postings)}개 n-gram")
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        allowed_ids: Optional[set] = None
+    ) -> List[Tuple[str, float]]:
+        """BM25 검색
+
+        Returns:
+            (program_id, BM25 점수) 목록 - 점수 내림차순
+        """
+        self._ensure_fresh()
+
+        scores: Dict[int, float] = {}
+        for gram, qtf in Counter(char_ngrams(query)).items():
+            plist = self._postings.get(gram)
+            if not plist:
+                continue
+            idf = self._idf[gram]
+            for doc_idx, tf_part in plist:
+                scores[doc_idx] = scores.get(doc_idx, 0.0) + idf * tf_part * qtf
+
+        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        results = []
+        for doc_idx, score in ranked:
+            program_id = self._doc_ids[doc_idx]
+            if allowed_ids is not None and program_id not in allowed_ids:
+                continue
+            results.append((program_id, score))
+            if len(results) >= limit:
+                break
+        return results
+
+    def exact_matches(self, query: str) -> Tuple[List[str], float]:
+        """프로그램명/키워드가 질의에 그대로 포함된 프로그램 조회
+
+        Returns:
+            (일치한 program_id 목록, 질의 대비 최장 일치 용어 비율)
+        """
+        self._ensure_fresh()
+
+        query_key = compact(query)
+        if not query_key:
+            return [], 0.0
+
+        # 질의의 부분 문자열을 사전에서 찾음 (용어 수와 무관하게 질의 길이에 비례)
+        matched: List[str] = []
+        longest = 0
+        for start in range(len(query_key)):
+            end_max = min(len(query_key), start + self._max_term_len)
+            for end in range(start + 2, end_max + 1):
+                ids = self._exact_terms.get(query_key[start:end])
+                if not ids:
+                    continue
+                longest = max(longest, end - start)
+                for program_id in ids:
+                    if program_id not in matched:
+                        matched.append(program_id)
+        return matched, longest / len(query_key)
+
+
+def reciprocal_rank_fusion(rankings: List[List[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """여러 순위 목록을 RRF로 결합
+
+    Returns:
+        (id, RRF 점수) 목록 - 점수 내림차순
+    """
+    fused: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, 1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda x: x[1], reverse=True)
+
+
+# 싱글톤 인스턴스
+lexical_index = LexicalIndex()
@@ -0,0 +1,97 @@
+"""
+AI 케어브릿지 - 음성 제공자 라우터
+STT/TTS 폴백 체인을 제공자별 서킷 브레이커 상태에 따라 정렬합니다.
+"""
+from typing import Dict, List
+from app.config import settings
+from app.utils.circuit_breaker import HALF_OPEN, OPEN, BreakerConfig, CircuitBreaker
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def breaker_config() -> BreakerConfig:
+    """설정값으로 브레이커 파라미터 생성"""
+    return BreakerConfig(
+        window_seconds=settings.BREAKER_WINDOW_SECONDS,
+        min_requests=settings.BREAKER_MIN_REQUESTS,
+        failure_rate=settings.BREAKER_FAILURE_RATE,
+        consecutive_failures=settings.BREAKER_CONSECUTIVE_FAILURES,
+        open_seconds=settings.BREAKER_OPEN_SECONDS,
+        max_open_seconds=settings.BREAKER_MAX_OPEN_SECONDS
+    )
+
+
+class ProviderRouter:
+    """제공자 선택기
+
+    기본 선호 순서(품질/비용)를 유지하되, 차단되었거나 최근 오류율/지연이 나쁜
+    제공자는 뒤로 보내 요청이 바로 건강한 제공자로 가게 합니다.
+
+    사용법:
+        for provider in router.ranked():
+            if not router.acquire(provider):
+                continue
+            ... 호출 후 router.record(provider, ok, elapsed)
+    """
+
+    def __init__(self, kind: str, providers: List[str]):
+        self.kind = kind
+        self.providers = providers
+        self.breakers: Dict[str, CircuitBreaker] = {
+            name: CircuitBreaker(f"{kind}:{name}", breaker_config()) for name in providers
+        }
+
+    def _tier(self, name: str) -> int:
+        """0: 정상/반개방, 1: 불안정(오류율/지연), 2: 차단"""
+        breaker = self.breakers[name]
+        state = breaker.state
+        if state == OPEN:
+            return 2
+        if state == HALF_OPEN:
+            # 시험 호출은 원래 순서대로 받아야 회복을 확인할 수 있음 (acquire가 하나만 허용)
+            return 0
+        # 요청 몇 건의 실패로 순서가 바뀌지 않도록 최소 요청 수 이상일 때만 오류율 반영
+        error_rate = breaker.error_rate(min_requests=breaker.config.min_requests)
+        if error_rate >= settings.PROVIDER_DEGRADED_ERROR_RATE:
+            return 1
+        p95 = breaker.latency.percentile(95)
+        if p95 is not None and p95 * 1000 >= settings.PROVIDER_SLOW_MS:
+            return 1
+        return 0
+
+    def ranked(self) -> List[str]:
+        """시도 순서 (같은 등급 안에서는 기본 선호 순서)"""
+        order = {name: i for i, name in enumerate(self.providers)}
+        return sorted(self.providers, key=lambda name: (self._tier(name), order[name]))
+
+    def acquire(self, name: str) -> bool:
+        """호출 허용 여부 (차단 중이면 False, 반개방이면 시험 호출 하나만 허용)"""
+        return self.breakers[name].try_acquire()
+
+    def record(self, name: str, ok: bool, elapsed: float) -> None:
+        """호출 결과 기록"""
+        breaker = self.breakers[name]
+        before = breaker.state
+        if ok:
+            breaker.record_success(elapsed)
+        else:
+            breaker.record_failure(elapsed)
+        after = breaker.state
+        if before != after:
+            logger.warning(f"{self.kind} 제공자 상태 변경: {name} {before} -> {after}")
+
+    def latency_percentile(self, name: str, p: float):
+        """최근 호출 지연 분위수 (초, 기록이 없으면 None)"""
+        return self.breakers[name].latency.percentile(p)
+
+    def stats(self) -> dict:
+        """제공자별 브레이커 상태"""
+        return {
+            "order": self.ranked(),
+            "providers": {name: breaker.stats() for name, breaker in self.breakers.items()}
+        }
+
+    def healthy(self) -> bool:
+        """하나 이상의 제공자가 차단되지 않았는지"""
+        return any(breaker.state != OPEN for breaker in self.breakers.values())
@@ -2,32 +2,17 @@
 AI 케어브릿지 - RAG (Retrieval Augmented Generation) 서비스
 복지 정보 검색 및 컨텍스트 생성
 """
-import json
-import os
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
 from app.services.vectorstore import vectorstore_service
 from app.services.embedding import embedding_service
+from app.services.catalog import program_catalog, SearchResult, DATA_FILE
+from app.services.lexical import lexical_index, reciprocal_rank_fusion
+from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 COLLECTION_NAME = "welfare_programs"
-DATA_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "data", "welfare_programs.json")
-
-
-@dataclass
-class SearchResult:
-    """검색 결과"""
-    program_id: str
-    name: str
-    category: str
-    description: str
-    benefit: str
-    eligibility: List[str]
-    how_to_apply: str
-    contact: str
-    score: float  # 유사도 점수 (낮을수록 유사)
 
 
 class RAGService:
@@ -60,16 +45,8 @@ class RAGService:
 
     async def _load_and_index_data(self) -> None:
         """복지 데이터 로드 및 인덱싱"""
-        # JSON 파일 로드
-        data_path = os.path.normpath(DATA_FILE)
-        if not os.path.exists(data_path):
-            logger.warning(f"데이터 파일 없음: {data_path}")
-            return
-
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        programs = data.get("programs", [])
+        # 카탈로그에서 프로그램 목록 조회
+        programs = program_catalog.get_programs()
         if not programs:
             logger.warning("복지 프로그램 데이터 없음")
             return
@@ -130,11 +107,46 @@ class RAGService:
         n_results: int = 3,
         category: Optional[str] = None
     ) -> List[SearchResult]:
-        """복지 정보 검색"""
+        """복지 정보 검색 (BM25 + 벡터 하이브리드)"""
         # 초기화 확인
         if not self._initialized:
             await self.initialize()
 
+        allowed_ids = set(program_catalog.get_ids_by_category(category)) if category else None
+        n_candidates = max(n_results, settings.HYBRID_CANDIDATES)
+
+        # 어휘 검색 (메모리 내 역색인)
+        lexical_ranking = [
+            program_id for program_id, _ in
+            lexical_index.search(query, limit=n_candidates, allowed_ids=allowed_ids)
+        ]
+
+        # 프로그램명/키워드 위주 질의는 임베딩 없이 어휘 인덱스로 응답
+        exact_ids, coverage = lexical_index.exact_matches(query)
+        if allowed_ids is not None:
+            exact_ids = [pid for pid in exact_ids if pid in allowed_ids]
+        if exact_ids and coverage >= settings.LEXICAL_FAST_PATH_COVERAGE:
+            exact_set = set(exact_ids)
+            ranking = [pid for pid in lexical_ranking if pid in exact_set]
+            ranking += [pid for pid in exact_ids if pid not in ranking]
+            ranking += [pid for pid in lexical_ranking if pid not in exact_set]
+            logger.debug(f"어휘 빠른 경로: {query[:30]} -> {ranking[:n_results]}")
+            return self._fuse([ranking], n_results)
+
+        # 벡터 검색 후 RRF 결합 (질의에 포함된 프로그램명/키워드도 한 순위로 반영)
+        vector_ranking = await self._vector_search(query, n_candidates, category)
+        rankings = [lexical_ranking, vector_ranking]
+        if exact_ids:
+            rankings.append(exact_ids)
+        return self._fuse(rankings, n_results)
+
+    async def _vector_search(
+        self,
+        query: str,
+        n_results: int,
+        category: Optional[str] = None
+    ) -> List[str]:
+        """벡터 유사도 검색 (프로그램 ID 순위 반환)"""
         # 쿼리 임베딩
         query_embedding = await embedding_service.embed_text(query)
 
@@ -151,43 +163,25 @@ class RAGService:
             where=where
         )
 
-        # 결과 파싱
-        search_results = []
-        documents = results.get("documents", [[]])[0]
         metadatas = results.get("metadatas", [[]])[0]
-        distances = results.get("distances", [[]])[0]
-
-        for doc, meta, dist in zip(documents, metadatas, distances):
-            # 원본 데이터 로드
-            program_data = self._get_program_by_id(meta.get("id", ""))
-            if program_data:
-                search_results.append(SearchResult(
-                    program_id=program_data.get("id", ""),
-                    name=program_data.get("name", ""),
-                    category=program_data.get("category", ""),
-                    description=program_data.get("description", ""),
-                    benefit=program_data.get("benefit", ""),
-                    eligibility=program_data.get("eligibility", []),
-                    how_to_apply=program_data.get("how_to_apply", ""),
-                    contact=program_data.get("contact", ""),
-                    score=dist
-                ))
+        return [meta.get("id", "") for meta in metadatas]
 
-        return search_results
+    def _fuse(self, rankings: List[List[str]], n_results: int) -> List[SearchResult]:
+        """순위 목록을 RRF로 결합해 검색 결과 생성"""
+        k = settings.HYBRID_RRF_K
+        # 모든 목록에서 1위일 때의 RRF 점수로 정규화 (0에 가까울수록 유사)
+        best = len(rankings) / (k + 1)
 
-    def _get_program_by_id(self, program_id: str) -> Optional[Dict[str, Any]]:
-        """ID로 프로그램 정보 조회"""
-        data_path = os.path.normpath(DATA_FILE)
-        if not os.path.exists(data_path):
-            return None
-
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        search_results = []
+        for program_id, rrf_score in reciprocal_rank_fusion(rankings, k=k):
+            # 카탈로그에서 미리 만든 결과 조회 (파일 I/O 없음)
+            result = program_catalog.get_result(program_id, round(1.0 - rrf_score / best, 4))
+            if result:
+                search_results.append(result)
+            if len(search_results) >= n_results:
+                break
 
-        for program in data.get("programs", []):
-            if program.get("id") == program_id:
-                return program
-        return None
+        return search_results
 
     async def get_context_for_llm(
         self,
@@ -204,30 +198,13 @@ class RAGService:
 
         for i, result in enumerate(results, 1):
             context_parts.append(f"\n--- {i}. {result.name} ---")
-            context_parts.append(f"분류: {result.category}")
-            context_parts.append(f"설명: {result.description}")
-            context_parts.append(f"혜택: {result.benefit}")
-            context_parts.append(f"자격요건: {', '.join(result.eligibility)}")
-            context_parts.append(f"신청방법: {result.how_to_apply}")
-            context_parts.append(f"문의: {result.contact}")
+            context_parts.append(program_catalog.get_context_block(result.program_id))
 
         return "\n".join(context_parts)
 
     async def get_all_categories(self) -> List[str]:
         """모든 카테고리 목록"""
-        data_path = os.path.normpath(DATA_FILE)
-        if not os.path.exists(data_path):
-            return []
-
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        categories = set()
-        for program in data.get("programs", []):
-            if cat := program.get("category"):
-                categories.add(cat)
-
-        return sorted(list(categories))
+        return list(program_catalog.get_categories())
 
     def reset_index(self) -> bool:
         """인덱스 리셋"""
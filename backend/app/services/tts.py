@@ -3,9 +3,14 @@ AI 케어브릿지 - TTS (Text-to-Speech) 서비스
 OpenAI TTS API 또는 Edge TTS 사용
 """
 import asyncio
-from typing import Optional, Literal
-import httpx
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional, Literal
 from app.config import settings
+from app.services.audio_cache import AudioCache, make_key, media_type_of
+from app.services.http_clients import http_clients
+from app.services.provider_router import ProviderRouter
+from app.utils.stats import RollingWindow
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +27,48 @@ KOREAN_FRIENDLY_VOICES = {
     "default": "nova"           # 기본 음성
 }
 
+# Edge TTS는 음성/형식을 고르지 않고 항상 이 설정으로 합성
+EDGE_TTS_VOICE = "ko-KR-SunHiNeural"
+EDGE_TTS_FORMAT = "mp3"
+
+
+@dataclass
+class AudioClip:
+    """합성된 오디오 클립 (key는 캐시 키이자 ETag)"""
+    key: str
+    data: bytes
+    format: str
+    provider: str
+
+    @property
+    def media_type(self) -> str:
+        return media_type_of(self.format)
+
+
+@dataclass
+class AudioStream:
+    """제공자에서 받는 대로 흘려보내는 오디오 (끝까지 받으면 캐시에 저장)"""
+    key: str
+    format: str
+    provider: str
+    chunks: AsyncIterator[bytes]
+    cached: bool = False
+    upstream: Optional[AsyncIterator[bytes]] = None     # chunks가 감싼 제공자 응답
+
+    @property
+    def media_type(self) -> str:
+        return media_type_of(self.format)
+
+    async def aclose(self) -> None:
+        """스트림 정리 (한 번도 읽지 않았어도 제공자 응답 연결을 닫음, 여러 번 불러도 됨)"""
+        await self.chunks.aclose()
+        if self.upstream is not None:
+            await self.upstream.aclose()
+
+
+async def _single_chunk(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
 
 class TTSService:
     """텍스트-음성 변환 서비스"""
@@ -30,6 +77,30 @@ class TTSService:
         self.openai_api_key = settings.OPENAI_API_KEY
         self.openai_base_url = "https://api.openai.com/v1"
 
+        # 인사말/폴백/위기 안내처럼 반복되는 응답은 다시 합성하지 않음
+        self.cache: Optional[AudioCache] = None
+        if settings.AUDIO_CACHE_ENABLED:
+            self.cache = AudioCache(
+                directory=settings.AUDIO_CACHE_DIR,
+                max_bytes=settings.AUDIO_CACHE_MAX_MB * 1024 * 1024,
+                max_memory_bytes=settings.AUDIO_CACHE_MEMORY_MB * 1024 * 1024
+            )
+
+        self.synthesized = {"openai": 0, "edge_tts": 0}
+        self.prewarmed = 0
+        # 제공자별 첫 오디오 바이트까지 시간 (스트리밍) / 전체 합성 시간 (버퍼링)
+        self.first_byte_time = {"openai": RollingWindow(), "edge_tts": RollingWindow()}
+        self.synthesis_time = {"openai": RollingWindow(), "edge_tts": RollingWindow()}
+
+        # 제공자별 서킷 브레이커 (기본 순서: OpenAI → Edge TTS)
+        self.router = ProviderRouter("tts", (["openai"] if self.openai_api_key else []) + ["edge_tts"])
+
+    @staticmethod
+    def _cache_key(provider: str, text: str, voice: str, speed: float, response_format: str) -> str:
+        if provider == "edge_tts":
+            return make_key(provider, EDGE_TTS_VOICE, speed, EDGE_TTS_FORMAT, text)
+        return make_key(provider, voice, speed, response_format, text)
+
     async def synthesize(
         self,
         text: str,
@@ -47,28 +118,200 @@ class TTSService:
             response_format: 출력 형식 (mp3, opus, aac, flac)
 
         Returns:
-            오디오 바이트 데이터
+            오디오 바이트 데이터 (모두 실패 시 빈 바이트)
+        """
+        clip = await self.synthesize_clip(text, voice, speed, response_format)
+        return clip.data if clip else b""
+
+    async def synthesize_clip(
+        self,
+        text: str,
+        voice: str = "nova",
+        speed: float = 0.9,
+        response_format: str = "mp3"
+    ) -> Optional[AudioClip]:
+        """
+        텍스트를 음성으로 변환 (캐시 우선)
+
+        제공자 순서대로 캐시를 먼저 보고, 없으면 합성해 캐시에 저장합니다.
+        키에 제공자가 포함되므로 폴백 제공자의 음성이 기본 제공자 자리를 차지하지 않습니다.
+
+        Returns:
+            오디오 클립 (모두 실패 시 None)
         """
         # 음성 이름 매핑
         if voice in KOREAN_FRIENDLY_VOICES:
             voice = KOREAN_FRIENDLY_VOICES[voice]
 
-        # OpenAI TTS API 사용
-        if self.openai_api_key:
+        for provider in self.router.ranked():
+            key = self._cache_key(provider, text, voice, speed, response_format)
+            clip_format = EDGE_TTS_FORMAT if provider == "edge_tts" else response_format
+
+            # 캐시된 오디오는 제공자가 차단 중이어도 사용
+            if self.cache is not None:
+                cached = await asyncio.to_thread(self.cache.get, key)
+                if cached is not None:
+                    return AudioClip(key=key, data=cached[0], format=cached[1], provider=provider)
+
+            if not self.router.acquire(provider):
+                continue
+
+            started = time.perf_counter()
             try:
-                return await self._synthesize_openai(text, voice, speed, response_format)
+                if provider == "openai":
+                    # OpenAI TTS API 사용
+                    audio = await self._synthesize_openai(text, voice, speed, response_format)
+                else:
+                    # Edge TTS 폴백 (무료)
+                    audio = await self._synthesize_edge_tts(text, speed)
+                if not audio:
+                    raise RuntimeError("빈 오디오")
             except Exception as e:
-                logger.warning(f"OpenAI TTS 실패: {e}")
+                self.router.record(provider, False, time.perf_counter() - started)
+                logger.warning(f"{provider} TTS 실패: {e}")
+                continue
 
-        # Edge TTS 폴백 (무료)
-        try:
-            return await self._synthesize_edge_tts(text, speed)
-        except Exception as e:
-            logger.warning(f"Edge TTS 실패: {e}")
+            self.router.record(provider, True, time.perf_counter() - started)
+            self.synthesized[provider] += 1
+            self.synthesis_time[provider].add(time.perf_counter() - started)
+            if self.cache is not None:
+                await asyncio.to_thread(self.cache.put, key, audio, clip_format)
+            return AudioClip(key=key, data=audio, format=clip_format, provider=provider)
 
-        # 최종 폴백: 빈 오디오 반환
+        # 최종 폴백: 오디오 없음
         logger.error("모든 TTS 서비스 실패")
-        return b""
+        return None
+
+    async def stream_clip(
+        self,
+        text: str,
+        voice: str = "nova",
+        speed: float = 0.9,
+        response_format: str = "mp3"
+    ) -> Optional[AudioStream]:
+        """
+        텍스트를 음성으로 변환 (스트리밍)
+
+        캐시에 있으면 그대로, 없으면 제공자가 보내는 조각을 받는 즉시 전달합니다.
+        첫 조각을 받기 전에 실패한 제공자는 다음 제공자로 넘어가고,
+        끝까지 받은 오디오는 캐시에 저장합니다.
+
+        Returns:
+            오디오 스트림 (모두 실패 시 None)
+        """
+        if voice in KOREAN_FRIENDLY_VOICES:
+            voice = KOREAN_FRIENDLY_VOICES[voice]
+
+        for provider in self.router.ranked():
+            key = self._cache_key(provider, text, voice, speed, response_format)
+            clip_format = EDGE_TTS_FORMAT if provider == "edge_tts" else response_format
+
+            if self.cache is not None:
+                cached = await asyncio.to_thread(self.cache.get, key)
+                if cached is not None:
+                    return AudioStream(key=key, format=cached[1], provider=provider,
+                                       chunks=_single_chunk(cached[0]), cached=True)
+
+            if not self.router.acquire(provider):
+                continue
+
+            started = time.perf_counter()
+            if provider == "openai":
+                chunks = self._stream_openai(text, voice, speed, response_format)
+            else:
+                chunks = self._stream_edge_tts(text, speed)
+
+            try:
+                first = await chunks.__anext__()
+            except StopAsyncIteration:
+                self.router.record(provider, False, time.perf_counter() - started)
+                continue
+            except Exception as e:
+                self.router.record(provider, False, time.perf_counter() - started)
+                logger.warning(f"{provider} TTS 스트리밍 실패: {e}")
+                await chunks.aclose()
+                continue
+
+            first_byte = time.perf_counter() - started
+            self.first_byte_time[provider].add(first_byte)
+            return AudioStream(
+                key=key, format=clip_format, provider=provider,
+                chunks=self._tee(provider, key, clip_format, first, chunks, started, first_byte),
+                upstream=chunks
+            )
+
+        logger.error("모든 TTS 서비스 실패")
+        return None
+
+    async def _tee(
+        self,
+        provider: str,
+        key: str,
+        clip_format: str,
+        first: bytes,
+        chunks: AsyncIterator[bytes],
+        started: float,
+        first_byte: float
+    ) -> AsyncIterator[bytes]:
+        """조각을 전달하면서 모아 두었다가, 끝까지 받으면 캐시에 저장
+
+        브레이커에는 스트림 하나당 결과를 한 번만 기록합니다.
+        끝까지 받으면 성공 (지연은 첫 바이트 기준), 전송 중 제공자 오류면 실패이고,
+        클라이언트가 먼저 끊은 경우는 제공자 탓이 아니므로 기록하지 않습니다.
+        """
+        parts = [first]
+        complete = False
+        try:
+            yield first
+            async for chunk in chunks:
+                parts.append(chunk)
+                yield chunk
+            complete = True
+        except Exception:
+            # 전송 중 끊긴 제공자 응답은 실패로 기록
+            self.router.record(provider, False, time.perf_counter() - started)
+            raise
+        finally:
+            await chunks.aclose()
+            # 클라이언트가 중간에 끊은 오디오는 잘린 파일이므로 저장하지 않음
+            if complete:
+                self.router.record(provider, True, first_byte)
+                self.synthesized[provider] += 1
+                self.synthesis_time[provider].add(time.perf_counter() - started)
+                if self.cache is not None:
+                    await asyncio.to_thread(self.cache.put, key, b"".join(parts), clip_format)
+
+    async def get_cached_clip(self, key: str) -> Optional[AudioClip]:
+        """캐시 키로 오디오 조회 (합성하지 않음)"""
+        if self.cache is None:
+            return None
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is None:
+            return None
+        return AudioClip(key=key, data=cached[0], format=cached[1], provider="cache")
+
+    async def prewarm(self, phrases: Iterable[str]) -> int:
+        """
+        자주 쓰는 문구를 미리 합성해 캐시에 저장 (서버 시작 시 백그라운드)
+
+        노인용 기본 설정(synthesize_for_senior)으로 합성합니다.
+        이미 캐시된 문구는 디스크 조회만 하고 넘어갑니다.
+        """
+        if self.cache is None:
+            return 0
+
+        count = 0
+        for phrase in dict.fromkeys(p.strip() for p in phrases if p and p.strip()):
+            try:
+                audio = await self.synthesize_for_senior(phrase)
+            except Exception as e:
+                logger.warning(f"TTS 사전 합성 실패: {e}")
+                continue
+            if audio:
+                count += 1
+        self.prewarmed += count
+        logger.info(f"TTS 사전 합성 완료: {count}개 문구")
+        return count
 
     async def _synthesize_openai(
         self,
@@ -81,26 +324,79 @@ class TTSService:
         # 속도 범위 제한
         speed = max(0.25, min(4.0, speed))
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.openai_base_url}/audio/speech",
-                headers={
-                    "Authorization": f"Bearer {self.openai_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "tts-1",  # tts-1-hd for higher quality
-                    "input": text,
-                    "voice": voice,
-                    "speed": speed,
-                    "response_format": response_format
-                }
-            )
+        client = http_clients.get("openai")
+        response = await client.post(
+            f"{self.openai_base_url}/audio/speech",
+            headers={
+                "Authorization": f"Bearer {self.openai_api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "tts-1",  # tts-1-hd for higher quality
+                "input": text,
+                "voice": voice,
+                "speed": speed,
+                "response_format": response_format
+            }
+        )
+        response.raise_for_status()
+
+        audio_bytes = response.content
+        logger.info(f"OpenAI TTS 성공: {len(text)} chars -> {len(audio_bytes)} bytes")
+        return audio_bytes
+
+    async def _stream_openai(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        response_format: str
+    ) -> AsyncIterator[bytes]:
+        """OpenAI TTS API 스트리밍 (chunked 응답 본문을 받는 대로 전달)"""
+        speed = max(0.25, min(4.0, speed))
+
+        client = http_clients.get("openai")
+        request = client.build_request(
+            "POST",
+            f"{self.openai_base_url}/audio/speech",
+            headers={
+                "Authorization": f"Bearer {self.openai_api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "tts-1",
+                "input": text,
+                "voice": voice,
+                "speed": speed,
+                "response_format": response_format
+            }
+        )
+        response = await client.send(request, stream=True)
+        try:
             response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                if chunk:
+                    yield chunk
+        finally:
+            await response.aclose()
 
-            audio_bytes = response.content
-            logger.info(f"OpenAI TTS 성공: {len(text)} chars -> {len(audio_bytes)} bytes")
-            return audio_bytes
+    async def _stream_edge_tts(
+        self,
+        text: str,
+        speed: float = 0.9
+    ) -> AsyncIterator[bytes]:
+        """Edge TTS 스트리밍 (오디오 조각만 전달)"""
+        import edge_tts
+
+        # 속도 조절 (rate 형식: +0%, -10%, etc)
+        rate_percent = int((speed - 1.0) * 100)
+        rate = f"{rate_percent:+d}%"
+
+        # 한국어 여성 음성
+        communicate = edge_tts.Communicate(text, EDGE_TTS_VOICE, rate=rate)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
 
     async def _synthesize_edge_tts(
         self,
@@ -109,23 +405,11 @@ class TTSService:
     ) -> bytes:
         """Edge TTS로 변환 (무료 대안)"""
         try:
-            import edge_tts
-
-            # 한국어 음성 선택
-            voice = "ko-KR-SunHiNeural"  # 한국어 여성 음성
-
-            # 속도 조절 (rate 형식: +0%, -10%, etc)
-            rate_percent = int((speed - 1.0) * 100)
-            rate = f"{rate_percent:+d}%"
-
-            # TTS 생성
-            communicate = edge_tts.Communicate(text, voice, rate=rate)
-
-            # 오디오 데이터 수집
-            audio_data = b""
-            async for chunk in communicate.stream():
-                if chunk["type"] == "audio":
-                    audio_data += chunk["data"]
+            # 오디오 조각을 모아 마지막에 한 번만 합침 (bytes += 반복 복사 방지)
+            chunks = []
+            async for chunk in self._stream_edge_tts(text, speed):
+                chunks.append(chunk)
+            audio_data = b"".join(chunks)
 
             logger.info(f"Edge TTS 성공: {len(text)} chars -> {len(audio_data)} bytes")
             return audio_data
@@ -149,18 +433,46 @@ class TTSService:
         - 따뜻한 음성 사용
         - 감정에 따른 음성 조절
         """
-        # 감정에 따른 음성 선택
+        clip = await self.synthesize_clip_for_senior(text, emotion)
+        return clip.data if clip else b""
+
+    @staticmethod
+    def _senior_voice(emotion: Optional[str]) -> tuple:
+        """감정에 따른 (음성, 속도)"""
         if emotion == "comfort":
-            voice = "nova"  # 따뜻하고 부드러운 음성
-            speed = 0.8
-        elif emotion == "urgent":
-            voice = "onyx"  # 명확한 음성
-            speed = 0.95
-        else:
-            voice = "nova"
-            speed = 0.85
-
-        return await self.synthesize(text, voice=voice, speed=speed)
+            return "nova", 0.8   # 따뜻하고 부드러운 음성
+        if emotion == "urgent":
+            return "onyx", 0.95  # 명확한 음성
+        return "nova", 0.85
+
+    async def synthesize_clip_for_senior(
+        self,
+        text: str,
+        emotion: Optional[str] = None
+    ) -> Optional[AudioClip]:
+        """노인 친화적 음성 합성 (캐시 키 포함 클립 반환)"""
+        voice, speed = self._senior_voice(emotion)
+        return await self.synthesize_clip(text, voice=voice, speed=speed)
+
+    async def stream_clip_for_senior(
+        self,
+        text: str,
+        emotion: Optional[str] = None
+    ) -> Optional[AudioStream]:
+        """노인 친화적 음성 합성 (스트리밍)"""
+        voice, speed = self._senior_voice(emotion)
+        return await self.stream_clip(text, voice=voice, speed=speed)
+
+    def stats(self) -> dict:
+        """제공자별 합성 수와 캐시 통계"""
+        return {
+            "synthesized": dict(self.synthesized),
+            "prewarmed": self.prewarmed,
+            "first_byte_ms": {p: w.summary(scale=1000.0) for p, w in self.first_byte_time.items()},
+            "synthesis_ms": {p: w.summary(scale=1000.0) for p, w in self.synthesis_time.items()},
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "providers": self.router.stats()
+        }
 
     def get_available_voices(self) -> dict:
         """사용 가능한 음성 목록 반환"""
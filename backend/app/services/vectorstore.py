@@ -106,6 +106,28 @@ class VectorStoreService:
             logger.error(f"문서 추가 실패: {e}")
             return False
 
+    def upsert_documents(
+        self,
+        collection_name: str,
+        documents: List[str],
+        embeddings: List[List[float]],
+        metadatas: Optional[List[Dict[str, Any]]],
+        ids: List[str]
+    ) -> bool:
+        """문서 추가 또는 갱신 (같은 ID는 덮어씀)"""
+        try:
+            collection = self.get_or_create_collection(collection_name)
+            collection.upsert(
+                documents=documents,
+                embeddings=embeddings,
+                metadatas=metadatas,
+                ids=ids
+            )
+            return True
+        except Exception as e:
+            logger.error(f"문서 upsert 실패: {e}")
+            return False
+
     def query(
         self,
         collection_name: str,
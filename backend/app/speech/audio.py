@@ -0,0 +1,131 @@
+"""
+AI 케어브릿지 - 오디오 디코딩/인코딩 유틸리티
+업로드된 오디오 바이트를 임시 파일 없이 메모리에서 PCM으로 변환하고, 다시 압축합니다.
+"""
+import io
+import subprocess
+import wave
+
+import numpy as np
+
+# Whisper 입력 샘플레이트
+TARGET_SAMPLE_RATE = 16000
+
+
+def decode_audio(audio_bytes: bytes, sample_rate: int = TARGET_SAMPLE_RATE) -> np.ndarray:
+    """오디오 바이트를 mono float32 [-1, 1] 배열로 디코딩
+
+    PCM WAV는 표준 라이브러리로 직접 읽고, 그 외 형식(webm, mp3, m4a 등)은
+    ffmpeg 파이프(stdin -> stdout)로 변환합니다.
+    """
+    if audio_bytes[:4] == b"RIFF" and audio_bytes[8:12] == b"WAVE":
+        try:
+            return _decode_wav(audio_bytes, sample_rate)
+        except (wave.Error, ValueError):
+            # float WAV 등 wave 모듈이 읽지 못하는 형식
+            pass
+    return _decode_with_ffmpeg(audio_bytes, sample_rate)
+
+
+def _decode_wav(audio_bytes: bytes, sample_rate: int) -> np.ndarray:
+    """PCM WAV 디코딩"""
+    with wave.open(io.BytesIO(audio_bytes), "rb") as wav:
+        channels = wav.getnchannels()
+        width = wav.getsampwidth()
+        source_rate = wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+
+    if width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"지원하지 않는 WAV 샘플 크기: {width}")
+
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+
+    return resample(samples, source_rate, sample_rate)
+
+
+def _decode_with_ffmpeg(audio_bytes: bytes, sample_rate: int) -> np.ndarray:
+    """ffmpeg 파이프로 디코딩 (mono, s16le)"""
+    cmd = [
+        "ffmpeg", "-nostdin", "-threads", "0",
+        "-i", "pipe:0",
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sample_rate),
+        "pipe:1"
+    ]
+    try:
+        out = subprocess.run(cmd, input=audio_bytes, capture_output=True, check=True).stdout
+    except FileNotFoundError as e:
+        raise RuntimeError("ffmpeg가 설치되지 않아 오디오를 디코딩할 수 없습니다") from e
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"오디오 디코딩 실패: {e.stderr.decode(errors='ignore')[-200:]}") from e
+
+    return np.frombuffer(out, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """선형 보간 리샘플링 (음성 인식용으로 충분한 품질)"""
+    if source_rate == target_rate or samples.size == 0:
+        return samples.astype(np.float32, copy=False)
+
+    duration = samples.size / source_rate
+    target_size = int(round(duration * target_rate))
+    source_times = np.arange(samples.size) / source_rate
+    target_times = np.arange(target_size) / target_rate
+    return np.interp(target_times, source_times, samples).astype(np.float32)
+
+
+def to_pcm16(samples: np.ndarray) -> bytes:
+    """float32 [-1, 1] → little-endian 16비트 PCM"""
+    return (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int = TARGET_SAMPLE_RATE) -> bytes:
+    """mono PCM16 WAV 인코딩"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(to_pcm16(samples))
+    return buffer.getvalue()
+
+
+# ffmpeg 인코딩 설정 (형식 → 출력 인자, 파일 확장자)
+_FFMPEG_CODECS = {
+    "flac": (["-f", "flac", "-acodec", "flac"], "flac"),
+    "opus": (["-f", "ogg", "-acodec", "libopus", "-b:a", "24k", "-application", "voip"], "ogg"),
+}
+
+
+def encode_audio(samples: np.ndarray, codec: str, sample_rate: int = TARGET_SAMPLE_RATE) -> tuple:
+    """
+    mono 오디오 인코딩
+
+    Args:
+        codec: wav (PCM16), flac (무손실), opus (ogg, 음성용 저비트레이트)
+
+    Returns:
+        (오디오 바이트, 파일 확장자)
+    """
+    if codec not in _FFMPEG_CODECS:
+        return encode_wav(samples, sample_rate), "wav"
+
+    output_args, extension = _FFMPEG_CODECS[codec]
+    cmd = [
+        "ffmpeg", "-nostdin", "-loglevel", "error",
+        "-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "-i", "pipe:0",
+        *output_args, "pipe:1"
+    ]
+    try:
+        out = subprocess.run(cmd, input=to_pcm16(samples), capture_output=True, check=True).stdout
+    except FileNotFoundError as e:
+        raise RuntimeError("ffmpeg가 설치되지 않아 오디오를 인코딩할 수 없습니다") from e
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"오디오 인코딩 실패: {e.stderr.decode(errors='ignore')[-200:]}") from e
+    return out, extension
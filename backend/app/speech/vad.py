@@ -0,0 +1,267 @@
+"""
+AI 케어브릿지 - 에너지 기반 음성 구간 검출 (VAD)
+프레임 RMS를 배경 소음 대비로 비교해 발화 구간을 찾고, 앞뒤 무음과 긴 쉼을 줄입니다.
+실시간 스트림용 StreamingVad는 들어오는 오디오에서 발화가 끝나는 시점을 바로 알려줍니다.
+"""
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# 무음으로 볼 최소 에너지 (완전 무음 파일에서 log(0) 방지)
+_EPSILON = 1e-10
+
+
+@dataclass
+class VadConfig:
+    """VAD 파라미터"""
+    frame_ms: float = 30.0
+    margin_db: float = 10.0      # 배경 소음보다 이만큼 커야 발화
+    min_db: float = -50.0        # 소음이 아주 작아도 이보다 작으면 무음
+    pad_ms: float = 200.0        # 발화 앞뒤로 남길 여유 (자음 잘림 방지)
+    min_speech_ms: float = 120.0 # 이보다 짧은 구간은 잡음으로 보고 버림
+    max_pause_ms: float = 600.0  # 구간 사이 쉼을 이 길이로 줄임
+
+
+def frame_energy_db(samples: np.ndarray, frame_size: int) -> np.ndarray:
+    """프레임별 RMS 에너지 (dBFS)"""
+    frames = samples.size // frame_size
+    if frames == 0:
+        return np.zeros(0, dtype=np.float32)
+    framed = samples[:frames * frame_size].reshape(frames, frame_size)
+    rms = np.sqrt(np.mean(framed.astype(np.float64) ** 2, axis=1))
+    return (20.0 * np.log10(rms + _EPSILON)).astype(np.float32)
+
+
+def speech_threshold_db(energy_db: np.ndarray, config: VadConfig) -> float:
+    """발화 판정 기준 (조용한 하위 10% 프레임을 배경 소음으로 추정)"""
+    if energy_db.size == 0:
+        return config.min_db
+    noise_floor = float(np.percentile(energy_db, 10))
+    return max(noise_floor + config.margin_db, config.min_db)
+
+
+def detect_speech(samples: np.ndarray, sample_rate: int, config: VadConfig) -> List[Tuple[int, int]]:
+    """
+    발화 구간 검출
+
+    Returns:
+        [(시작 샘플, 끝 샘플)] - 여유(pad)를 붙이고 가까운 구간은 합친 결과
+    """
+    frame_size = max(1, int(sample_rate * config.frame_ms / 1000))
+    energy_db = frame_energy_db(samples, frame_size)
+    if energy_db.size == 0:
+        return []
+
+    voiced = energy_db >= speech_threshold_db(energy_db, config)
+    if not voiced.any():
+        return []
+
+    # 음절 사이 짧은 끊김(5프레임 미만)은 메움 (팽창 후 침식)
+    kernel = np.ones(5, dtype=np.int32)
+    dilated = np.convolve(voiced.astype(np.int32), kernel, mode="same") > 0
+    voiced = voiced | (np.convolve(dilated.astype(np.int32), kernel, mode="same") == kernel.size)
+
+    # 연속된 발화 프레임 → (시작, 끝) 프레임 구간
+    edges = np.diff(np.concatenate(([0], voiced.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    pad = int(sample_rate * config.pad_ms / 1000)
+    min_frames = max(1, int(config.min_speech_ms / config.frame_ms))
+    segments: List[Tuple[int, int]] = []
+    for start_frame, end_frame in zip(starts, ends):
+        if end_frame - start_frame < min_frames:
+            continue
+        start = max(0, start_frame * frame_size - pad)
+        end = min(samples.size, end_frame * frame_size + pad)
+        if segments and start <= segments[-1][1]:
+            segments[-1] = (segments[-1][0], end)
+        else:
+            segments.append((start, end))
+    return segments
+
+
+def trim_silence(samples: np.ndarray, sample_rate: int, config: VadConfig) -> np.ndarray:
+    """
+    앞뒤 무음 제거 + 구간 사이 긴 쉼을 max_pause_ms로 줄인 오디오
+
+    발화가 없으면 빈 배열을 반환합니다.
+    """
+    segments = detect_speech(samples, sample_rate, config)
+    if not segments:
+        return samples[:0]
+
+    max_pause = int(sample_rate * config.max_pause_ms / 1000)
+    parts = []
+    previous_end = None
+    for start, end in segments:
+        if previous_end is not None:
+            gap = start - previous_end
+            if gap > max_pause:
+                # 긴 쉼은 앞뒤 절반씩만 남김 (문장 경계는 유지)
+                half = max_pause // 2
+                parts.append(samples[previous_end:previous_end + half])
+                parts.append(samples[start - (max_pause - half):start])
+            else:
+                parts.append(samples[previous_end:start])
+        parts.append(samples[start:end])
+        previous_end = end
+    return np.concatenate(parts)
+
+
+@dataclass
+class SpeechSegment:
+    """스트림에서 잘라낸 발화 구간"""
+    kind: str            # partial (말하는 중), final (발화 끝)
+    samples: np.ndarray
+    start: int           # 스트림 시작 기준 샘플 위치
+    end: int
+
+
+class StreamingVad:
+    """
+    실시간 발화 구간 검출
+
+    PCM 조각을 feed()로 넣으면 프레임 단위로 판정해
+    - 발화가 partial_interval_ms만큼 이어질 때마다 partial (발화 시작부터 현재까지)
+    - end_silence_ms 이상 조용해지면 final (발화 전체)
+    구간을 돌려줍니다. 배경 소음은 최근 noise_window_ms 프레임의 하위 10%로 추정하므로
+    마이크를 켠 직후 바로 말하기 시작하면 첫 발화의 앞부분을 놓칠 수 있습니다.
+
+    발화 중이 아닐 때는 앞 여유(pad)만큼만 남기고 버퍼를 비우므로
+    스트림 길이와 상관없이 메모리는 발화 하나 분량만 사용합니다.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        config: VadConfig,
+        end_silence_ms: float = 700.0,
+        partial_interval_ms: float = 1500.0,
+        max_utterance_ms: float = 30000.0,
+        noise_window_ms: float = 10000.0
+    ):
+        self.sample_rate = sample_rate
+        self.config = config
+        self.frame_size = max(1, int(sample_rate * config.frame_ms / 1000))
+
+        def frames(ms: float) -> int:
+            return max(1, int(ms / config.frame_ms))
+
+        self._pad = int(config.pad_ms / config.frame_ms)
+        self._min_frames = frames(config.min_speech_ms)
+        self._end_frames = frames(end_silence_ms)
+        self._partial_frames = frames(partial_interval_ms) if partial_interval_ms > 0 else 0
+        self._max_frames = frames(max_utterance_ms)
+        self._noise: deque = deque(maxlen=frames(noise_window_ms))
+
+        # 오디오 버퍼: 스트림 위치 [_offset, _offset + _size) 샘플
+        self._chunks: List[np.ndarray] = []
+        self._offset = 0
+        self._size = 0
+
+        self._frames = 0          # 판정을 마친 프레임 수
+        self._run = 0             # 발화 전 연속 발화 프레임 수
+        self._silence = 0         # 발화 중 연속 무음 프레임 수
+        self._start: Optional[int] = None  # 현재 발화 시작 프레임
+        self._last_partial = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return self._start is not None
+
+    def feed(self, samples: np.ndarray) -> List[SpeechSegment]:
+        """오디오 조각 추가 (float32 mono, sample_rate) → 새로 잘린 구간"""
+        segments: List[SpeechSegment] = []
+        if samples.size == 0:
+            return segments
+        self._chunks.append(samples.astype(np.float32, copy=False))
+        self._size += samples.size
+
+        fs = self.frame_size
+        ready = (self._offset + self._size) // fs - self._frames
+        if ready > 0:
+            first = self._frames
+            block = self._slice(first * fs, (first + ready) * fs)
+            for energy in frame_energy_db(block, fs):
+                self._step(float(energy), segments)
+        self._trim()
+        return segments
+
+    def flush(self) -> Optional[SpeechSegment]:
+        """스트림 종료 - 진행 중인 발화를 final로 반환"""
+        if self._start is None:
+            return None
+        end = self._offset + self._size
+        segment = SpeechSegment("final", self._slice(self._start * self.frame_size, end), self._start * self.frame_size, end)
+        self._start = None
+        self._run = 0
+        return segment
+
+    def _step(self, energy: float, segments: List[SpeechSegment]) -> None:
+        """프레임 하나 판정"""
+        self._noise.append(energy)
+        threshold = max(float(np.percentile(self._noise, 10)) + self.config.margin_db, self.config.min_db)
+        voiced = energy >= threshold
+        frame = self._frames
+        self._frames += 1
+
+        if self._start is None:
+            self._run = self._run + 1 if voiced else 0
+            if self._run >= self._min_frames:
+                first_buffered = -(-self._offset // self.frame_size)
+                self._start = max(first_buffered, frame - self._run + 1 - self._pad)
+                self._silence = 0
+                self._last_partial = frame + 1
+            return
+
+        self._silence = 0 if voiced else self._silence + 1
+        if self._silence >= self._end_frames:
+            end = min(frame + 1, frame - self._silence + 1 + self._pad)
+            segments.append(self._emit("final", end))
+            self._start = None
+            self._run = 0
+        elif frame + 1 - self._start >= self._max_frames:
+            # 너무 긴 발화는 잘라서 내보내고 이어서 다음 구간 시작
+            segments.append(self._emit("final", frame + 1))
+            self._start = frame + 1
+            self._last_partial = frame + 1
+        elif self._partial_frames and not self._silence and frame + 1 - self._last_partial >= self._partial_frames:
+            segments.append(self._emit("partial", frame + 1))
+            self._last_partial = frame + 1
+
+    def _emit(self, kind: str, end_frame: int) -> SpeechSegment:
+        start = self._start * self.frame_size
+        end = end_frame * self.frame_size
+        return SpeechSegment(kind, self._slice(start, end), start, end)
+
+    def _slice(self, start: int, end: int) -> np.ndarray:
+        """스트림 위치 [start, end) 샘플"""
+        parts = []
+        position = self._offset
+        for chunk in self._chunks:
+            chunk_end = position + chunk.size
+            if chunk_end > start and position < end:
+                parts.append(chunk[max(start - position, 0):min(end, chunk_end) - position])
+            position = chunk_end
+            if position >= end:
+                break
+        if not parts:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(parts) if len(parts) > 1 else parts[0].copy()
+
+    def _trim(self) -> None:
+        """필요 없는 앞부분 버림 (1초 이상 쌓였을 때만 복사)"""
+        if self._start is not None:
+            keep_frame = self._start
+        else:
+            keep_frame = max(0, self._frames - self._run - self._pad)
+        keep_from = keep_frame * self.frame_size
+        if keep_from - self._offset < self.sample_rate:
+            return
+        remaining = self._slice(keep_from, self._offset + self._size)
+        self._chunks = [remaining] if remaining.size else []
+        self._offset = keep_from
+        self._size = remaining.size
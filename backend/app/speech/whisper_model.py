@@ -0,0 +1,53 @@
+"""
+AI 케어브릿지 - 로컬 Whisper 모델 캐시
+프로세스당 한 번만 모델을 로드해 재사용합니다.
+"""
+import threading
+from typing import Any, Optional
+from app.config import settings
+from app.speech.audio import decode_audio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class WhisperModelCache:
+    """로컬 Whisper 모델 홀더
+
+    whisper의 디코더는 호출마다 모델 모듈에 kv-cache 훅을 붙였다 떼므로
+    같은 모델로 동시에 transcribe하지 않도록 호출을 직렬화합니다.
+    모든 메서드는 추론 워커 스레드에서 호출됩니다.
+    """
+
+    def __init__(self, model_size: str):
+        self.model_size = model_size
+        self._model: Optional[Any] = None
+        self._load_lock = threading.Lock()
+        self._transcribe_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """모델 로드 여부"""
+        return self._model is not None
+
+    def get(self) -> Any:
+        """모델 반환 (최초 1회 로드)"""
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    import whisper
+                    logger.info(f"로컬 Whisper 모델 로딩: {self.model_size}")
+                    self._model = whisper.load_model(self.model_size)
+                    logger.info(f"로컬 Whisper 모델 로드 완료: {self.model_size}")
+        return self._model
+
+    def transcribe(self, audio_bytes: bytes, language: str) -> dict:
+        """오디오 바이트를 메모리에서 디코딩해 변환 (임시 파일 없음)"""
+        samples = decode_audio(audio_bytes)
+        model = self.get()
+        with self._transcribe_lock:
+            return model.transcribe(samples, language=language, fp16=False)
+
+
+# 싱글톤 인스턴스
+whisper_model = WhisperModelCache(settings.WHISPER_MODEL_SIZE)
@@ -0,0 +1,86 @@
+"""
+AI 케어브릿지 - 프로세스 내 TTL + LRU 캐시
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+# 캐시에 "없음"을 저장할 때 쓰는 표식 (None 값과 구분)
+MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """크기 제한 + 만료 시간이 있는 LRU 캐시
+
+    모든 연산이 O(1)이며 여러 스레드에서 호출해도 안전합니다.
+    """
+
+    def __init__(self, max_items: int, ttl_seconds: float):
+        self.max_items = max(1, max_items)
+        self.ttl = ttl_seconds
+        self._items: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any:
+        """값 조회 (없거나 만료되면 MISSING)"""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return MISSING
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                self.misses += 1
+                return MISSING
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """값 저장 (용량 초과 시 가장 오래 쓰지 않은 항목 제거)"""
+        with self._lock:
+            self._items[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """항목 삭제"""
+        with self._lock:
+            removed = self._items.pop(key, None) is not None
+            if removed:
+                self.invalidations += 1
+            return removed
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self.invalidations += len(self._items)
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def stats(self) -> dict:
+        """적중/제거 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "items": len(self._items),
+            "max_items": self.max_items,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
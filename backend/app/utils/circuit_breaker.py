@@ -0,0 +1,156 @@
+"""
+AI 케어브릿지 - 서킷 브레이커
+외부 제공자 장애 시 매 요청이 타임아웃을 기다리지 않도록 호출을 잠시 차단합니다.
+"""
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Tuple
+
+from app.utils.stats import RollingWindow
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class BreakerConfig:
+    """서킷 브레이커 파라미터"""
+    window_seconds: float = 60.0       # 오류율 계산 구간
+    min_requests: int = 5              # 오류율로 판단할 최소 요청 수
+    failure_rate: float = 0.5          # 이 비율 이상 실패하면 차단
+    consecutive_failures: int = 3      # 요청이 적어도 연속 실패 시 차단
+    open_seconds: float = 30.0         # 첫 차단 시간 (반개방 시험 실패 시 두 배씩 증가)
+    max_open_seconds: float = 300.0
+
+
+class CircuitBreaker:
+    """제공자별 서킷 브레이커
+
+    - closed: 정상 호출, 최근 window_seconds 동안의 결과로 오류율 계산
+    - open: 호출 차단, open_seconds가 지나면 half_open
+    - half_open: 시험 호출 하나만 허용, 성공하면 closed, 실패하면 더 길게 open
+    """
+
+    def __init__(self, name: str, config: BreakerConfig):
+        self.name = name
+        self.config = config
+        self._lock = threading.Lock()
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._open_for = config.open_seconds
+        self._consecutive = 0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+
+        self.latency = RollingWindow(256)
+        self.trips = 0
+        self.rejected = 0
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.config.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+    def _refresh(self, now: float) -> None:
+        """차단 시간이 지났으면 half_open으로 전환"""
+        if self._state == OPEN and now - self._opened_at >= self._open_for:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh(time.monotonic())
+            return self._state
+
+    def error_rate(self, min_requests: int = 1) -> float:
+        """최근 구간 오류율 (요청이 min_requests보다 적으면 0)"""
+        with self._lock:
+            self._prune(time.monotonic())
+            if not self._outcomes or len(self._outcomes) < min_requests:
+                return 0.0
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            return failures / len(self._outcomes)
+
+    def try_acquire(self) -> bool:
+        """호출 허용 여부 (half_open이면 시험 호출 하나만 허용)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refresh(now)
+            if self._state == CLOSED:
+                return True
+            # 결과 없이 사라진 시험 호출(취소 등)은 차단 시간이 지나면 다시 허용
+            if self._state == HALF_OPEN and (not self._probe_in_flight or now - self._probe_started >= self._open_for):
+                self._probe_in_flight = True
+                self._probe_started = now
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self, elapsed: float) -> None:
+        """성공 기록"""
+        now = time.monotonic()
+        self.latency.add(elapsed)
+        with self._lock:
+            self._outcomes.append((now, True))
+            self._prune(now)
+            self._consecutive = 0
+            if self._state == HALF_OPEN:
+                # 회복 - 이전 장애 기록은 버리고 새로 시작
+                self._state = CLOSED
+                self._open_for = self.config.open_seconds
+                self._probe_in_flight = False
+                self._outcomes.clear()
+
+    def record_failure(self, elapsed: float) -> None:
+        """실패 기록 (조건을 넘으면 차단)"""
+        now = time.monotonic()
+        self.latency.add(elapsed)
+        with self._lock:
+            self._outcomes.append((now, False))
+            self._prune(now)
+            self._consecutive += 1
+
+            if self._state == HALF_OPEN:
+                self._open_for = min(self._open_for * 2, self.config.max_open_seconds)
+                self._trip(now)
+                return
+            if self._state != CLOSED:
+                return
+
+            total = len(self._outcomes)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if (self._consecutive >= self.config.consecutive_failures
+                    or (total >= self.config.min_requests and failures / total >= self.config.failure_rate)):
+                self._trip(now)
+
+    def _trip(self, now: float) -> None:
+        self._state = OPEN
+        self._opened_at = now
+        self._probe_in_flight = False
+        self.trips += 1
+
+    def stats(self) -> dict:
+        """상태/오류율/지연 (ms)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refresh(now)
+            self._prune(now)
+            total = len(self._outcomes)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            state = self._state
+            retry_in = max(0.0, self._open_for - (now - self._opened_at)) if state == OPEN else 0.0
+        return {
+            "state": state,
+            "requests": total,
+            "error_rate": round(failures / total, 4) if total else 0.0,
+            "consecutive_failures": self._consecutive,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "retry_in_seconds": round(retry_in, 1),
+            "latency_ms": self.latency.summary(scale=1000.0)
+        }
@@ -0,0 +1,48 @@
+"""
+AI 케어브릿지 - 헤지 요청 예산
+느린 요청을 다른 제공자로 한 번 더 보낼 때 추가 비용을 하루 단위로 제한합니다.
+"""
+import threading
+from datetime import date
+
+
+class HedgeBudget:
+    """하루 헤지 요청 한도 (프로세스 단위, 날짜가 바뀌면 초기화)"""
+
+    def __init__(self, daily_limit: int):
+        self.daily_limit = max(0, daily_limit)
+        self._day = date.today()
+        self._used = 0
+        self._lock = threading.Lock()
+        self.exhausted = 0
+
+    def _roll(self) -> None:
+        today = date.today()
+        if today != self._day:
+            self._day = today
+            self._used = 0
+
+    def available(self) -> bool:
+        """오늘 남은 한도가 있는지"""
+        with self._lock:
+            self._roll()
+            if self._used < self.daily_limit:
+                return True
+            self.exhausted += 1
+            return False
+
+    def spend(self) -> None:
+        """한도 1 사용"""
+        with self._lock:
+            self._roll()
+            self._used += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._roll()
+            return {
+                "day": self._day.isoformat(),
+                "used": self._used,
+                "daily_limit": self.daily_limit,
+                "exhausted": self.exhausted
+            }
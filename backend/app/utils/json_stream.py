@@ -0,0 +1,77 @@
+"""
+AI 케어브릿지 - JSON 스트리밍 읽기
+큰 JSON 배열 파일을 원소 단위로 읽습니다 (json.load처럼 배열 전체를 메모리에 올리지 않음).
+"""
+import json
+from typing import Any, Iterator, TextIO
+
+READ_CHUNK_SIZE = 1 << 16
+
+
+def iter_json_array(f: TextIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    JSON 배열을 원소 단위로 읽기
+
+    원소 해석은 json.JSONDecoder.raw_decode에 맡기고, 여기서는 원소 사이의
+    공백/쉼표/대괄호만 확인합니다. 원소가 읽기 버퍼 경계에 걸리면 더 읽은 뒤
+    다시 해석하므로 메모리에는 읽기 버퍼와 원소 하나만 올라갑니다.
+
+    Raises:
+        ValueError: JSON 배열이 아니거나 형식이 잘못됨 (json.JSONDecodeError 포함)
+    """
+    decoder = json.JSONDecoder()
+    chunk_size = max(1, chunk_size)
+    buf = ""
+    pos = 0
+    eof = False
+
+    def refill() -> bool:
+        """읽은 만큼 버퍼 앞을 버리고 다음 조각을 붙임 (파일 끝이면 False)"""
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def peek() -> str:
+        """공백을 건너뛴 다음 문자 (파일 끝이면 빈 문자열)"""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos].isspace():
+                pos += 1
+            if pos < len(buf) or not refill():
+                return buf[pos:pos + 1]
+
+    if peek() != "[":
+        raise ValueError("JSON 배열이 아닙니다")
+    pos += 1
+    if peek() == "]":
+        return
+
+    while True:
+        peek()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # 원소가 버퍼 경계에서 잘렸을 수 있으므로 더 읽고 다시 해석
+                if refill():
+                    continue
+                raise
+            # 버퍼 끝에서 끝난 값은 잘린 숫자/리터럴일 수 있으므로 더 읽고 다시 해석
+            if end < len(buf) or not refill():
+                break
+        pos = end
+        yield item
+
+        separator = peek()
+        pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"JSON 배열 형식 오류: ',' 또는 ']' 대신 {separator or '파일 끝'!r}")
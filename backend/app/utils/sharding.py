@@ -0,0 +1,9 @@
+"""
+AI 케어브릿지 - 샤딩 유틸리티
+"""
+import zlib
+
+
+def shard_of(key: str, shards: int) -> int:
+    """키(사용자 ID 등) → 샤드 번호 (프로세스가 달라도 같은 값)"""
+    return zlib.crc32(key.encode("utf-8")) % max(1, shards)
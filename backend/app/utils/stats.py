@@ -0,0 +1,52 @@
+"""
+AI 케어브릿지 - 런타임 통계 유틸리티
+"""
+import threading
+from collections import deque
+from typing import Deque, Optional
+
+
+class RollingWindow:
+    """최근 N개 관측값의 분위수 계산용 슬라이딩 윈도우"""
+
+    def __init__(self, size: int = 1024):
+        self._values: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """관측값 추가"""
+        with self._lock:
+            self._values.append(value)
+            self.count += 1
+
+    def percentile(self, p: float) -> Optional[float]:
+        """분위수 (0~100), 관측값이 없으면 None"""
+        with self._lock:
+            if not self._values:
+                return None
+            ordered = sorted(self._values)
+        index = min(len(ordered) - 1, max(0, int(round(p / 100.0 * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def summary(self, scale: float = 1.0, digits: int = 2) -> dict:
+        """count/p50/p95/p99/max 요약 (scale로 단위 변환, 예: 초 -> ms는 1000)"""
+        with self._lock:
+            ordered = sorted(self._values)
+        if not ordered:
+            return {"count": self.count, "p50": None, "p95": None, "p99": None, "max": None}
+
+        def pick(p: float) -> float:
+            index = min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))
+            return round(ordered[index] * scale, digits)
+
+        return {
+            "count": self.count,
+            "p50": pick(50),
+            "p95": pick(95),
+            "p99": pick(99),
+            "max": round(ordered[-1] * scale, digits)
+        }
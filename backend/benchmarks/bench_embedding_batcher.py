@@ -0,0 +1,90 @@
+"""
+AI 케어브릿지 - 임베딩 마이크로 배칭 벤치마크
+
+호출당 고정 비용(HTTP 왕복 또는 모델 forward)과 텍스트당 비용을 흉내 낸
+가짜 제공자로, 동시성별 처리량을 배칭 사용/미사용으로 비교합니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_embedding_batcher.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.embedding_batcher import EmbeddingBatcher  # noqa: E402
+
+CALL_OVERHEAD_MS = 40.0   # 호출당 고정 비용
+PER_TEXT_MS = 0.5         # 텍스트당 추가 비용
+MAX_INFLIGHT_CALLS = 4    # 제공자 동시 호출 한도 (커넥션/GPU 한도 흉내)
+REQUESTS = 256
+CONCURRENCY_LEVELS = [1, 4, 16, 64, 128]
+
+
+class FakeProvider:
+    """지연만 흉내 내는 임베딩 제공자"""
+
+    def __init__(self):
+        self.calls = 0
+        self._slots = asyncio.Semaphore(MAX_INFLIGHT_CALLS)
+
+    async def embed(self, texts):
+        async with self._slots:
+            self.calls += 1
+            await asyncio.sleep((CALL_OVERHEAD_MS + PER_TEXT_MS * len(texts)) / 1000.0)
+            return [[float(len(t))] * 8 for t in texts]
+
+
+async def run(concurrency: int, batched: bool, window_ms: float, max_batch: int) -> tuple:
+    """요청 REQUESTS개를 주어진 동시성으로 처리하고 (처리량, p50, p95, 호출 수) 반환"""
+    provider = FakeProvider()
+    batcher = EmbeddingBatcher(provider.embed, window_ms=window_ms, max_batch_size=max_batch)
+
+    async def embed_one(text: str):
+        if batched:
+            return await batcher.submit(text)
+        return (await provider.embed([text]))[0]
+
+    latencies = []
+    queue = asyncio.Queue()
+    for i in range(REQUESTS):
+        queue.put_nowait(f"질문 {i}")
+
+    async def worker():
+        while not queue.empty():
+            text = queue.get_nowait()
+            start = time.perf_counter()
+            await embed_one(text)
+            latencies.append((time.perf_counter() - start) * 1000.0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    return REQUESTS / elapsed, p50, p95, provider.calls
+
+
+async def main():
+    window_ms = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5"))
+    max_batch = int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "32"))
+
+    print(f"제공자: 호출당 {CALL_OVERHEAD_MS}ms + 텍스트당 {PER_TEXT_MS}ms, 동시 호출 {MAX_INFLIGHT_CALLS}개")
+    print(f"배칭: window={window_ms}ms, max_batch={max_batch}, 요청 {REQUESTS}개\n")
+    print(f"{'동시성':>6} | {'모드':<8} | {'처리량(req/s)':>13} | {'p50(ms)':>8} | {'p95(ms)':>8} | {'호출 수':>7}")
+    print("-" * 66)
+
+    for concurrency in CONCURRENCY_LEVELS:
+        for batched in (False, True):
+            rps, p50, p95, calls = await run(concurrency, batched, window_ms, max_batch)
+            mode = "batched" if batched else "single"
+            print(f"{concurrency:>6} | {mode:<8} | {rps:>13.1f} | {p50:>8.1f} | {p95:>8.1f} | {calls:>7}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
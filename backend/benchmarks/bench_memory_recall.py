@@ -0,0 +1,127 @@
+"""
+AI 케어브릿지 - 장기 기억 조회 지연 벤치마크
+
+user_id 필터 top-k 조회 지연을 단일 컬렉션과 사용자 해시 샤드 컬렉션
+(LongTermMemory 방식)으로 비교합니다. 두 가지를 차례로 늘려 가며 측정합니다.
+- 사용자 수 (사용자당 기억 MEMORIES_PER_USER개 고정)
+- 사용자당 기억 수 (사용자 BENCH_MEMORY_USERS명 고정)
+임베딩 모델 없이 무작위 벡터를 쓰므로 순수 벡터 DB 조회 비용만 측정합니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_memory_recall.py
+    BENCH_USERS=1000,10000 BENCH_SHARDS=64 python benchmarks/bench_memory_recall.py
+    BENCH_MEMORIES=10,100,1000 BENCH_MEMORY_USERS=100 python benchmarks/bench_memory_recall.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import chromadb  # noqa: E402
+from app.utils.sharding import shard_of  # noqa: E402
+
+DIM = 384                  # 임베딩 차원 (실제 모델보다 작게 잡아 적재 시간 단축)
+MEMORIES_PER_USER = 20     # 사용자 수를 늘릴 때의 사용자당 기억 수
+QUERIES = 200
+K = 3
+BATCH = 5000               # 적재 배치 크기
+
+
+def random_vectors(rng: random.Random, n: int):
+    return [[rng.random() for _ in range(DIM)] for _ in range(n)]
+
+
+def load(client, users: int, memories: int, shards: int, rng: random.Random) -> dict:
+    """사용자별 기억 적재 (shards=1이면 단일 컬렉션)"""
+    collections = {
+        shard: client.create_collection(f"bench_{shards}_{shard:03d}", metadata={"hnsw:space": "cosine"})
+        for shard in range(shards)
+    }
+    pending = {shard: ([], [], []) for shard in range(shards)}
+
+    def flush(shard):
+        ids, embeddings, metadatas = pending[shard]
+        if ids:
+            collections[shard].add(ids=ids, embeddings=embeddings, metadatas=metadatas)
+            pending[shard] = ([], [], [])
+
+    for u in range(users):
+        user_id = f"user_{u:06d}"
+        shard = shard_of(user_id, shards)
+        ids, embeddings, metadatas = pending[shard]
+        for m in range(memories):
+            ids.append(f"{user_id}_{m}")
+            metadatas.append({"user_id": user_id})
+        embeddings.extend(random_vectors(rng, memories))
+        if len(ids) >= BATCH:
+            flush(shard)
+    for shard in range(shards):
+        flush(shard)
+    return collections
+
+
+def measure(collections: dict, users: int, shards: int, rng: random.Random) -> tuple:
+    """무작위 사용자 QUERIES회 조회 → (p50, p95, p99) ms"""
+    # 샤드별 첫 조회는 인덱스 로드 비용이 섞이므로 미리 한 번씩 조회
+    for collection in collections.values():
+        collection.query(query_embeddings=random_vectors(rng, 1), n_results=1)
+
+    latencies = []
+    for _ in range(QUERIES):
+        user_id = f"user_{rng.randrange(users):06d}"
+        embedding = random_vectors(rng, 1)[0]
+        start = time.perf_counter()
+        collections[shard_of(user_id, shards)].query(
+            query_embeddings=[embedding],
+            n_results=K,
+            where={"user_id": user_id}
+        )
+        latencies.append((time.perf_counter() - start) * 1000.0)
+
+    latencies.sort()
+    return (
+        latencies[len(latencies) // 2],
+        latencies[int(len(latencies) * 0.95) - 1],
+        latencies[int(len(latencies) * 0.99) - 1]
+    )
+
+
+def run(levels: list, shard_count: int, rng: random.Random) -> None:
+    """(사용자 수, 사용자당 기억 수) 조합마다 단일/샤드 컬렉션 측정"""
+    print(f"{'사용자 수':>8} | {'기억/사용자':>9} | {'모드':<10} | {'적재(s)':>8} | {'p50(ms)':>8} | {'p95(ms)':>8} | {'p99(ms)':>8}")
+    print("-" * 78)
+    for users, memories in levels:
+        for shards in (1, shard_count):
+            with tempfile.TemporaryDirectory() as path:
+                client = chromadb.PersistentClient(path=path)
+                start = time.perf_counter()
+                collections = load(client, users, memories, shards, rng)
+                load_time = time.perf_counter() - start
+                p50, p95, p99 = measure(collections, users, shards, rng)
+                mode = "single" if shards == 1 else f"shards={shards}"
+                print(f"{users:>8} | {memories:>9} | {mode:<10} | {load_time:>8.1f} | {p50:>8.2f} | {p95:>8.2f} | {p99:>8.2f}")
+    print()
+
+
+def main():
+    user_levels = [int(n) for n in os.getenv("BENCH_USERS", "100,1000,5000").split(",")]
+    memory_levels = [int(n) for n in os.getenv("BENCH_MEMORIES", "10,100,1000").split(",")]
+    memory_users = int(os.getenv("BENCH_MEMORY_USERS", "100"))
+    shard_count = int(os.getenv("BENCH_SHARDS", "64"))
+    rng = random.Random(42)
+
+    print(f"{DIM}차원, top-{K}, 조회 {QUERIES}회\n")
+
+    print(f"[1] 사용자 수 증가 (사용자당 기억 {MEMORIES_PER_USER}개)")
+    run([(users, MEMORIES_PER_USER) for users in user_levels], shard_count, rng)
+
+    print(f"[2] 사용자당 기억 수 증가 (사용자 {memory_users}명)")
+    run([(memory_users, memories) for memories in memory_levels], shard_count, rng)
+
+
+if __name__ == "__main__":
+    main()
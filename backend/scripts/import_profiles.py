@@ -0,0 +1,69 @@
+"""
+AI 케어브릿지 - 사용자 프로필 대량 등록
+
+JSON Lines(한 줄에 프로필 하나) 또는 JSON 배열 파일을 읽어
+설정된 프로필 저장소(PROFILE_STORE_BACKEND)에 배치로 등록합니다.
+파일은 스트리밍으로 읽으므로 수만 건도 메모리에 한 번에 올리지 않습니다.
+JSON 배열도 원소 단위로 나눠 읽으므로 메모리에는 읽기 버퍼와 프로필 하나만 올라갑니다.
+(배열 원소 하나가 잘못되면 그 뒤를 이어 읽을 수 없으므로 중단합니다.
+ 잘못된 줄만 건너뛰고 계속하려면 JSON Lines를 사용하세요.)
+
+실행:
+    cd backend
+    PROFILE_STORE_BACKEND=redis python scripts/import_profiles.py profiles.jsonl
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterator
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.memory.profile_store import profile_repository  # noqa: E402
+from app.memory.redis_client import close_redis  # noqa: E402
+from app.utils.json_stream import iter_json_array  # noqa: E402
+
+
+def read_profiles(path: str) -> Iterator[Dict[str, Any]]:
+    """JSON Lines 또는 JSON 배열 파일에서 프로필 읽기"""
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+
+        if first == "[":
+            yield from iter_json_array(f)
+            return
+
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"  {line_no}번째 줄 건너뜀: {e}", file=sys.stderr)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="사용자 프로필 대량 등록")
+    parser.add_argument("path", help="JSON Lines 또는 JSON 배열 파일")
+    parser.add_argument("--batch-size", type=int, default=1000, help="파이프라인 배치 크기")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        total = await profile_repository.bulk_import(read_profiles(args.path), batch_size=args.batch_size)
+    finally:
+        await close_redis()
+    elapsed = time.perf_counter() - started
+
+    print(f"등록 완료: {total}건 ({profile_repository.backend.name}), {elapsed:.2f}초, {total / elapsed:.0f}건/초")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
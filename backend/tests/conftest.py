@@ -0,0 +1,19 @@
+"""
+테스트 공통 설정
+
+app 모듈은 import 시점에 설정을 읽고 싱글톤을 만들므로, 그 전에 데이터 경로를
+임시 디렉터리로 돌려 테스트가 backend/data를 건드리지 않게 합니다.
+"""
+import os
+import tempfile
+
+_DATA_DIR = tempfile.mkdtemp(prefix="carebridge-test-")
+
+for key, name in {
+    "CHROMA_PERSIST_DIR": "chroma_db",
+    "CONVERSATION_LOG_DIR": "conversations",
+    "CHECKPOINT_SQLITE_PATH": "checkpoints.sqlite",
+    "EMBEDDING_CACHE_PATH": "embedding_cache.sqlite",
+    "AUDIO_CACHE_DIR": "tts_cache",
+}.items():
+    os.environ.setdefault(key, os.path.join(_DATA_DIR, name))
@@ -0,0 +1,85 @@
+"""
+TTS 오디오 응답의 Range/ETag 처리 테스트
+"""
+import pytest
+from starlette.requests import Request
+
+from app.api.routes.voice import _audio_response, _parse_range
+from app.services.tts import AudioClip
+
+DATA = bytes(range(100))
+CLIP = AudioClip(key="abc123", data=DATA, format="mp3", provider="openai")
+ETAG = '"abc123"'
+
+
+def request(**headers) -> Request:
+    raw = [(name.replace("_", "-").lower().encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", (0, 9)),
+    ("bytes=10-", (10, 99)),
+    ("bytes=90-200", (90, 99)),
+    ("bytes=-10", (90, 99)),
+    ("bytes=-500", (0, 99)),
+    (" bytes=5-5 ", (5, 5)),
+    ("bytes=99-99", (99, 99)),
+])
+def test_parse_range_valid(header, expected):
+    assert _parse_range(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", [
+    "bytes=100-", "bytes=50-10", "bytes=-0", "bytes=-", "bytes=0-1,5-6", "items=0-1", "bytes=a-b", "",
+])
+def test_parse_range_invalid(header):
+    assert _parse_range(header, 100) is None
+
+
+def test_parse_range_empty_body():
+    assert _parse_range("bytes=0-", 0) is None
+
+
+def test_full_response_headers():
+    response = _audio_response(request(), CLIP, "speech")
+    assert response.status_code == 200
+    assert response.body == DATA
+    assert response.headers["etag"] == ETAG
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-type"] == "audio/mpeg"
+
+
+@pytest.mark.parametrize("if_none_match", [ETAG, f'"other", {ETAG}', "*"])
+def test_not_modified(if_none_match):
+    response = _audio_response(request(if_none_match=if_none_match), CLIP, "speech")
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == ETAG
+
+
+def test_other_etag_gets_full_body():
+    response = _audio_response(request(if_none_match='"other"'), CLIP, "speech")
+    assert response.status_code == 200
+
+
+def test_partial_content():
+    response = _audio_response(request(range="bytes=10-19"), CLIP, "speech")
+    assert response.status_code == 206
+    assert response.body == DATA[10:20]
+    assert response.headers["content-range"] == "bytes 10-19/100"
+
+
+def test_unsatisfiable_range():
+    response = _audio_response(request(range="bytes=200-"), CLIP, "speech")
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */100"
+
+
+def test_if_range_mismatch_sends_full_body():
+    response = _audio_response(request(range="bytes=0-9", if_range='"stale"'), CLIP, "speech")
+    assert response.status_code == 200
+    assert response.body == DATA
+
+    response = _audio_response(request(range="bytes=0-9", if_range=ETAG), CLIP, "speech")
+    assert response.status_code == 206
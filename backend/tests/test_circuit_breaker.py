@@ -0,0 +1,140 @@
+"""
+서킷 브레이커 상태 전환 테스트
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.utils import circuit_breaker
+from app.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, BreakerConfig, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    options = {"window_seconds": 60.0, "min_requests": 5, "failure_rate": 0.5,
+               "consecutive_failures": 3, "open_seconds": 30.0, "max_open_seconds": 100.0}
+    options.update(kwargs)
+    return CircuitBreaker("test", BreakerConfig(**options))
+
+
+def test_consecutive_failures_trip(clock):
+    breaker = make_breaker()
+    breaker.record_failure(0.1)
+    breaker.record_failure(0.1)
+    assert breaker.state == CLOSED
+    breaker.record_failure(0.1)
+    assert breaker.state == OPEN
+    assert breaker.trips == 1
+    assert not breaker.try_acquire()
+    assert breaker.rejected == 1
+
+
+def test_success_resets_consecutive_count(clock):
+    breaker = make_breaker(min_requests=100)
+    for _ in range(5):
+        breaker.record_failure(0.1)
+        breaker.record_failure(0.1)
+        breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+
+
+def test_failure_rate_trips_after_min_requests(clock):
+    breaker = make_breaker(consecutive_failures=100)
+    for ok in (True, False, True, False):
+        (breaker.record_success if ok else breaker.record_failure)(0.1)
+    assert breaker.state == CLOSED  # 4건은 min_requests 미만
+    breaker.record_failure(0.1)     # 3/5 실패
+    assert breaker.state == OPEN
+
+
+def test_old_outcomes_leave_window(clock):
+    breaker = make_breaker(consecutive_failures=100)
+    for _ in range(4):
+        breaker.record_failure(0.1)
+    assert breaker.error_rate() == 1.0
+    clock.advance(61)
+    assert breaker.error_rate() == 0.0
+    breaker.record_failure(0.1)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_allows_single_probe(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure(0.1)
+    clock.advance(29)
+    assert not breaker.try_acquire()
+    clock.advance(1)
+    assert breaker.state == HALF_OPEN
+    assert breaker.try_acquire()
+    assert not breaker.try_acquire()
+
+
+def test_probe_success_closes_and_clears_history(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure(0.1)
+    clock.advance(30)
+    assert breaker.try_acquire()
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+    assert breaker.error_rate() == 0.0
+    assert breaker.try_acquire() and breaker.try_acquire()
+
+
+def test_probe_failure_doubles_open_time_up_to_max(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure(0.1)
+
+    for open_for in (30, 60, 100, 100):
+        clock.advance(open_for - 1)
+        assert breaker.state == OPEN
+        clock.advance(1)
+        assert breaker.try_acquire()
+        breaker.record_failure(0.1)
+    assert breaker.trips == 5
+
+
+def test_lost_probe_is_retried_after_open_time(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure(0.1)
+    clock.advance(30)
+    assert breaker.try_acquire()
+    # 시험 호출이 결과 없이 사라짐 (취소 등)
+    clock.advance(29)
+    assert not breaker.try_acquire()
+    clock.advance(1)
+    assert breaker.try_acquire()
+
+
+def test_stats(clock):
+    breaker = make_breaker()
+    breaker.record_success(0.2)
+    for _ in range(3):
+        breaker.record_failure(0.1)
+    clock.advance(10)
+    stats = breaker.stats()
+    assert stats["state"] == OPEN
+    assert stats["requests"] == 4
+    assert stats["error_rate"] == 0.75
+    assert stats["trips"] == 1
+    assert stats["retry_in_seconds"] == 20.0
@@ -0,0 +1,94 @@
+"""
+대화 로그 (추가 전용 로그 + 끝 오프셋 인덱스) 테스트
+"""
+import pytest
+
+from app.memory.conversation_log import ConversationLog, _encode
+
+
+def record(i: int) -> dict:
+    return {"id": f"m{i}", "role": "user" if i % 2 == 0 else "assistant", "content": f"메시지 {i}", "timestamp": 1.0}
+
+
+@pytest.fixture
+def log(tmp_path):
+    return ConversationLog(str(tmp_path), batch_size=4, flush_interval_ms=5)
+
+
+def write(log: ConversationLog, session_id: str, records) -> None:
+    log._write_batch({session_id: [_encode(r) for r in records]})
+
+
+def contents(records) -> list:
+    return [r["content"] for r in records]
+
+
+def test_empty_session(log):
+    assert log.read_page("none") == ([], None, 0)
+    assert log.count("none") == 0
+
+
+def test_pages_backwards_in_time_order(log):
+    write(log, "s", [record(i) for i in range(3)])
+    write(log, "s", [record(i) for i in range(3, 7)])
+
+    page, cursor, total = log.read_page("s", limit=3)
+    assert (contents(page), cursor, total) == (["메시지 4", "메시지 5", "메시지 6"], 4, 7)
+
+    page, cursor, _ = log.read_page("s", limit=3, before=cursor)
+    assert (contents(page), cursor) == (["메시지 1", "메시지 2", "메시지 3"], 1)
+
+    page, cursor, _ = log.read_page("s", limit=3, before=cursor)
+    assert (contents(page), cursor) == (["메시지 0"], None)
+
+
+def test_cursor_bounds(log):
+    write(log, "s", [record(i) for i in range(3)])
+    assert contents(log.read_page("s", limit=10, before=99)[0]) == ["메시지 0", "메시지 1", "메시지 2"]
+    assert log.read_page("s", limit=10, before=0) == ([], None, 3)
+    assert log.read_page("s", limit=0) == ([], None, 3)
+
+
+def test_decoded_record_shape(log):
+    write(log, "s", [{
+        "id": "a1", "role": "assistant", "content": "안녕하세요", "agent_type": "companion",
+        "emotion": {"primary": "lonely", "risk_level": 1}, "timestamp": 0.0
+    }])
+    [item] = log.read_page("s")[0]
+    assert item["id"] == "a1"
+    assert item["agent_type"] == "companion"
+    assert item["emotion"] == {"primary": "lonely", "risk_level": 1}
+
+
+def test_unsafe_session_id_is_hashed(log, tmp_path):
+    write(log, "../escape", [record(0)])
+    assert log.count("../escape") == 1
+    assert not (tmp_path.parent / "escape.log").exists()
+
+
+def test_unindexed_tail_is_trimmed_before_next_write(log):
+    write(log, "s", [record(0), record(1)])
+    log_path, idx_path = log._paths("s")
+    with open(log_path, "ab") as f:
+        f.write(b'{"i":"torn",')          # 인덱스 기록 전에 죽은 레코드
+    with open(idx_path, "ab") as f:
+        f.write(b"\x01\x02\x03")          # 반쯤 쓴 인덱스 항목
+
+    # 아직 인덱스에 없는 바이트는 읽히지 않음
+    assert contents(log.read_page("s")[0]) == ["메시지 0", "메시지 1"]
+
+    write(log, "s", [record(2)])
+    page, _, total = log.read_page("s")
+    assert total == 3
+    assert contents(page) == ["메시지 0", "메시지 1", "메시지 2"]
+
+
+@pytest.mark.asyncio
+async def test_append_is_flushed_on_close(log):
+    log.append("s", [record(i) for i in range(5)])
+    log.append("t", [record(9)])
+    await log.close()
+
+    assert log.count("s") == 5
+    assert contents(log.read_page("t")[0]) == ["메시지 9"]
+    assert log.stats()["records_written"] == 6
@@ -0,0 +1,94 @@
+"""
+임베딩 마이크로 배칭 테스트
+"""
+import asyncio
+from typing import List
+
+import pytest
+
+from app.services.embedding_batcher import EmbeddingBatcher
+
+
+class Recorder:
+    def __init__(self, fail: bool = False):
+        self.calls: List[List[str]] = []
+        self.fail = fail
+
+    async def __call__(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("embedding down")
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch():
+    embed = Recorder()
+    batcher = EmbeddingBatcher(embed, window_ms=20, max_batch_size=32)
+
+    results = await asyncio.gather(*(batcher.submit(t) for t in ["a", "bb", "ccc"]))
+
+    assert results == [[1.0], [2.0], [3.0]]
+    assert embed.calls == [["a", "bb", "ccc"]]
+    assert batcher.stats()["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_duplicate_texts_embedded_once():
+    embed = Recorder()
+    batcher = EmbeddingBatcher(embed, window_ms=20)
+
+    results = await asyncio.gather(batcher.submit("x"), batcher.submit("x"), batcher.submit("yy"))
+
+    assert results == [[1.0], [1.0], [2.0]]
+    assert embed.calls == [["x", "yy"]]
+    assert batcher.stats()["items"] == 3
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting_for_window():
+    embed = Recorder()
+    batcher = EmbeddingBatcher(embed, window_ms=10_000, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.submit("a"), batcher.submit("b")),
+        timeout=1.0
+    )
+    assert results == [[1.0], [1.0]]
+    assert embed.calls == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_requests_after_flush_start_a_new_batch():
+    embed = Recorder()
+    batcher = EmbeddingBatcher(embed, window_ms=5, max_batch_size=2)
+
+    first = await asyncio.gather(batcher.submit("a"), batcher.submit("b"), batcher.submit("c"))
+
+    assert first == [[1.0], [1.0], [1.0]]
+    assert embed.calls == [["a", "b"], ["c"]]
+    assert batcher.stats()["max_batch_size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_waiter():
+    batcher = EmbeddingBatcher(Recorder(fail=True), window_ms=5)
+
+    results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_break_batch():
+    embed = Recorder()
+    batcher = EmbeddingBatcher(embed, window_ms=20)
+
+    cancelled = asyncio.ensure_future(batcher.submit("a"))
+    kept = asyncio.ensure_future(batcher.submit("bb"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await kept == [2.0]
+    assert embed.calls == [["a", "bb"]]
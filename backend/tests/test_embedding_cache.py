@@ -0,0 +1,111 @@
+"""
+임베딩 캐시 (메모리 LRU + SQLite) 테스트
+"""
+import itertools
+
+import pytest
+
+from app.services import embedding_cache as cache_module
+from app.services.embedding_cache import EmbeddingCache
+
+DIM = 4
+VECTOR_BYTES = DIM * 4  # float32
+
+
+def vec(i: float):
+    # float32로 정확히 표현되는 값만 사용
+    return [i, i + 0.5, i + 0.25, -i]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """last_used가 항상 증가하도록 time.time 대체"""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(cache_module.time, "time", lambda: float(next(ticks)))
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    caches = []
+
+    def make(max_bytes: int = 1 << 20, max_memory_items: int = 100) -> EmbeddingCache:
+        cache = EmbeddingCache(str(tmp_path / "cache.sqlite"), max_bytes, max_memory_items)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+def test_roundtrip_and_miss(make_cache):
+    cache = make_cache()
+    cache.put_many("m", ["a", "b"], [vec(1), vec(2)])
+    assert cache.get_many("m", ["a", "x", "b"]) == [vec(1), None, vec(2)]
+    stats = cache.stats()
+    assert stats["hits_memory"] == 2
+    assert stats["misses"] == 1
+
+
+def test_model_is_part_of_key(make_cache):
+    cache = make_cache()
+    cache.put_many("m1", ["a"], [vec(1)])
+    assert cache.get_many("m2", ["a"]) == [None]
+
+
+def test_disk_hit_after_memory_lru_eviction(make_cache):
+    cache = make_cache(max_memory_items=1)
+    cache.put_many("m", ["a", "b"], [vec(1), vec(2)])
+    assert cache.stats()["memory_items"] == 1
+
+    assert cache.get_many("m", ["a"]) == [vec(1)]
+    assert cache.hits_disk == 1
+
+
+def test_persists_across_instances(make_cache):
+    first = make_cache()
+    first.put_many("m", ["a"], [vec(3)])
+    first.close()
+
+    second = make_cache()
+    assert second.get_many("m", ["a"]) == [vec(3)]
+    assert second.stats()["disk_bytes"] == VECTOR_BYTES
+
+
+def test_duplicate_texts_in_one_lookup(make_cache):
+    cache = make_cache(max_memory_items=0)
+    cache.put_many("m", ["a"], [vec(1)])
+    assert cache.get_many("m", ["a", "a"]) == [vec(1), vec(1)]
+
+
+def test_overwrite_does_not_double_count(make_cache):
+    cache = make_cache()
+    cache.put_many("m", ["a"], [vec(1)])
+    cache.put_many("m", ["a"], [vec(2)])
+    assert cache.stats()["disk_bytes"] == VECTOR_BYTES
+    assert cache.get_many("m", ["a"]) == [vec(2)]
+
+
+def test_evicts_least_recently_used_to_90_percent(make_cache, clock):
+    cache = make_cache(max_bytes=4 * VECTOR_BYTES, max_memory_items=0)
+    for name in "abcd":
+        cache.put_many("m", [name], [vec(1)])
+    assert cache.evictions == 0
+
+    # a를 다시 사용하면 가장 오래 안 쓴 항목은 b
+    assert cache.get_many("m", ["a"]) == [vec(1)]
+
+    cache.put_many("m", ["e"], [vec(1)])
+    # 5개(80B) > 64B → 90%(57B) 이하가 될 때까지 b, c 삭제
+    assert cache.evictions == 2
+    assert cache.stats()["disk_bytes"] == 3 * VECTOR_BYTES
+    found = cache.get_many("m", list("abcde"))
+    assert [v is not None for v in found] == [True, False, False, True, True]
+
+
+def test_eviction_drops_memory_copies(make_cache, clock):
+    cache = make_cache(max_bytes=2 * VECTOR_BYTES, max_memory_items=10)
+    cache.put_many("m", ["a"], [vec(1)])
+    cache.put_many("m", ["b"], [vec(2)])
+    cache.put_many("m", ["c"], [vec(3)])
+    assert cache.get_many("m", ["a"]) == [None]
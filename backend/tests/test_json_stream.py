@@ -0,0 +1,69 @@
+"""
+JSON 배열 스트리밍 읽기 테스트
+"""
+import io
+import json
+
+import pytest
+
+from app.utils.json_stream import iter_json_array
+
+
+class SplitReader:
+    """정해진 조각 단위로만 돌려주는 파일 (read(n)이 조각 경계를 넘지 않음)"""
+
+    def __init__(self, text: str, cuts):
+        bounds = [0, *cuts, len(text)]
+        self.pieces = [text[a:b] for a, b in zip(bounds, bounds[1:]) if b > a]
+
+    def read(self, size: int = -1) -> str:
+        return self.pieces.pop(0) if self.pieces else ""
+
+
+PROFILES = [
+    {"user_id": "u1", "name": "김순자", "note": "따옴표 \" 와 역슬래시 \\ 와 \\u 이스케이프"},
+    {"user_id": "u2", "name": "박철수", "tags": ["]", "[", ",", "{}"], "nested": {"a": [1, [2, [3]]]}},
+    {"user_id": "u3", "age": 81, "score": -1.25e-3, "active": True, "memo": None},
+    12345,
+    "문자열 원소 ]",
+    [],
+    {},
+]
+TEXT = " \n[ " + ",\n  ".join(json.dumps(p, ensure_ascii=False) for p in PROFILES) + " ]\n"
+
+
+def test_reads_whole_array():
+    assert list(iter_json_array(io.StringIO(TEXT))) == PROFILES
+
+
+@pytest.mark.parametrize("cut", range(1, len(TEXT)))
+def test_split_at_every_offset(cut):
+    assert list(iter_json_array(SplitReader(TEXT, [cut]), chunk_size=1 << 16)) == PROFILES
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_small_chunks(chunk_size):
+    assert list(iter_json_array(io.StringIO(TEXT), chunk_size=chunk_size)) == PROFILES
+
+
+def test_number_at_chunk_boundary_is_not_truncated():
+    # "[12345]"를 "[12" / "345]"로 나눠 읽어도 12로 끊지 않음
+    assert list(iter_json_array(SplitReader("[12345]", [3]))) == [12345]
+
+
+@pytest.mark.parametrize("text", ["[]", "  [ \n ]  ", "[\n]"])
+def test_empty_array(text):
+    assert list(iter_json_array(io.StringIO(text), chunk_size=1)) == []
+
+
+@pytest.mark.parametrize("text", ["", "{}", '{"a": 1}', "[1, 2", "[1 2]", '[{"a": }]', "[1,]", "[,1]"])
+def test_malformed_input_raises(text):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(text), chunk_size=2))
+
+
+def test_items_before_error_are_yielded():
+    items = iter_json_array(io.StringIO('[{"a": 1}, oops]'))
+    assert next(items) == {"a": 1}
+    with pytest.raises(ValueError):
+        next(items)
@@ -0,0 +1,122 @@
+"""
+어휘 인덱스(BM25)와 RRF 결합 테스트
+"""
+from typing import List
+
+import pytest
+
+from app.services import rag as rag_module
+from app.services.catalog import SearchResult
+from app.services.lexical import LexicalIndex, char_ngrams, compact, reciprocal_rank_fusion
+
+
+PROGRAMS = [
+    {"id": "pension", "name": "기초연금", "keywords": ["연금", "노후 소득"], "eligibility": ["만 65세 이상"]},
+    {"id": "care", "name": "노인맞춤돌봄서비스", "keywords": ["돌봄", "안부 확인"], "eligibility": ["독거 노인"]},
+    {"id": "dental", "name": "노인 틀니 지원", "keywords": ["틀니", "치과"], "eligibility": ["만 65세 이상"]},
+]
+
+
+class FakeCatalog:
+    def __init__(self, programs: List[dict], digest: str = "v1"):
+        self.programs = programs
+        self.digest = digest
+
+    def get_programs(self) -> List[dict]:
+        return self.programs
+
+
+@pytest.fixture
+def index():
+    return LexicalIndex(FakeCatalog(PROGRAMS))
+
+
+def test_ngrams_shared_with_particles():
+    # 조사가 붙어도 원형과 n-gram을 공유
+    assert set(char_ngrams("기초연금")) <= set(char_ngrams("기초연금은"))
+    assert char_ngrams("a") == ["a"]
+    assert compact(" 기초 연금! ") == "기초연금"
+
+
+def test_search_ranks_name_match_first(index):
+    results = index.search("기초연금은 어떻게 받나요")
+    assert results[0][0] == "pension"
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_search_limit_and_allowed_ids(index):
+    assert len(index.search("노인", limit=1)) == 1
+    results = index.search("노인 연금 틀니", allowed_ids={"dental"})
+    assert [program_id for program_id, _ in results] == ["dental"]
+
+
+def test_search_without_overlap_is_empty(index):
+    assert index.search("날씨") == []
+
+
+def test_exact_matches_and_coverage(index):
+    matched, coverage = index.exact_matches("틀니")
+    assert matched == ["dental"]
+    assert coverage == 1.0
+
+    matched, coverage = index.exact_matches("기초연금 신청 방법")
+    assert "pension" in matched
+    assert coverage == pytest.approx(len("기초연금") / len(compact("기초연금 신청 방법")))
+
+    assert index.exact_matches("!!!") == ([], 0.0)
+
+
+def test_rebuilds_when_catalog_changes():
+    catalog = FakeCatalog(PROGRAMS)
+    index = LexicalIndex(catalog)
+    assert index.search("틀니")
+
+    catalog.programs = [p for p in PROGRAMS if p["id"] != "dental"]
+    catalog.digest = "v2"
+    assert all(program_id != "dental" for program_id, _ in index.search("틀니"))
+
+
+def test_rrf_prefers_items_ranked_in_both_lists():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "c", "a"]], k=60)
+    assert [doc_id for doc_id, _ in fused][0] == "b"
+    assert dict(fused)["b"] == pytest.approx(1 / 62 + 1 / 61)
+
+
+def test_rrf_single_list_keeps_order():
+    fused = reciprocal_rank_fusion([["x", "y", "z"]], k=1)
+    assert [doc_id for doc_id, _ in fused] == ["x", "y", "z"]
+
+
+class FakeResultCatalog:
+    def get_result(self, program_id: str, score: float):
+        if program_id == "missing":
+            return None
+        return SearchResult(program_id, program_id, "", "", "", [], "", "", score)
+
+
+@pytest.fixture
+def fuse(monkeypatch):
+    monkeypatch.setattr(rag_module, "program_catalog", FakeResultCatalog())
+    monkeypatch.setattr(rag_module.settings, "HYBRID_RRF_K", 60)
+    return rag_module.RAGService()._fuse
+
+
+def test_fuse_score_is_distance_like(fuse):
+    results = fuse([["a", "b"], ["a", "c"]], n_results=5)
+    # 모든 목록에서 1위면 0, 순위가 낮을수록 1에 가까워짐 (낮을수록 유사)
+    assert results[0].program_id == "a"
+    assert results[0].score == 0.0
+    assert all(0.0 <= r.score < 1.0 for r in results)
+    assert [r.score for r in results] == sorted(r.score for r in results)
+
+
+def test_fuse_single_ranking_is_normalised_per_list(fuse):
+    results = fuse([["a", "b"]], n_results=5)
+    assert results[0].score == 0.0
+    assert results[1].score == pytest.approx(round(1 - (1 / 62) / (1 / 61), 4))
+
+
+def test_fuse_skips_unknown_ids_and_limits(fuse):
+    results = fuse([["missing", "a", "b", "c"]], n_results=2)
+    assert [r.program_id for r in results] == ["a", "b"]
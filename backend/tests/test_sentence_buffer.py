@@ -0,0 +1,70 @@
+"""
+스트리밍 문장 버퍼 테스트
+"""
+from typing import List
+
+from app.agents.nodes.companion import _clean_response as clean_companion_response
+from app.agents.streaming import SentenceBuffer
+
+
+def stream(tokens: List[str], clean_fn=str.strip) -> List[str]:
+    buffer = SentenceBuffer(clean_fn)
+    deltas = []
+    for token in tokens:
+        deltas.extend(buffer.feed(token))
+    deltas.extend(buffer.flush())
+    return deltas
+
+
+def test_emits_at_sentence_end():
+    buffer = SentenceBuffer(str.strip)
+    assert buffer.feed("안녕하세요") == []
+    assert buffer.feed(". 오늘") == ["안녕하세요."]
+    assert buffer.feed(" 어떠세요?") == [" 오늘 어떠세요?"]
+    assert buffer.flush() == []
+
+
+def test_joined_deltas_equal_cleaned_text():
+    text = "날씨가 좋아요. 산책 어떠세요? 무리하지 마세요!"
+    tokens = [text[i:i + 3] for i in range(0, len(text), 3)]
+    assert "".join(stream(tokens)) == text
+
+
+def test_decimal_point_is_not_a_sentence_end():
+    buffer = SentenceBuffer(str.strip)
+    assert buffer.feed("월 32.") == []        # 다음 글자를 보기 전에는 끊지 않음
+    assert buffer.feed("4만원을 받아요. ") == ["월 32.4만원을 받아요."]
+
+
+def test_does_not_split_inside_parentheses_or_stars():
+    buffer = SentenceBuffer(str.strip)
+    assert buffer.feed("좋아요 (감정 반영. 공감 표현") == []
+    assert buffer.feed(") 그래요. ") == ["좋아요 (감정 반영. 공감 표현) 그래요."]
+
+    buffer = SentenceBuffer(str.strip)
+    assert buffer.feed("*응답 수정. 다시*") == []
+    assert buffer.feed(" 네. ") == ["*응답 수정. 다시* 네."]
+
+
+def test_meta_spanning_sentences_is_removed_in_one_piece():
+    tokens = ["그러셨군요", " (※ 감정 반영.", " 위로 기법 적용)", ". 많이 외로우셨겠어요."]
+    assert "".join(stream(tokens, clean_companion_response)) == "그러셨군요. 많이 외로우셨겠어요."
+
+
+def test_sentence_cleaned_to_nothing_is_skipped():
+    deltas = stream(["(※ 메타 설명만 있음.) ", "안녕하세요."], clean_companion_response)
+    assert deltas == ["안녕하세요."]
+
+
+def test_flush_returns_trailing_text_and_ignores_whitespace():
+    buffer = SentenceBuffer(str.strip)
+    buffer.feed("끝맺음 없는 문장")
+    assert buffer.flush() == ["끝맺음 없는 문장"]
+
+    buffer = SentenceBuffer(str.strip)
+    buffer.feed("   ")
+    assert buffer.flush() == []
+
+
+def test_newline_terminates_sentence():
+    assert stream(["첫 줄\n둘째 줄"]) == ["첫 줄", " 둘째 줄"]
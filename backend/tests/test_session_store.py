@@ -0,0 +1,97 @@
+"""
+세션 저장소 (메모리 TTL + LRU) 테스트
+"""
+import pytest
+
+from app.memory import session_store as store_module
+from app.memory.session_store import InMemorySessionStore
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(store_module.time, "monotonic", clock)
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_put_get_delete(clock):
+    store = InMemorySessionStore(max_sessions=10, ttl_seconds=60)
+    await store.put("s1", {"user_id": "u1"})
+
+    assert await store.get("s1") == {"user_id": "u1"}
+    assert await store.get("missing") is None
+    assert await store.delete("s1") is True
+    assert await store.delete("s1") is False
+
+    stats = await store.stats()
+    assert (stats["hits"], stats["misses"], stats["sessions"]) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_expires_after_ttl(clock):
+    store = InMemorySessionStore(max_sessions=10, ttl_seconds=60)
+    await store.put("s1", {})
+
+    clock.now += 60
+    assert await store.get("s1") is None
+    assert store.evictions_ttl == 1
+
+
+@pytest.mark.asyncio
+async def test_get_slides_expiry(clock):
+    store = InMemorySessionStore(max_sessions=10, ttl_seconds=60)
+    await store.put("s1", {})
+
+    clock.now += 50
+    assert await store.get("s1") == {}
+    clock.now += 50
+    assert await store.get("s1") == {}
+    assert store.evictions_ttl == 0
+
+
+@pytest.mark.asyncio
+async def test_purge_stops_at_first_live_session(clock):
+    store = InMemorySessionStore(max_sessions=10, ttl_seconds=60)
+    await store.put("old", {})
+    clock.now += 30
+    await store.put("new", {})
+
+    clock.now += 40   # old는 만료(70초), new는 유효(40초)
+    assert await store.count() == 1
+    assert await store.get("new") == {}
+    assert store.evictions_ttl == 1
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used(clock):
+    store = InMemorySessionStore(max_sessions=2, ttl_seconds=60)
+    await store.put("a", {})
+    await store.put("b", {})
+    await store.get("a")          # a를 최근 사용으로
+    await store.put("c", {})      # 가장 오래 안 쓴 b 제거
+
+    assert await store.get("b") is None
+    assert await store.get("a") == {}
+    assert await store.get("c") == {}
+    assert store.evictions_lru == 1
+
+
+@pytest.mark.asyncio
+async def test_overwrite_does_not_evict(clock):
+    store = InMemorySessionStore(max_sessions=2, ttl_seconds=60)
+    await store.put("a", {"v": 1})
+    await store.put("b", {})
+    await store.put("a", {"v": 2})
+
+    assert await store.count() == 2
+    assert await store.get("a") == {"v": 2}
+    assert store.evictions_lru == 0
@@ -0,0 +1,100 @@
+"""
+실시간 발화 구간 검출 (StreamingVad) 테스트
+"""
+from typing import List
+
+import numpy as np
+import pytest
+
+from app.speech.vad import SpeechSegment, StreamingVad, VadConfig
+
+RATE = 16000
+
+
+def noise(seconds: float, amplitude: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(int(seconds * RATE)) * amplitude).astype(np.float32)
+
+
+def make_vad(**kwargs) -> StreamingVad:
+    options = {"end_silence_ms": 300, "partial_interval_ms": 400, "max_utterance_ms": 30000}
+    options.update(kwargs)
+    return StreamingVad(RATE, VadConfig(), **options)
+
+
+def feed(vad: StreamingVad, samples: np.ndarray, chunk: int) -> List[SpeechSegment]:
+    segments = []
+    for start in range(0, samples.size, chunk):
+        segments.extend(vad.feed(samples[start:start + chunk]))
+    return segments
+
+
+# 조용한 배경 1초 → 발화 1초 → 조용한 배경 1초
+UTTERANCE = np.concatenate([noise(1, 0.001, 1), noise(1, 0.3, 2), noise(1, 0.001, 3)])
+
+
+def finals(segments: List[SpeechSegment]) -> List[SpeechSegment]:
+    return [s for s in segments if s.kind == "final"]
+
+
+def test_single_utterance_with_padding():
+    segments = feed(make_vad(), UTTERANCE, 1600)
+    [final] = finals(segments)
+
+    pad = int(VadConfig().pad_ms / 1000 * RATE)
+    assert abs(final.start - (RATE - pad)) <= 960
+    assert abs(final.end - (2 * RATE + pad)) <= 960
+    assert final.samples.size == final.end - final.start
+
+
+def test_partials_come_before_final_and_share_start():
+    segments = feed(make_vad(), UTTERANCE, 1600)
+    kinds = [s.kind for s in segments]
+    assert kinds[-1] == "final"
+    assert kinds.count("partial") >= 1
+    final = segments[-1]
+    for partial in segments[:-1]:
+        assert partial.start == final.start
+        assert partial.end < final.end
+
+
+def test_chunk_size_does_not_change_segments():
+    expected = [(s.kind, s.start, s.end) for s in feed(make_vad(), UTTERANCE, 1600)]
+    for chunk in (100, 479, 480, 4096, UTTERANCE.size):
+        assert [(s.kind, s.start, s.end) for s in feed(make_vad(), UTTERANCE, chunk)] == expected
+
+
+def test_silence_only():
+    vad = make_vad()
+    assert feed(vad, noise(3, 0.001), 1600) == []
+    assert vad.flush() is None
+
+
+def test_flush_returns_utterance_in_progress():
+    vad = make_vad()
+    assert finals(feed(vad, UTTERANCE[:int(1.8 * RATE)], 1600)) == []
+    segment = vad.flush()
+    assert segment is not None and segment.kind == "final"
+    assert segment.end == int(1.8 * RATE)
+    assert vad.flush() is None
+
+
+def test_long_utterance_is_split():
+    samples = np.concatenate([noise(1, 0.001, 1), noise(2.5, 0.3, 2), noise(1, 0.001, 3)])
+    segments = finals(feed(make_vad(max_utterance_ms=1000, partial_interval_ms=0), samples, 1600))
+    assert len(segments) >= 3
+    for previous, current in zip(segments, segments[1:]):
+        assert current.start >= previous.end
+
+
+def test_buffer_stays_bounded_between_utterances():
+    vad = make_vad()
+    feed(vad, UTTERANCE, 1600)
+    feed(vad, noise(20, 0.001, 4), 1600)
+    # 발화가 없을 때는 앞 여유(pad)와 잘라내기 단위(1초) 정도만 남김
+    assert vad._size <= int(VadConfig().pad_ms / 1000 * RATE) + RATE + 2 * vad.frame_size
+
+
+@pytest.mark.parametrize("empty", [np.zeros(0, dtype=np.float32)])
+def test_empty_feed(empty):
+    assert make_vad().feed(empty) == []
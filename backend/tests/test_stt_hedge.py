@@ -0,0 +1,119 @@
+"""
+STT 헤지 요청 (대기 시간 계산, 백업 제공자 승리/패배) 테스트
+"""
+import asyncio
+
+import pytest
+
+from app.services import stt as stt_module
+from app.services.provider_router import ProviderRouter
+from app.services.stt import STTService
+from app.utils.hedge import HedgeBudget
+from app.utils.stats import RollingWindow
+
+PROVIDERS = ["upstage", "openai"]
+
+
+@pytest.fixture
+def hedge_settings(monkeypatch):
+    settings = stt_module.settings
+    monkeypatch.setattr(settings, "STT_HEDGE_ENABLED", True)
+    monkeypatch.setattr(settings, "STT_HEDGE_MIN_SAMPLES", 5)
+    monkeypatch.setattr(settings, "STT_HEDGE_DEFAULT_DELAY_MS", 50.0)
+    monkeypatch.setattr(settings, "STT_HEDGE_MIN_DELAY_MS", 20.0)
+    return settings
+
+
+def make_service(latency, budget: int = 10) -> STTService:
+    """제공자별 (지연 초, 결과)로 응답하는 가짜 STT 서비스"""
+    service = STTService()
+    service.router = ProviderRouter("stt", list(PROVIDERS))
+    service.success_latency = {name: RollingWindow(256) for name in PROVIDERS}
+    service.hedge_budget = HedgeBudget(budget)
+    service.calls = []
+    service.cancelled = []
+
+    async def call_provider(provider, audio_bytes, language, filename):
+        service.calls.append(provider)
+        delay, text = latency[provider]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            service.cancelled.append(provider)
+            raise
+        if text is None:
+            raise RuntimeError(f"{provider} 오류")
+        return text, 0.9
+
+    service._call_provider = call_provider
+    return service
+
+
+def test_hedge_delay_uses_default_until_enough_samples(hedge_settings):
+    service = make_service({})
+    for _ in range(4):
+        service.success_latency["upstage"].add(0.3)
+    assert service._hedge_delay("upstage") == pytest.approx(0.05)
+
+    service.success_latency["upstage"].add(0.3)
+    assert service._hedge_delay("upstage") == pytest.approx(0.3)
+
+
+def test_hedge_delay_has_floor(hedge_settings):
+    service = make_service({})
+    for _ in range(10):
+        service.success_latency["upstage"].add(0.001)
+    assert service._hedge_delay("upstage") == pytest.approx(0.02)
+
+
+def test_hedge_delay_tracks_p95(hedge_settings):
+    service = make_service({})
+    for i in range(100):
+        service.success_latency["upstage"].add(0.1 if i < 90 else 1.0)
+    assert 0.1 < service._hedge_delay("upstage") <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged(hedge_settings):
+    service = make_service({"upstage": (0.0, "안녕하세요"), "openai": (0.0, "백업")})
+    assert await service.transcribe(b"audio", preprocess=False) == ("안녕하세요", 0.9)
+    assert service.calls == ["upstage"]
+    assert service.hedged == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_backup_wins(hedge_settings):
+    service = make_service({"upstage": (1.0, "느림"), "openai": (0.0, "백업")})
+    assert await service.transcribe(b"audio", preprocess=False) == ("백업", 0.9)
+    await asyncio.sleep(0)  # 진 쪽 취소 처리
+    assert service.calls == ["upstage", "openai"]
+    assert service.hedged == 1 and service.hedge_wins == 1
+    # 헤지에 져서 취소된 호출은 실패로 세지 않고 경과 시간만 지연 기록에 남김
+    assert service.cancelled == ["upstage"]
+    assert service.router.breakers["upstage"].stats()["requests"] == 0
+    assert len(service.success_latency["upstage"]) == 1
+    assert service.success_latency["upstage"].percentile(95) >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_primary_can_still_win_after_hedge(hedge_settings):
+    service = make_service({"upstage": (0.08, "원래"), "openai": (1.0, "백업")})
+    assert await service.transcribe(b"audio", preprocess=False) == ("원래", 0.9)
+    await asyncio.sleep(0)
+    assert service.hedged == 1 and service.primary_wins == 1
+    assert service.cancelled == ["openai"]
+
+
+@pytest.mark.asyncio
+async def test_failed_backup_falls_back_to_primary(hedge_settings):
+    service = make_service({"upstage": (0.1, "원래"), "openai": (0.0, None)})
+    assert await service.transcribe(b"audio", preprocess=False) == ("원래", 0.9)
+    assert service.router.breakers["openai"].stats()["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_when_budget_spent(hedge_settings):
+    service = make_service({"upstage": (0.1, "원래"), "openai": (0.0, "백업")}, budget=0)
+    assert await service.transcribe(b"audio", preprocess=False) == ("원래", 0.9)
+    assert service.calls == ["upstage"]
+    assert service.hedged == 0 and service.hedge_no_backup == 1